@@ -0,0 +1,153 @@
+"""
+src/background_patterns.py
+Procedural background textures computed as whole point sets
+"""
+
+import math
+import random
+
+try:
+    import numpy as np
+except ImportError:  # The pure Python path draws the same kind of texture,
+    np = None  # more slowly and from a different random stream
+
+# Texture styles and their parameters, in points
+PATTERN_STYLES = {
+    # Jittered grid of small dots
+    "dots": {"spacing": 15, "jitter": 1.5, "radius": 0.8},
+    # Diagonal hairlines
+    "hatch": {"spacing": 12, "line_width": 0.5},
+    # Random dots, denser towards the page edges
+    "stipple": {"spacing": 9, "radius": 0.6, "min_density": 0.15},
+}
+
+
+def make_texture(style, x, y, width, height, seed=None):
+    """
+    Compute a background texture covering the rectangle x, y, width, height.
+
+    Returns {"style", "circles": [(x, y), ...], "radius"} for dot styles or
+    {"style", "lines": [(x0, y0, x1, y1), ...], "line_width"} for hatching.
+    Whole point sets are computed as arrays when NumPy is installed, so
+    poster sizes with tens of thousands of points stay fast.
+    """
+    if style not in PATTERN_STYLES:
+        raise ValueError(
+            f"Unknown pattern style {style!r}; choose from {', '.join(PATTERN_STYLES)}"
+        )
+    params = PATTERN_STYLES[style]
+    compute = _VECTOR_STYLES[style] if np is not None else _PYTHON_STYLES[style]
+    coordinates = compute(width, height, params, seed)
+
+    if style == "hatch":
+        texture = {"style": style, "line_width": params["line_width"]}
+        offsets = (x, y, x, y)
+        key = "lines"
+    else:
+        texture = {"style": style, "radius": params["radius"]}
+        offsets = (x, y)
+        key = "circles"
+
+    if np is not None:
+        coordinates = coordinates + np.array(offsets)
+        texture[key] = [tuple(row) for row in coordinates.tolist()]
+    else:
+        texture[key] = [
+            tuple(value + offset for value, offset in zip(row, offsets))
+            for row in coordinates
+        ]
+    return texture
+
+
+def _dots_vector(width, height, params, seed):
+    """Jittered grid, column by column, dropping dots jittered off the page."""
+    spacing, jitter = params["spacing"], params["jitter"]
+    rng = np.random.default_rng(seed)
+    columns = np.arange(int(width / spacing) + 1, dtype=float) * spacing
+    rows = np.arange(int(height / spacing) + 1, dtype=float) * spacing
+    grid_x, grid_y = np.meshgrid(columns, rows, indexing="ij")
+    points = np.column_stack((grid_x.ravel(), grid_y.ravel()))
+    points += rng.uniform(-jitter, jitter, points.shape)
+    inside = (points >= 0).all(axis=1) & (points[:, 0] <= width) & (points[:, 1] <= height)
+    return points[inside]
+
+
+def _dots_python(width, height, params, seed):
+    """Pure Python version of _dots_vector."""
+    spacing, jitter = params["spacing"], params["jitter"]
+    rng = random.Random(seed)
+    points = []
+    for i in range(int(width / spacing) + 1):
+        for j in range(int(height / spacing) + 1):
+            point_x = i * spacing + rng.uniform(-jitter, jitter)
+            point_y = j * spacing + rng.uniform(-jitter, jitter)
+            if 0 <= point_x <= width and 0 <= point_y <= height:
+                points.append((point_x, point_y))
+    return points
+
+
+def _hatch_bounds(width, height, spacing):
+    """Get the offsets c of the 45-degree lines y = x - c crossing the rectangle."""
+    first = -math.floor(height / spacing) * spacing
+    return first, int((width - first) / spacing) + 1
+
+
+def _hatch_vector(width, height, params, seed):
+    """Diagonal lines y = x - c, clipped to the rectangle."""
+    first, count = _hatch_bounds(width, height, params["spacing"])
+    offsets = first + np.arange(count) * params["spacing"]
+    start_x = np.maximum(offsets, 0)
+    end_x = np.minimum(width, height + offsets)
+    keep = end_x > start_x
+    offsets, start_x, end_x = offsets[keep], start_x[keep], end_x[keep]
+    return np.column_stack((start_x, start_x - offsets, end_x, end_x - offsets))
+
+
+def _hatch_python(width, height, params, seed):
+    """Pure Python version of _hatch_vector."""
+    first, count = _hatch_bounds(width, height, params["spacing"])
+    lines = []
+    for i in range(count):
+        offset = first + i * params["spacing"]
+        start_x = max(offset, 0)
+        end_x = min(width, height + offset)
+        if end_x > start_x:
+            lines.append((start_x, start_x - offset, end_x, end_x - offset))
+    return lines
+
+
+def _stipple_count(width, height, params):
+    """Get the number of candidate stipple dots for the rectangle."""
+    return int(width * height / params["spacing"] ** 2)
+
+
+def _stipple_vector(width, height, params, seed):
+    """Uniform candidates kept with a probability that rises towards the edges."""
+    rng = np.random.default_rng(seed)
+    points = rng.uniform((0, 0), (width, height), (_stipple_count(width, height, params), 2))
+    # Normalized distance from the centre: 0 in the middle, 1 in the corners
+    offset = (points - (width / 2, height / 2)) / (width / 2, height / 2)
+    distance = np.hypot(offset[:, 0], offset[:, 1]) / math.sqrt(2)
+    minimum = params["min_density"]
+    density = minimum + (1 - minimum) * distance**2
+    return points[rng.random(len(points)) < density]
+
+
+def _stipple_python(width, height, params, seed):
+    """Pure Python version of _stipple_vector."""
+    rng = random.Random(seed)
+    minimum = params["min_density"]
+    points = []
+    for _ in range(_stipple_count(width, height, params)):
+        point_x = rng.uniform(0, width)
+        point_y = rng.uniform(0, height)
+        distance = math.hypot(
+            (point_x - width / 2) / (width / 2), (point_y - height / 2) / (height / 2)
+        ) / math.sqrt(2)
+        if rng.random() < minimum + (1 - minimum) * distance**2:
+            points.append((point_x, point_y))
+    return points
+
+
+_VECTOR_STYLES = {"dots": _dots_vector, "hatch": _hatch_vector, "stipple": _stipple_vector}
+_PYTHON_STYLES = {"dots": _dots_python, "hatch": _hatch_python, "stipple": _stipple_python}
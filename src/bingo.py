@@ -0,0 +1,165 @@
+"""
+src/bingo.py
+Unique specimen bingo cards and the staff call sheet
+"""
+
+import hashlib
+import random
+
+from reportlab.pdfgen import canvas
+
+from font_manager import FontManager
+from hunt_generator import ScavengerHuntGenerator
+from hunt_layout import PAGE_FORMATS, HuntLayout
+from items import ITEMS
+from multi_format import format_output_file
+from output_profiles import get_output_profile
+from text_metrics import TextMeasurer
+from translations import get_text
+from renderers.background_renderer import BackgroundRenderer
+from renderers.bingo_renderer import BingoRenderer
+from renderers.checkbox_renderer import CheckboxRenderer
+from renderers.corner_renderer import CornerRenderer
+from renderers.header_renderer import HeaderRenderer
+
+
+def card_signature(grid):
+    """Get a hash identifying a card by which specimen is in which cell."""
+    digest = hashlib.blake2b(digest_size=16)
+    for row in grid:
+        for cell in row:
+            if cell is None:
+                digest.update(b"*\n")
+            else:
+                digest.update(f"{cell[0]}\0{cell[1]}\n".encode("utf-8"))
+    return digest.digest()
+
+
+class BingoDealer:
+    """
+    Deals random bingo cards from a pool of (category, item) pairs.
+
+    Every dealt card's grid signature is remembered, and a card matching one
+    already dealt is redrawn, so no two guests get the same card. Specimens
+    are called by name, so a name listed in several categories is pooled
+    once, under its first category, and never appears twice on a card.
+    """
+
+    def __init__(self, items, size=5, seed=None):
+        by_name = {}
+        for category, item in items:
+            by_name.setdefault(item, (category, item))
+        self.items = list(by_name.values())
+        self.size = size
+        self.free_centre = size % 2 == 1
+        self.cell_count = size * size - (1 if self.free_centre else 0)
+        if len(self.items) < self.cell_count:
+            raise ValueError(
+                f"A {size}x{size} card needs {self.cell_count} specimens, "
+                f"but only {len(self.items)} were given"
+            )
+        self.random = random.Random(seed)
+        self.signatures = set()
+
+    def deal(self, count, max_attempts=100):
+        """Deal count unique cards, each a list of rows of (category, item) or None."""
+        cards = []
+        for _ in range(count):
+            for _ in range(max_attempts):
+                grid = self._draw_card()
+                signature = card_signature(grid)
+                if signature not in self.signatures:
+                    self.signatures.add(signature)
+                    cards.append(grid)
+                    break
+            else:
+                raise ValueError(
+                    f"Could not deal {count} unique cards; add specimens to the pool"
+                )
+        return cards
+
+    def _draw_card(self):
+        """Draw one random card, with None in the free centre."""
+        cells = self.random.sample(self.items, self.cell_count)
+        if self.free_centre:
+            cells.insert(len(cells) // 2, None)
+        return [cells[i : i + self.size] for i in range(0, len(cells), self.size)]
+
+
+def render_bingo(
+    count,
+    output_file="specimen_bingo.pdf",
+    items=None,
+    seed=None,
+    page_format="letter",
+    profile=None,
+    language="en",
+    call_sheet_file=None,
+):
+    """
+    Render count unique bingo cards, one per page, plus a call sheet listing
+    every specimen in the card pool for staff to tick off. Returns the two paths.
+    """
+    items = ITEMS if items is None else items
+    profile = get_output_profile(profile)
+    layout = HuntLayout(PAGE_FORMATS[page_format]["margin_x"])
+    dealer = BingoDealer(items, layout.bingo_size, seed)
+    cards = dealer.deal(count)
+
+    FontManager.register_fonts()
+    pagesize = PAGE_FORMATS[page_format]["pagesize"]
+    page_width, page_height = pagesize
+    pdf = canvas.Canvas(
+        output_file, pagesize=pagesize, pageCompression=profile["page_compression"]
+    )
+    measurer = TextMeasurer()
+    background_renderer = BackgroundRenderer(pdf, profile, pattern_cache={})
+    header_renderer = HeaderRenderer(pdf, profile)
+    corner_renderer = CornerRenderer(pdf)
+    checkbox_renderer = CheckboxRenderer(pdf)
+    bingo_renderer = BingoRenderer(pdf, layout, measurer, profile, language)
+
+    title = get_text("title", language)
+    subtitle = get_text("bingo_subtitle", language)
+    instructions = get_text("bingo_instructions", language).format(size=layout.bingo_size)
+    footer_font = FontManager.get_footer_font(profile["fonts"])
+
+    # Every card has the same header, so the grid position is computed once
+    top = HeaderRenderer.measure(instructions, page_width, measurer, profile)
+    grid_size = min(
+        page_width - 2 * layout.margin_x,
+        page_height - top - layout.content_bottom,
+    )
+    cell_size = grid_size / layout.bingo_size
+    grid_x = (page_width - grid_size) / 2
+    grid_y = page_height - top
+
+    for number, grid in enumerate(cards, start=1):
+        background_renderer.draw(0, 0, page_width, page_height)
+        if profile["corners"]:
+            corner_renderer.draw(40, 40, 30, page_width, page_height)
+        header_renderer.draw(title, subtitle, instructions, page_width, page_height)
+        bingo_renderer.draw(grid_x, grid_y, cell_size, grid, checkbox_renderer)
+
+        card_label = get_text("bingo_card", language).format(number=f"{number:04d}")
+        label_width = measurer.string_width(card_label, footer_font, 11)
+        FontManager.draw_string(
+            pdf,
+            (page_width - label_width) / 2, layout.footer_y,
+            card_label, footer_font, 11,
+        )
+        pdf.showPage()
+    pdf.save()
+
+    call_sheet_file = call_sheet_file or format_output_file(output_file, "call_sheet")
+    ScavengerHuntGenerator(
+        call_sheet_file,
+        items=dealer.items,
+        subtitle=get_text("call_sheet_subtitle", language),
+        instructions=get_text("call_sheet_instructions", language),
+        page_format=page_format,
+        measurer=measurer,
+        profile=profile,
+        language=language,
+    ).generate_hunt_pdf()
+    return output_file, call_sheet_file
@@ -0,0 +1,36 @@
+"""
+src/catalog.py
+Catalog loading for built-in and CSV specimen lists
+"""
+
+import csv
+
+from items import ITEMS
+
+
+def load_catalog(path=None, with_location=False):
+    """
+    Load the specimen catalog as (category, item) pairs.
+
+    path is a CSV file with category and item columns and an optional
+    location column (for multi-location catalogs); the built-in ITEMS are
+    used when it is None. With with_location, rows are (category, item,
+    location) triples, with an empty location where none is given.
+    """
+    if path is None:
+        rows = [(category, item, "") for category, item in ITEMS]
+    else:
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = [
+                (
+                    row["category"].strip(),
+                    row["item"].strip(),
+                    (row.get("location") or "").strip(),
+                )
+                for row in csv.DictReader(f)
+                if row.get("item")
+            ]
+
+    if with_location:
+        return rows
+    return [(category, item) for category, item, _ in rows]
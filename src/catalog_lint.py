@@ -0,0 +1,242 @@
+"""
+src/catalog_lint.py
+Fuzzy catalog index for duplicate, typo and overflow detection
+"""
+
+import math
+import re
+from collections import Counter, defaultdict
+
+from font_manager import FontManager
+from hunt_layout import PAGE_FORMATS, HuntLayout
+from text_metrics import TextMeasurer
+from translations import TRANSLATIONS, translate_item
+
+# Correctly spelled natural history words. These are never reported, and
+# rare catalog words one edit away from one are ("Faun" -> "fawn"), so
+# typos are caught even when the right spelling is not in the catalog yet
+SPECIMEN_WORDS = frozenset(
+    """
+    agate amber ammonite amethyst antler antlers arrowhead arrowheads bark
+    beak beaver bee beetle beetles bird birds blue bobcat bone bones bottle
+    bowl brooch burmese butter butterfly butterflies calcite chameleon chick
+    chinese chipmunk claw claws clam clamshell clay cobra cockroach conch cone
+    cones coral coyote crab crystal crystals deer desert dinosaur dog dragon
+    dragonfly driftwood duckling egg eggs fang fangs fawn feather feathers
+    fishbone foot fossil fossils fox fur geode giraffe goose head hide hides
+    hip hissing honey hoof horn horns horseshoe hourglass iguana jaw jewel
+    labradorite leaf leaves macaw madagascar moose moss moth moths mummified
+    nest obsidian okra opossum owl paw paws pelt pine pinecone pinecones pod
+    pods purple pyrite python quartz quill quills rabbit raccoon red rose
+    scale scales scorpion seed seeds selenite shark shed shell shells silver
+    skin skull snake snakeskin spectralite spider sugar tail tails teeth
+    tooth tree turtle tusk vertebra vertebrae wasp water weasel wing wings
+    woodboring wulfenite yellow
+    """.split()
+)
+
+
+def normalize(name):
+    """Normalize a name for comparison: lowercase words separated by single spaces."""
+    return " ".join(re.findall(r"[a-z0-9]+", name.lower()))
+
+
+def ngrams(text, n=3):
+    """Get the set of character n-grams of a normalized name, padded at both ends."""
+    padded = f" {text} "
+    return {padded[i : i + n] for i in range(len(padded) - n + 1)}
+
+
+class CatalogIndex:
+    """
+    Character trigram index over a catalog's distinct names.
+
+    Near-duplicate search uses prefix filtering: each name's trigrams are
+    ordered rarest first, and only the first few (enough that any pair above
+    the similarity threshold must share one) are indexed and probed. Common
+    trigrams such as " sh" are never used to generate candidates, so large
+    catalogs avoid the all-pairs comparison.
+    """
+
+    def __init__(self, rows):
+        # rows are (category, item, location) triples
+        self.rows = rows
+        self.names = defaultdict(list)  # normalized name -> row indices
+        for row_id, (_, item, _) in enumerate(rows):
+            self.names[normalize(item)].append(row_id)
+
+        self.grams = {name: ngrams(name) for name in self.names}
+        self.frequency = Counter(gram for grams in self.grams.values() for gram in grams)
+
+    def exact_duplicates(self):
+        """Get names listed more than once as (name, [rows]) entries."""
+        return [
+            (self.rows[ids[0]][1], [self.rows[i] for i in ids])
+            for ids in self.names.values()
+            if len(ids) > 1
+        ]
+
+    def near_duplicates(self, threshold=0.6, same_location=True):
+        """
+        Get pairs of distinct names whose trigram Jaccard similarity is at
+        least threshold, as (score, name_a, name_b) sorted most similar first.
+        With same_location, pairs are only reported if both names occur in
+        one location.
+        """
+        # Encode trigrams as ranks, rarest first, and names as sorted rank lists
+        ranked = sorted(self.frequency, key=lambda gram: (self.frequency[gram], gram))
+        rank = {gram: r for r, gram in enumerate(ranked)}
+        names = sorted(self.grams, key=lambda name: (len(self.grams[name]), name))
+        tokens = [sorted(rank[gram] for gram in self.grams[name]) for name in names]
+        token_sets = [set(name_tokens) for name_tokens in tokens]
+        sizes = [len(name_tokens) for name_tokens in tokens]
+
+        # Postings hold (name id, position); names arrive shortest first, so
+        # entries too short for the current probe can be skipped for good
+        index = defaultdict(list)
+        starts = defaultdict(int)
+        pairs = []
+        ratio = threshold / (1 + threshold)
+
+        for x, x_tokens in enumerate(tokens):
+            size = sizes[x]
+            min_size = threshold * size
+            prefix_size = size - math.ceil(threshold * size) + 1
+            # Later names are never shorter, so indexing a shorter prefix suffices
+            index_size = size - math.ceil(2 * ratio * size - 1e-9) + 1
+
+            overlaps = {}
+            for i, token in enumerate(x_tokens[:prefix_size]):
+                postings = index[token]
+                start = starts[token]
+                while start < len(postings) and sizes[postings[start][0]] < min_size:
+                    start += 1
+                starts[token] = start
+
+                x_rest = size - i
+                for y, j in postings[start:]:
+                    count = overlaps.get(y, 0)
+                    if count < 0:
+                        continue
+                    # Positional filter: can the rest of both names still overlap
+                    # enough to reach the threshold?
+                    other_size = sizes[y]
+                    rest = x_rest if x_rest < other_size - j else other_size - j
+                    if count + rest >= ratio * (size + other_size) - 1e-9:
+                        overlaps[y] = count + 1
+                    else:
+                        overlaps[y] = -1
+
+                if i < index_size:
+                    postings.append((x, i))
+
+            for y, count in overlaps.items():
+                if count <= 0:
+                    continue
+                shared = len(token_sets[x] & token_sets[y])
+                score = shared / (size + sizes[y] - shared)
+                if score >= threshold and (
+                    not same_location or self._share_location(names[x], names[y])
+                ):
+                    pairs.append(
+                        (
+                            score,
+                            self.rows[self.names[names[y]][0]][1],
+                            self.rows[self.names[names[x]][0]][1],
+                        )
+                    )
+
+        pairs.sort(key=lambda pair: (-pair[0], pair[1], pair[2]))
+        return pairs
+
+    def suspicious_words(self, rare_count=1, min_length=4, vocabulary=SPECIMEN_WORDS):
+        """
+        Find likely misspellings: rare words not in vocabulary that are one
+        edit away from a vocabulary word or a word used more often elsewhere
+        in the catalog (e.g. "Hyde" next to "Hide").
+        Returns (word, suggestion, name) tuples.
+        """
+        counts = Counter(
+            word
+            for name, ids in self.names.items()
+            for word in name.split()
+            for _ in ids
+        )
+
+        # Index known-good words by their single-deletion variants
+        variants = defaultdict(set)
+        known = set(vocabulary)
+        known.update(word for word, count in counts.items() if count > rare_count)
+        for word in known:
+            for variant in self._deletions(word):
+                variants[variant].add(word)
+
+        findings = []
+        for name, ids in self.names.items():
+            for word in name.split():
+                if word in known or len(word) < min_length or word.isdigit():
+                    continue
+                suggestions = set()
+                for variant in self._deletions(word):
+                    suggestions |= variants.get(variant, set())
+                # Plurals are not typos ("Fox Tails" next to "Raccoon Tail")
+                suggestions = {
+                    other
+                    for other in suggestions
+                    if other != word and word not in (other + "s", other[:-1])
+                }
+                if suggestions:
+                    best = max(suggestions, key=lambda other: (counts[other], other))
+                    findings.append((word, best, self.rows[ids[0]][1]))
+        return findings
+
+    def too_wide(
+        self,
+        page_format="letter",
+        measurer=None,
+        with_thumbnails=False,
+        languages=("en",),
+    ):
+        """
+        Get item names wider than their column, in each language they are
+        drawn in, as (drawn name, language, width, available) tuples.
+        """
+        FontManager.register_fonts()
+        measurer = measurer or TextMeasurer()
+        layout = HuntLayout(PAGE_FORMATS[page_format]["margin_x"])
+        layout.calculate_margins(*PAGE_FORMATS[page_format]["pagesize"])
+
+        available = layout.get_item_text_width(layout.column_width, with_thumbnails)
+        font = FontManager.get_item_font()
+        results = []
+        for language in languages:
+            for ids in self.names.values():
+                label = translate_item(self.rows[ids[0]][1], language)
+                width = measurer.string_width(label, font, layout.item_font_size)
+                if width > available:
+                    results.append((label, language, width, available))
+        return results
+
+    def _share_location(self, name, other):
+        """Check whether two names occur in at least one common location."""
+        locations = {self.rows[i][2] for i in self.names[name]}
+        return any(self.rows[i][2] in locations for i in self.names[other])
+
+    @staticmethod
+    def _deletions(word):
+        """Get a word and every variant of it with one character removed."""
+        return {word} | {word[:i] + word[i + 1 :] for i in range(len(word))}
+
+
+def lint_catalog(rows, threshold=0.6, page_format="letter"):
+    """
+    Run every catalog check and return the findings by check name.
+    Widths are checked for every language, since translations run longer.
+    """
+    index = CatalogIndex(rows)
+    return {
+        "exact_duplicates": index.exact_duplicates(),
+        "near_duplicates": index.near_duplicates(threshold),
+        "suspicious_words": index.suspicious_words(),
+        "too_wide": index.too_wide(page_format, languages=tuple(TRANSLATIONS)),
+    }
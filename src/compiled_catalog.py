@@ -0,0 +1,190 @@
+"""
+src/compiled_catalog.py
+Compact binary catalog, memory-mapped read-only by worker processes
+"""
+
+import itertools
+import mmap
+import struct
+import sys
+import threading
+from collections.abc import Sequence
+
+from hunt_pagination import group_items
+from items import ITEMS
+
+MAGIC = b"TIAC"
+VERSION = 2
+
+# magic, version, byte order (0 little, 1 big), string count, category count,
+# item count
+HEADER = struct.Struct("=4sHHIII")
+
+
+def compile_catalog(path, items=None):
+    """
+    Write a catalog to path as a compiled binary file.
+
+    Layout, after the header, in native byte order:
+      string offsets  uint32 x (strings + 1), into the UTF-8 blob
+      categories      (name string, first item, item count) uint32 triples
+      items           (name string, category index) uint32 pairs
+      blob            UTF-8 text of every string
+    Items are stored grouped by category, in group_items() order.
+    """
+    groups = group_items(ITEMS if items is None else items)
+
+    strings = []
+    string_ids = {}
+
+    def intern(text):
+        """Add text to the string table once and return its index."""
+        if text not in string_ids:
+            string_ids[text] = len(strings)
+            strings.append(text)
+        return string_ids[text]
+
+    category_rows = []
+    item_rows = []
+    for category_index, (category, category_items) in enumerate(groups):
+        category_rows.append((intern(category), len(item_rows), len(category_items)))
+        item_rows.extend((intern(item), category_index) for item in category_items)
+
+    encoded = [text.encode("utf-8") for text in strings]
+    offsets = [0]
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+
+    with open(path, "wb") as f:
+        f.write(
+            HEADER.pack(
+                MAGIC,
+                VERSION,
+                0 if sys.byteorder == "little" else 1,
+                len(strings),
+                len(category_rows),
+                len(item_rows),
+            )
+        )
+        f.write(struct.pack(f"={len(offsets)}I", *offsets))
+        f.write(
+            struct.pack(f"={3 * len(category_rows)}I", *itertools.chain(*category_rows))
+        )
+        f.write(struct.pack(f"={2 * len(item_rows)}I", *itertools.chain(*item_rows)))
+        f.write(b"".join(encoded))
+    return path
+
+
+class CompiledCatalog:
+    """
+    Read-only view of a compiled catalog file.
+
+    The file is memory-mapped, so every process in a pool shares the same
+    page-cache copy; opening it only parses the header. Tables are read in
+    place through typed memoryviews, and strings are decoded on demand.
+    Workers rendering a precomputed page plan only need the item count and
+    the odd lookup, so they read items() in place instead of decoding the
+    whole catalog.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (
+            magic,
+            version,
+            byte_order,
+            string_count,
+            category_count,
+            item_count,
+        ) = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} compiled catalog")
+        if byte_order != (0 if sys.byteorder == "little" else 1):
+            raise ValueError(f"{path} was compiled on a machine with another byte order")
+
+        view = memoryview(self._map)
+        position = HEADER.size
+
+        def table(count, fmt):
+            """Take the next count values of struct format fmt as a memoryview."""
+            nonlocal position
+            end = position + 4 * count
+            values = view[position:end].cast(fmt)
+            position = end
+            return values
+
+        self._offsets = table(string_count + 1, "I")
+        self._categories = table(3 * category_count, "I")
+        self._items = table(2 * item_count, "I")
+        self._blob = view[position:]
+
+        self.item_count = item_count
+
+    def string(self, index):
+        """Decode one string from the string table."""
+        return str(self._blob[self._offsets[index] : self._offsets[index + 1]], "utf-8")
+
+    def groups(self):
+        """Get the catalog as (category, [items]) groups, like group_items()."""
+        groups = []
+        for i in range(0, len(self._categories), 3):
+            name, first, count = self._categories[i : i + 3].tolist()
+            groups.append(
+                (
+                    self.string(name),
+                    [self.string(self._items[2 * j]) for j in range(first, first + count)],
+                )
+            )
+        return groups
+
+    def items(self):
+        """Get the catalog as a sequence of (category, item) pairs read in place."""
+        return CatalogItems(self)
+
+    def item(self, index):
+        """Decode the (category, item) pair at an index."""
+        name, category = self._items[2 * index : 2 * index + 2].tolist()
+        return self.string(self._categories[3 * category]), self.string(name)
+
+
+class CatalogItems(Sequence):
+    """(category, item) pairs of a compiled catalog, decoded only when accessed."""
+
+    def __init__(self, catalog):
+        self._catalog = catalog
+
+    def __len__(self):
+        return self._catalog.item_count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("catalog item index out of range")
+        return self._catalog.item(index)
+
+
+_opened = {}  # path -> CompiledCatalog, one mapping per process
+_opened_lock = threading.Lock()
+
+
+def open_catalog(path):
+    """Open a compiled catalog, mapping each file at most once per process."""
+    with _opened_lock:
+        if path not in _opened:
+            _opened[path] = CompiledCatalog(path)
+        return _opened[path]
+
+
+def catalog_options(options):
+    """Resolve a worker's catalog_file option into generator items read from the catalog."""
+    if "catalog_file" not in options:
+        return options
+    options = dict(options)
+    catalog = open_catalog(options.pop("catalog_file"))
+    options["items"] = catalog.items()
+    return options
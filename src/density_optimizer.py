@@ -0,0 +1,111 @@
+"""
+src/density_optimizer.py
+Searches layout settings for the fewest printed pages
+"""
+
+import itertools
+
+from font_manager import FontManager
+from hunt_generator import DEFAULT_INSTRUCTIONS, plan_pages
+from hunt_layout import PAGE_FORMATS, HuntLayout
+from hunt_pagination import group_items
+from output_profiles import get_output_profile
+from text_metrics import TextMeasurer
+from translations import translate_item
+
+# Search space, most readable value first
+ITEM_FONT_SIZES = (14, 13, 12, 11)  # Smaller than 11 is hard to read at arm's length
+SUB_COLUMNS = (1, 2, 3)
+ITEM_SPACINGS = (4, 3, 2)
+LARGE_ITEM_SPACINGS = (2, 1, 0)
+
+ROW_PADDING = 3  # Row height above the font size, as in the default 14 / 17
+
+
+class DensityOptimizer:
+    """
+    Finds the most readable layout that prints a catalog on the fewest pages.
+
+    Every combination of item font size, row spacing and sub-column count in
+    large categories is paginated, and among those reaching the lowest page
+    count the one earliest in readability order wins. Block heights are
+    memoized per layout and item count by the shared TextMeasurer, and item
+    names are measured once, so each candidate costs only a pagination pass.
+    """
+
+    def __init__(
+        self,
+        page_format="letter",
+        measurer=None,
+        profile=None,
+        language="en",
+        with_thumbnails=False,
+    ):
+        self.page_format = page_format
+        self.measurer = measurer or TextMeasurer()
+        self.profile = get_output_profile(profile)
+        self.language = language
+        self.with_thumbnails = with_thumbnails
+
+    def candidates(self):
+        """Yield candidate layouts, most readable first."""
+        for font_size, sub_columns, item_spacing, large_item_spacing in itertools.product(
+            ITEM_FONT_SIZES, SUB_COLUMNS, ITEM_SPACINGS, LARGE_ITEM_SPACINGS
+        ):
+            # Large categories are never looser than small ones
+            if large_item_spacing > item_spacing:
+                continue
+            layout = HuntLayout(PAGE_FORMATS[self.page_format]["margin_x"])
+            layout.calculate_margins(*PAGE_FORMATS[self.page_format]["pagesize"])
+            layout.item_font_size = font_size
+            layout.item_height = font_size + ROW_PADDING
+            layout.item_spacing = item_spacing
+            layout.large_item_spacing = large_item_spacing
+            layout.sub_columns = sub_columns
+            yield layout
+
+    def optimize(self, items, instructions=DEFAULT_INSTRUCTIONS):
+        """
+        Find the best layout for items.
+        Returns (layout, pages), where pages is the plan for that layout.
+        """
+        FontManager.register_fonts()
+        groups = group_items(items)
+        widest = self._widest_names(groups)
+
+        best = None
+        for layout in self.candidates():
+            if not self._names_fit(layout, groups, widest):
+                continue
+            pages = plan_pages(
+                groups, self.page_format, instructions, self.measurer, layout,
+                self.profile,
+            )
+            # Strictly fewer pages only; ties keep the more readable layout
+            if best is None or len(pages) < len(best[1]):
+                best = (layout, pages)
+        return best
+
+    def _widest_names(self, groups):
+        """Get each category's widest item name at a font size of 1 point."""
+        font = FontManager.get_item_font(style=self.profile["fonts"])
+        return {
+            category: max(
+                self.measurer.string_width(translate_item(item, self.language), font, 1)
+                for item in items
+            )
+            for category, items in groups
+        }
+
+    def _names_fit(self, layout, groups, widest):
+        """Check that sub-columns leave room for every name in large categories."""
+        if layout.sub_columns == 1:
+            return True
+        available = layout.get_item_text_width(
+            layout.column_width, self.with_thumbnails, layout.sub_columns
+        )
+        return all(
+            widest[category] * layout.item_font_size <= available
+            for category, items in groups
+            if layout.is_large_category(len(items))
+        )
@@ -0,0 +1,297 @@
+"""
+src/dependency_index.py
+Reverse index from catalog entries, categories and layout settings to generated PDFs
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from categories import get_category_colors
+from hunt_generator import ScavengerHuntGenerator
+from hunt_layout import PAGE_FORMATS, HuntLayout
+from items import ITEMS
+from sheet_batch import render_chunk
+
+# Dependency kinds, each keyed by a string and compared by fingerprint
+#   catalog:  ""             the whole catalog (hunts listing every specimen)
+#   category: category name  the category's items (hunts listing all of them)
+#   entry:    category\0item  one catalog entry (present or removed)
+#   palette:  category name  the category's colors
+#   layout:   page format    HuntLayout defaults for the format
+
+
+def _digest(value):
+    """Get a short stable fingerprint of a repr-able value."""
+    return hashlib.sha1(repr(value).encode("utf-8")).hexdigest()[:16]
+
+
+def layout_defaults(page_format):
+    """Get the default HuntLayout settings for a page format."""
+    return vars(HuntLayout(PAGE_FORMATS[page_format]["margin_x"]))
+
+
+class Fingerprints:
+    """Current fingerprints of every dependency key, for one catalog."""
+
+    def __init__(self, catalog):
+        self.catalog = [tuple(entry) for entry in catalog]
+        self.entries = set(self.catalog)
+        self.by_category = {}
+        for category, item in self.catalog:
+            self.by_category.setdefault(category, []).append(item)
+        self._cache = {}
+
+    def get(self, kind, key):
+        """Get the fingerprint of a dependency, computing it at most once."""
+        if (kind, key) not in self._cache:
+            self._cache[kind, key] = self._compute(kind, key)
+        return self._cache[kind, key]
+
+    def _compute(self, kind, key):
+        """Compute the fingerprint of a dependency."""
+        if kind == "catalog":
+            return _digest(self.catalog)
+        if kind == "category":
+            return _digest(self.by_category.get(key, []))
+        if kind == "entry":
+            return "present" if tuple(key.split("\0")) in self.entries else "removed"
+        if kind == "palette":
+            return _digest(sorted(get_category_colors(key).items()))
+        if kind == "layout":
+            return _digest(sorted(layout_defaults(key).items()))
+        raise ValueError(f"Unknown dependency kind {kind!r}")
+
+
+class DependencyIndex:
+    """
+    Persistent record of what every generated PDF was built from.
+
+    Each output is stored with its render spec and one row per dependency,
+    holding the dependency's fingerprint at render time. Dependency rows are
+    indexed by (kind, key, fingerprint), so finding the outputs touched by a
+    catalog change only compares the distinct dependencies against the
+    current catalog and then follows the index back to the outputs.
+    """
+
+    def __init__(self, db_path="hunt_outputs.sqlite3", catalog=None):
+        self.db_path = db_path
+        self.catalog = ITEMS if catalog is None else catalog
+
+        connection = self._connect()
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS outputs "
+                "(path TEXT PRIMARY KEY, spec TEXT NOT NULL, recorded REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS deps (path TEXT NOT NULL, kind TEXT NOT NULL, "
+                "key TEXT NOT NULL, fingerprint TEXT NOT NULL, PRIMARY KEY (path, kind, key))"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS deps_by_key ON deps (kind, key, fingerprint)"
+            )
+        connection.close()
+
+    def record(self, generator, path=None, sheets=None):
+        """
+        Record the spec and dependencies of a PDF a generator has just saved.
+        path is where the PDF ended up if the generator wrote a temporary
+        file first. sheets describes a serialized print run (count,
+        first_serial, variant, serial_db, base_url), which is rebuilt as
+        sheets with the same serials rather than as a single hunt.
+        """
+        path = os.path.abspath(generator.output_file if path is None else path)
+        fingerprints = Fingerprints(self.catalog)
+        items = [tuple(entry) for entry in generator.items]
+        selected = set(items)
+
+        full_catalog = fingerprints.entries <= selected
+        whole_categories = sorted(
+            category
+            for category, catalog_items in fingerprints.by_category.items()
+            if all((category, item) in selected for item in catalog_items)
+        )
+
+        deps = [("layout", generator.page_format)]
+        deps += [("palette", category) for category in sorted({c for c, _ in items})]
+        deps += [
+            ("entry", f"{category}\0{item}")
+            for category, item in items
+            if (category, item) in fingerprints.entries
+        ]
+        if full_catalog:
+            deps.append(("catalog", ""))
+        else:
+            deps += [("category", category) for category in whole_categories]
+
+        # Layout settings changed from the format's defaults, e.g. by --compact
+        defaults = layout_defaults(generator.page_format)
+        layout = {
+            name: value
+            for name, value in vars(generator.layout).items()
+            if name in defaults and defaults[name] != value
+        }
+
+        spec = {
+            "items": items,
+            "catalog_items": sorted(selected & fingerprints.entries),
+            "full_catalog": full_catalog,
+            "whole_categories": whole_categories,
+            "title": generator.title,
+            "subtitle": generator.subtitle,
+            "instructions": generator.instructions,
+            "language": generator.language,
+            "page_format": generator.page_format,
+            "profile": generator.profile,
+            "layout": layout,
+            "image_dir": generator.image_cache.image_dir if generator.image_cache else None,
+            "sheets": sheets,
+        }
+
+        connection = self._connect()
+        with connection:
+            connection.execute("DELETE FROM deps WHERE path = ?", (path,))
+            connection.execute(
+                "INSERT OR REPLACE INTO outputs (path, spec, recorded) VALUES (?, ?, ?)",
+                (path, json.dumps(spec), time.time()),
+            )
+            connection.executemany(
+                "INSERT INTO deps (path, kind, key, fingerprint) VALUES (?, ?, ?, ?)",
+                [
+                    (path, kind, key, fingerprints.get(kind, key))
+                    for kind, key in dict.fromkeys(deps)
+                ],
+            )
+        connection.close()
+
+    def affected(self):
+        """Get the outputs whose dependencies differ from the current catalog and layout."""
+        fingerprints = Fingerprints(self.catalog)
+        connection = self._connect()
+        stale = [
+            (kind, key, fingerprint)
+            for kind, key, fingerprint in connection.execute(
+                "SELECT DISTINCT kind, key, fingerprint FROM deps"
+            )
+            if fingerprints.get(kind, key) != fingerprint
+        ]
+        paths = set()
+        for dep in stale:
+            paths.update(
+                path
+                for (path,) in connection.execute(
+                    "SELECT path FROM deps WHERE kind = ? AND key = ? AND fingerprint = ?",
+                    dep,
+                )
+            )
+        connection.close()
+        return sorted(paths)
+
+    def rebuild_affected(self, max_workers=None):
+        """Re-render every affected output in parallel. Returns the rebuilt paths."""
+        paths = self.affected()
+        if not paths:
+            return []
+
+        connection = self._connect()
+        specs = {
+            path: json.loads(
+                connection.execute(
+                    "SELECT spec FROM outputs WHERE path = ?", (path,)
+                ).fetchone()[0]
+            )
+            for path in paths
+        }
+        connection.close()
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _rebuild_output,
+                    path,
+                    specs[path],
+                    self.resolve_items(specs[path]),
+                    self.db_path,
+                    self.catalog,
+                )
+                for path in paths
+            ]
+            return [future.result() for future in futures]
+
+    def resolve_items(self, spec):
+        """
+        Get a recorded output's items against the current catalog: removed
+        entries are dropped, and whole categories (or the whole catalog)
+        pick up entries added since.
+        """
+        catalog = [tuple(entry) for entry in self.catalog]
+        if spec["full_catalog"]:
+            return catalog
+
+        present = set(catalog)
+        was_in_catalog = {tuple(entry) for entry in spec["catalog_items"]}
+        whole = set(spec["whole_categories"])
+        expanded = set()
+        items = []
+        for category, item in (tuple(entry) for entry in spec["items"]):
+            if category in whole:
+                if category not in expanded:
+                    expanded.add(category)
+                    items += [entry for entry in catalog if entry[0] == category]
+            elif (category, item) in present or (category, item) not in was_in_catalog:
+                items.append((category, item))
+        return items
+
+    def _connect(self):
+        """Open a connection that waits for, rather than fails on, other writers."""
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        connection.execute("PRAGMA journal_mode=WAL")
+        return connection
+
+
+def _rebuild_output(path, spec, items, db_path, catalog):
+    """Re-render one recorded output and record it again (runs in a worker)."""
+    index = DependencyIndex(db_path, catalog)
+    sheets = spec.get("sheets")
+    if sheets:
+        render_chunk(
+            path,
+            sheets["count"],
+            None,
+            sheets["variant"],
+            sheets["serial_db"],
+            sheets["base_url"],
+            {
+                "items": items,
+                "image_dir": spec["image_dir"],
+                "page_format": spec["page_format"],
+                "profile": spec["profile"],
+            },
+            sheets["first_serial"],
+            index,
+        )
+        return path
+
+    layout = HuntLayout(PAGE_FORMATS[spec["page_format"]]["margin_x"])
+    for name, value in spec["layout"].items():
+        setattr(layout, name, value)
+
+    generator = ScavengerHuntGenerator(
+        path,
+        image_dir=spec["image_dir"],
+        items=items,
+        title=spec["title"],
+        subtitle=spec["subtitle"],
+        instructions=spec["instructions"],
+        page_format=spec["page_format"],
+        profile=spec["profile"],
+        language=spec["language"],
+        layout=layout,
+        dependency_index=index,
+    )
+    generator.generate_hunt_pdf()
+    return path
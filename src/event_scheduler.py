@@ -0,0 +1,264 @@
+"""
+src/event_scheduler.py
+Pre-renders upcoming event hunts into a content-addressed cache
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from hunt_generator import (
+    DEFAULT_INSTRUCTIONS,
+    DEFAULT_SUBTITLE,
+    DEFAULT_TITLE,
+    ScavengerHuntGenerator,
+)
+from items import ITEMS
+
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Seconds before a leftover temporary render counts as abandoned and is
+# evicted; younger ones may still be written by another process
+TMP_GRACE = 3600
+
+
+def source_fingerprint():
+    """Hash the generator sources so code, catalog or palette edits miss the cache."""
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(SOURCE_DIR):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        for name in sorted(files):
+            if name.endswith(".py"):
+                with open(os.path.join(root, name), "rb") as f:
+                    digest.update(name.encode() + b"\0" + f.read())
+    return digest.hexdigest()
+
+
+def render_spec(spec, output_file):
+    """Render one hunt spec to output_file, replacing it atomically."""
+    tmp_file = f"{output_file}.{os.getpid()}.tmp"
+    generator = ScavengerHuntGenerator(
+        tmp_file,
+        items=[tuple(entry) for entry in spec["items"]],
+        title=spec["title"],
+        subtitle=spec["subtitle"],
+        instructions=spec["instructions"],
+    )
+    generator.generate_hunt_pdf()
+    os.replace(tmp_file, output_file)
+    return output_file
+
+
+class EventScheduler:
+    """
+    Reads an event calendar and keeps the next few days of event hunts
+    rendered in a warm cache, so morning-of requests are a file lookup.
+
+    The calendar is a JSON file with a list of events:
+
+        {"events": [{
+            "name": "Fossil Week",
+            "start": "2026-11-02", "end": "2026-11-08",
+            "title": "The Insect Asylum Collection",
+            "subtitle": "Fossil Week Hunt",
+            "categories": ["Minerals & Fossils"],
+            "items": ["Shark Jaw"],
+            "featured": ["Dinosaur Fossil", "Red Ammonite", "Moose Tooth"],
+            "featured_count": 1,
+            "rotate": "daily"
+        }]}
+
+    categories and items select the base checklist (the full catalog when
+    neither is given). featured_count specimens from featured are added on
+    top, rotating every day or every week.
+    """
+
+    def __init__(self, calendar_file, cache_dir=".hunt_cache", items=ITEMS):
+        self.calendar_file = calendar_file
+        self.cache_dir = cache_dir
+        self.objects_dir = os.path.join(cache_dir, "objects")
+        self.index_file = os.path.join(cache_dir, "index.json")
+        self.items = items
+
+        with open(calendar_file, encoding="utf-8") as f:
+            self.events = json.load(f)["events"]
+
+    @staticmethod
+    def slugify(name):
+        """Convert an event name to the key used in the cache index."""
+        return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+    def events_on(self, day):
+        """Get the events running on a given date."""
+        return [
+            event
+            for event in self.events
+            if datetime.date.fromisoformat(event["start"])
+            <= day
+            <= datetime.date.fromisoformat(event.get("end", event["start"]))
+        ]
+
+    def build_spec(self, event, day):
+        """Resolve an event's item selection and text for one day."""
+        categories = set(event.get("categories", []))
+        names = set(event.get("items", []))
+        if not categories and not names:
+            selected = list(self.items)
+        else:
+            selected = [
+                (category, item)
+                for category, item in self.items
+                if category in categories or item in names
+            ]
+
+        featured = event.get("featured", [])
+        count = min(event.get("featured_count", 0), len(featured))
+        if count:
+            start = datetime.date.fromisoformat(event["start"])
+            period = (day - start).days
+            if event.get("rotate", "daily") == "weekly":
+                period //= 7
+            offset = (period * count) % len(featured)
+            todays = {featured[(offset + i) % len(featured)] for i in range(count)}
+            selected += [
+                (category, item)
+                for category, item in self.items
+                if item in todays and (category, item) not in selected
+            ]
+
+        return {
+            "items": [list(entry) for entry in selected],
+            "title": event.get("title", DEFAULT_TITLE),
+            "subtitle": event.get("subtitle", DEFAULT_SUBTITLE),
+            "instructions": event.get("instructions", DEFAULT_INSTRUCTIONS),
+        }
+
+    def cache_key(self, spec, fingerprint):
+        """Content address of a rendered spec."""
+        payload = json.dumps(spec, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256((fingerprint + payload).encode("utf-8")).hexdigest()
+
+    def lookup(self, day, event_name=None):
+        """Get the cached PDFs for a date as {event slug: path}."""
+        index = self._load_index()
+        prefix = f"{day.isoformat()}/"
+        results = {}
+        for entry, key in index.items():
+            slug = entry[len(prefix):]
+            if entry.startswith(prefix) and (
+                event_name is None or slug == self.slugify(event_name)
+            ):
+                path = os.path.join(self.objects_dir, f"{key}.pdf")
+                if os.path.exists(path):
+                    results[slug] = path
+        return results
+
+    def serve(self, day, event_name=None):
+        """
+        Get the PDFs for a date as {event slug: path}, like lookup(), but
+        render any of the day's event hunts the cache lacks into it first.
+        """
+        results = self.lookup(day, event_name)
+        fingerprint = None
+        for event in self.events_on(day):
+            slug = self.slugify(event["name"])
+            if slug in results or (
+                event_name is not None and slug != self.slugify(event_name)
+            ):
+                continue
+            fingerprint = fingerprint or source_fingerprint()
+            spec = self.build_spec(event, day)
+            path = os.path.join(self.objects_dir, f"{self.cache_key(spec, fingerprint)}.pdf")
+            if not os.path.exists(path):
+                os.makedirs(self.objects_dir, exist_ok=True)
+                render_spec(spec, path)
+            results[slug] = path
+        return results
+
+    def prerender(self, days=7, max_workers=2, start=None):
+        """
+        Render every event hunt for the next `days` days that is not already
+        cached, with at most max_workers renders at once, then evict stale
+        entries. Returns the number of PDFs rendered.
+        """
+        start = start or datetime.date.today()
+        fingerprint = source_fingerprint()
+        os.makedirs(self.objects_dir, exist_ok=True)
+
+        index = {}
+        pending = {}
+        for offset in range(days):
+            day = start + datetime.timedelta(days=offset)
+            for event in self.events_on(day):
+                spec = self.build_spec(event, day)
+                key = self.cache_key(spec, fingerprint)
+                index[f"{day.isoformat()}/{self.slugify(event['name'])}"] = key
+
+                path = os.path.join(self.objects_dir, f"{key}.pdf")
+                if not os.path.exists(path):
+                    pending[key] = (spec, path)
+
+        if pending:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(render_spec, spec, path)
+                    for spec, path in pending.values()
+                ]
+                for future in futures:
+                    future.result()
+
+        self._save_index(index)
+        evicted = self.evict(set(index.values()))
+        print(
+            f"🗓️ {len(index)} event hunts scheduled, {len(pending)} rendered, "
+            f"{evicted} stale entries evicted."
+        )
+        return len(pending)
+
+    def evict(self, live_keys):
+        """
+        Delete cached PDFs that no scheduled hunt refers to any more, and
+        temporary renders abandoned for longer than TMP_GRACE.
+        """
+        evicted = 0
+        for entry in os.scandir(self.objects_dir):
+            if entry.name.endswith(".tmp"):
+                # Possibly another process's render in progress
+                if time.time() - entry.stat().st_mtime < TMP_GRACE:
+                    continue
+            elif entry.name.split(".", 1)[0] in live_keys:
+                continue
+            os.remove(entry.path)
+            evicted += 1
+        return evicted
+
+    def run_off_peak(self, at="02:00", days=7, max_workers=2):
+        """Stay resident and pre-render once a day at the given HH:MM time."""
+        hour, minute = (int(part) for part in at.split(":"))
+        while True:
+            now = datetime.datetime.now()
+            next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            if next_run <= now:
+                next_run += datetime.timedelta(days=1)
+
+            print(f"💤 Next pre-render at {next_run:%Y-%m-%d %H:%M}")
+            time.sleep((next_run - now).total_seconds())
+            self.prerender(days=days, max_workers=max_workers)
+
+    def _load_index(self):
+        """Load the date/event -> cache key index."""
+        if not os.path.exists(self.index_file):
+            return {}
+        with open(self.index_file, encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_index(self, index):
+        """Write the index atomically so readers never see a partial file."""
+        tmp_file = f"{self.index_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+        os.replace(tmp_file, self.index_file)
@@ -2,18 +2,89 @@
 Font management for scavenger hunt
 """
 
+import threading
+
 from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.cidfonts import UnicodeCIDFont
 from reportlab.pdfbase.ttfonts import TTFont
 
+# Font faces for each text role. Output profiles pick a style: "dejavu-minimal"
+# embeds two faces instead of three, "standard" uses the built-in PDF fonts,
+# which are never embedded.
+FONT_STYLES = {
+    "dejavu": {
+        "header": "DejaVuSans-Bold",
+        "title": "DejaVuSans-Bold",
+        "subtitle": "DejaVuSans-Bold",
+        "body": "DejaVuSans",
+        "footer": "DejaVuSans-Oblique",
+        "category": "DejaVuSans-Bold",
+        "item": "DejaVuSans",
+    },
+    "dejavu-minimal": {
+        "header": "DejaVuSans-Bold",
+        "title": "DejaVuSans-Bold",
+        "subtitle": "DejaVuSans-Bold",
+        "body": "DejaVuSans",
+        "footer": "DejaVuSans",
+        "category": "DejaVuSans-Bold",
+        "item": "DejaVuSans",
+    },
+    "standard": {
+        "header": "Helvetica-Bold",
+        "title": "Helvetica-Bold",
+        "subtitle": "Helvetica-Bold",
+        "body": "Helvetica",
+        "footer": "Helvetica-Oblique",
+        "category": "Helvetica-Bold",
+        "item": "Helvetica",
+    },
+}
+
+# TrueType faces tried, in order, for characters the primary font lacks,
+# as (font name, file name, subfont index for .ttc collections)
+FALLBACK_FONTS = [
+    ("DroidSansFallback", "DroidSansFallbackFull.ttf", 0),
+    ("WenQuanYiMicroHei", "wqy-microhei.ttc", 0),
+    ("NotoSansSC", "NotoSansSC-Regular.ttf", 0),
+]
+
+# Last resort for CJK text: a CID font supplied by the PDF reader, not embedded
+CID_FALLBACK_FONT = "STSong-Light"
+CID_FALLBACK_RANGES = [(0x2E80, 0x9FFF), (0xF900, 0xFAFF), (0xFF00, 0xFFEF)]
+
 
 class FontManager:
     """
     Handles font registration and management for the scavenger hunt.
     """
 
+    # Fonts live in reportlab's process-wide registry; the lock makes
+    # registration and the lazily filled caches below safe across threads
+    _lock = threading.RLock()
+    _registered = False
+    _fallbacks = None  # Registered fallback font names, loaded on first need
+    _coverage = {}  # font name -> frozenset of characters it has glyphs for
+    _char_fonts = {}  # (font name, character) -> font used to draw it
+
+    @staticmethod
+    def register_fonts(verbose=True):
+        """
+        Register all required fonts for the scavenger hunt.
+        Fonts are parsed once per process; later calls return immediately.
+        With verbose=False nothing is printed.
+        """
+        if FontManager._registered:
+            return
+        with FontManager._lock:
+            if FontManager._registered:
+                return
+            FontManager._register_dejavu(verbose)
+            FontManager._registered = True
+
     @staticmethod
-    def register_fonts():
-        """Register all required fonts for the scavenger hunt."""
+    def _register_dejavu(verbose):
+        """Register the DejaVu faces, reporting whether they were found."""
         try:
             # Register DejaVu font family
             pdfmetrics.registerFont(TTFont("DejaVuSans", "DejaVuSans.ttf"))
@@ -27,44 +98,152 @@ class FontManager:
             pdfmetrics.registerFont(TTFont("DejaVuSerif", "DejaVuSerif.ttf"))
             pdfmetrics.registerFont(TTFont("DejaVuSerif-Bold", "DejaVuSerif-Bold.ttf"))
 
-            print("✅ Fonts registered successfully.")
+            if verbose:
+                print("✅ Fonts registered successfully.")
         except Exception as e:
-            print(f"⚠️ Warning: Could not register DejaVu fonts ({e})")
-            print("📝 Using standard fonts instead.")
+            if verbose:
+                print(f"⚠️ Warning: Could not register DejaVu fonts ({e})")
+                print("📝 Using standard fonts instead.")
 
     @staticmethod
-    def get_header_font():
+    def get_header_font(style="dejavu"):
         """Get the appropriate font for headers."""
-        return "DejaVuSans-Bold"
+        return FONT_STYLES[style]["header"]
 
     @staticmethod
-    def get_title_font():
+    def get_title_font(style="dejavu"):
         """Get the appropriate font for titles."""
-        return "DejaVuSans-Bold"
+        return FONT_STYLES[style]["title"]
 
     @staticmethod
-    def get_subtitle_font():
+    def get_subtitle_font(style="dejavu"):
         """Get the appropriate font for subtitles."""
-        return "DejaVuSans-Bold"
+        return FONT_STYLES[style]["subtitle"]
 
     @staticmethod
-    def get_body_font():
+    def get_body_font(style="dejavu"):
         """Get the appropriate font for body text."""
-        return "DejaVuSans"
+        return FONT_STYLES[style]["body"]
 
     @staticmethod
-    def get_footer_font():
+    def get_footer_font(style="dejavu"):
         """Get the appropriate font for footer text."""
-        return "DejaVuSans-Oblique"
+        return FONT_STYLES[style]["footer"]
 
     @staticmethod
-    def get_category_font(category=None):
+    def get_category_font(category=None, style="dejavu"):
         """Get the appropriate font for category headers."""
         # This could be expanded to use different fonts for different categories
-        return "DejaVuSans-Bold"
+        return FONT_STYLES[style]["category"]
 
     @staticmethod
-    def get_item_font(category=None):
+    def get_item_font(category=None, style="dejavu"):
         """Get the appropriate font for category items."""
         # This could be expanded to use different fonts for different categories
-        return "DejaVuSans"
+        return FONT_STYLES[style]["item"]
+
+    @staticmethod
+    def get_coverage(font_name):
+        """Get the set of characters a registered font has glyphs for (cached)."""
+        coverage = FontManager._coverage.get(font_name)
+        if coverage is not None:
+            return coverage
+
+        with FontManager._lock:
+            font = pdfmetrics.getFont(font_name)
+            face = getattr(font, "face", None)
+            if hasattr(face, "charToGlyph"):
+                coverage = frozenset(map(chr, face.charToGlyph))
+            elif isinstance(font, UnicodeCIDFont):
+                coverage = frozenset(
+                    chr(code)
+                    for start, end in CID_FALLBACK_RANGES
+                    for code in range(start, end + 1)
+                )
+            else:
+                # Standard PDF fonts cover Latin-1
+                coverage = frozenset(map(chr, range(32, 256)))
+            FontManager._coverage[font_name] = coverage
+        return coverage
+
+    @staticmethod
+    def get_fallback_fonts():
+        """Register the fallback fonts available on this system, once."""
+        if FontManager._fallbacks is not None:
+            return FontManager._fallbacks
+
+        with FontManager._lock:
+            if FontManager._fallbacks is not None:
+                return FontManager._fallbacks
+            fallbacks = []
+            for name, file_name, subfont_index in FALLBACK_FONTS:
+                try:
+                    pdfmetrics.registerFont(
+                        TTFont(name, file_name, subfontIndex=subfont_index)
+                    )
+                    fallbacks.append(name)
+                except Exception:
+                    continue  # Not installed here
+
+            pdfmetrics.registerFont(UnicodeCIDFont(CID_FALLBACK_FONT))
+            fallbacks.append(CID_FALLBACK_FONT)
+            FontManager._fallbacks = fallbacks
+        return FontManager._fallbacks
+
+    @staticmethod
+    def font_for_char(char, font_name):
+        """Get the font to draw a character with, falling back when font_name lacks it."""
+        key = (font_name, char)
+        font = FontManager._char_fonts.get(key)
+        if font is not None:
+            return font
+
+        font = font_name
+        if char not in FontManager.get_coverage(font_name):
+            for fallback in FontManager.get_fallback_fonts():
+                if char in FontManager.get_coverage(fallback):
+                    font = fallback
+                    break
+        with FontManager._lock:
+            FontManager._char_fonts[key] = font
+        return font
+
+    @staticmethod
+    def split_runs(text, font_name):
+        """Split text into (run, font) pieces so every character has a glyph."""
+        # Fast path: the whole string is covered by the primary font
+        if FontManager.get_coverage(font_name).issuperset(text):
+            return [(text, font_name)]
+
+        runs = []
+        for char in text:
+            font = FontManager.font_for_char(char, font_name)
+            if runs and runs[-1][1] == font:
+                runs[-1][0].append(char)
+            else:
+                runs.append(([char], font))
+        return [("".join(chars), font) for chars, font in runs]
+
+    @staticmethod
+    def string_width(text, font_name, font_size):
+        """Measure text as draw_string will draw it, including fallback runs."""
+        return sum(
+            pdfmetrics.stringWidth(run, font, font_size)
+            for run, font in FontManager.split_runs(text, font_name)
+        )
+
+    @staticmethod
+    def draw_string(canvas, x, y, text, font_name, font_size):
+        """Draw text at x, y, switching to fallback fonts for missing glyphs."""
+        runs = FontManager.split_runs(text, font_name)
+        if len(runs) == 1:
+            canvas.setFont(runs[0][1], font_size)
+            canvas.drawString(x, y, text)
+        else:
+            for run, font in runs:
+                canvas.setFont(font, font_size)
+                canvas.drawString(x, y, run)
+                x += pdfmetrics.stringWidth(run, font, font_size)
+
+        # Leave the primary font selected, as a plain drawString would
+        canvas.setFont(font_name, font_size)
@@ -5,10 +5,14 @@ Main generator class for specimen scavenger hunt
 
 import os
 import math
-from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
 from font_manager import FontManager
-from hunt_layout import HuntLayout
+from hunt_layout import PAGE_FORMATS, HuntLayout
+from hunt_pagination import HuntPaginator, group_items
+from image_cache import ImageCache
+from output_profiles import get_output_profile
+from text_metrics import TextMeasurer
+from translations import TRANSLATIONS, get_text
 
 from items import ITEMS
 from renderers.corner_renderer import CornerRenderer
@@ -18,6 +22,30 @@ from renderers.background_renderer import BackgroundRenderer
 from renderers.category_renderer import CategoryRenderer
 from renderers.checkbox_renderer import CheckboxRenderer
 
+DEFAULT_TITLE = get_text("title")
+DEFAULT_SUBTITLE = get_text("subtitle")
+DEFAULT_INSTRUCTIONS = get_text("instructions")
+
+
+def plan_pages(groups, page_format, instructions, measurer, layout=None, profile=None):
+    """
+    Paginate grouped categories for one page format without creating a canvas.
+    Block heights come from the measurer, so formats sharing it reuse them.
+    """
+    # Measuring needs the fonts, and callers may plan before building a generator
+    FontManager.register_fonts()
+    page_width, page_height = PAGE_FORMATS[page_format]["pagesize"]
+    if layout is None:
+        layout = HuntLayout(PAGE_FORMATS[page_format]["margin_x"])
+
+    paginator = HuntPaginator(layout, measurer)
+    return paginator.paginate(
+        groups,
+        page_height,
+        HeaderRenderer.measure(instructions, page_width, measurer, profile),
+        HeaderRenderer.measure_page_header(),
+    )
+
 
 class ScavengerHuntGenerator:
     """
@@ -25,237 +53,230 @@ class ScavengerHuntGenerator:
     Coordinates the layout, rendering, and PDF creation process.
     """
 
-    def __init__(self, output_file="specimen_scavenger_hunt.pdf"):
-        """Initialize the generator with output file and components."""
+    def __init__(
+        self,
+        output_file="specimen_scavenger_hunt.pdf",
+        image_dir=None,
+        items=None,
+        title=None,
+        subtitle=None,
+        instructions=None,
+        page_format="letter",
+        measurer=None,
+        profile=None,
+        pattern_cache=None,
+        language="en",
+        image_cache=None,
+        layout=None,
+        dependency_index=None,
+        seed=None,
+    ):
+        """
+        Initialize the generator with output file and components.
+        When image_dir is given, items with a matching photo get a thumbnail.
+        items is a list of (category, item) pairs and defaults to the full catalog.
+        title, subtitle and instructions default to the language's translations.
+        page_format is a key of PAGE_FORMATS; measurer can be shared between
+        generators so text and blocks are measured once per run.
+        profile is an OUTPUT_PROFILES name or dict ("print" by default).
+        pattern_cache is an optional dict reusing background textures across documents.
+        image_cache is an optional ImageCache shared between generators; it
+        takes the place of image_dir.
+        layout is an optional HuntLayout, e.g. one chosen by DensityOptimizer.
+        dependency_index is an optional DependencyIndex that records what each
+        saved PDF was built from.
+        seed fixes the background pattern's jitter for reproducible output.
+        output_file may also be a file-like object.
+        """
+        if language not in TRANSLATIONS:
+            raise ValueError(
+                f"Unknown language {language!r}; choose from {', '.join(TRANSLATIONS)}"
+            )
+
         self.output_file = output_file
-        self.page_width, self.page_height = letter
+        self.items = ITEMS if items is None else items
+        self.language = language
+        self.title = title or get_text("title", language)
+        self.subtitle = subtitle or get_text("subtitle", language)
+        self.instructions = instructions or get_text("instructions", language)
+        self.page_format = page_format
+        self.pagesize = PAGE_FORMATS[page_format]["pagesize"]
+        self.page_width, self.page_height = self.pagesize
+        self.profile = get_output_profile(profile)
+        self.dependency_index = dependency_index
 
         # Register fonts
         FontManager.register_fonts()
 
         # Create layout
-        self.layout = HuntLayout()
+        self.layout = layout or HuntLayout(PAGE_FORMATS[page_format]["margin_x"])
+        self.measurer = measurer or TextMeasurer()
+
+        # Thumbnails are downscaled once and shared between documents
+        if image_cache is None and image_dir:
+            image_cache = ImageCache(image_dir, dpi=self.layout.thumbnail_dpi)
+        self.image_cache = image_cache
 
         # Create canvas
-        self.canvas = canvas.Canvas(output_file, pagesize=letter)
+        self.canvas = canvas.Canvas(
+            output_file,
+            pagesize=self.pagesize,
+            pageCompression=self.profile["page_compression"],
+        )
 
         # Create renderers
-        self.background_renderer = BackgroundRenderer(self.canvas)
-        self.header_renderer = HeaderRenderer(self.canvas)
-        self.category_renderer = CategoryRenderer(self.canvas, self.layout)
+        self.background_renderer = BackgroundRenderer(
+            self.canvas, self.profile, pattern_cache, seed
+        )
+        self.header_renderer = HeaderRenderer(self.canvas, self.profile)
+        self.category_renderer = CategoryRenderer(
+            self.canvas, self.layout, self.image_cache, self.profile, language
+        )
         self.checkbox_renderer = CheckboxRenderer(self.canvas)
-        self.footer_renderer = FooterRenderer(self.canvas)
+        self.footer_renderer = FooterRenderer(self.canvas, self.profile, language)
         self.corner_renderer = CornerRenderer(self.canvas)
 
-    def generate_hunt_pdf(self):
-        """Generate the complete scavenger hunt PDF."""
-        # Organize categories into balanced pages
-        categorized_items = self._organize_categories()
-
-        # Calculate total pages needed (first page + continuation pages)
-        total_pages = 2  # We'll use exactly 2 pages for now
+    def generate_hunt_pdf(self, pages=None, sheet_code=None):
+        """
+        Generate the complete scavenger hunt PDF.
+        pages is a plan from plan_pages(); it is computed when not given.
+        """
+        self.draw_sheet(pages, sheet_code)
+        self.save()
+
+    def draw_sheet(self, pages=None, sheet_code=None):
+        """
+        Draw one copy of the hunt without saving, so batches can put many
+        sheets in one document. sheet_code is an optional (serial, QR matrix)
+        pair drawn beside the footer.
+        """
+        if pages is None:
+            pages = self.plan_pages()
+        total_pages = len(pages)
 
         # Draw first page
-        self._draw_first_page(categorized_items["page1"])
+        self._draw_first_page(pages[0], total_pages, sheet_code)
 
-        # Draw second page
-        self._draw_continuation_page(categorized_items["page2"], 2, total_pages)
+        # Draw continuation pages
+        for page_num, page in enumerate(pages[1:], start=2):
+            self._draw_continuation_page(page, page_num, total_pages, sheet_code)
 
-        # Save the PDF
+    def save(self):
+        """Save the PDF."""
         self.canvas.save()
-        print(f"✨ Scavenger hunt PDF saved to: {os.path.abspath(self.output_file)}")
+        if isinstance(self.output_file, str):
+            if self.dependency_index is not None:
+                self.dependency_index.record(self)
+            print(f"✨ Scavenger hunt PDF saved to: {os.path.abspath(self.output_file)}")
+
+    def plan_pages(self, groups=None):
+        """
+        Organize categories into pages with balanced columns.
+        groups is the output of group_items() and can be shared between formats.
+        """
+        if groups is None:
+            groups = group_items(self.items)
+
+        return plan_pages(
+            groups,
+            self.page_format,
+            self.instructions,
+            self.measurer,
+            self.layout,
+            self.profile,
+        )
 
-    def _draw_first_page(self, categories):
+    def _draw_first_page(self, categories, total_pages, sheet_code=None):
         """Draw the first page with title, instructions, and initial categories."""
         # Draw background
         self.background_renderer.draw(0, 0, self.page_width, self.page_height)
 
         # Draw decorative corners
-        self.corner_renderer.draw(40, 40, 30, self.page_width, self.page_height)
+        if self.profile["corners"]:
+            self.corner_renderer.draw(40, 40, 30, self.page_width, self.page_height)
 
         # Draw header
         title_y = self.header_renderer.draw(
-            "The Insect Asylum Collection", "Specimen Scavenger Hunt",
-            "Explore our collection and check off each fascinating specimen as you find it!\n"
-            "Items are color-coded by category to help guide your search.",
+            self.title, self.subtitle, self.instructions,
             self.page_width, self.page_height,
         )
 
-        # Calculate margins
-        margin_x, margin_y = self.layout.calculate_margins(
-            self.page_width, self.page_height
-        )
+        self._draw_columns(categories, self.page_height - title_y)
 
-        # Draw categories in two columns
-        left_categories = categories["left_column"]
-        right_categories = categories["right_column"]
-
-        # Draw left column categories
-        current_y = self.page_height - title_y
-        for category, items in left_categories:
-            category_height = self.category_renderer.draw(
-                margin_x,
-                current_y,
-                category,
-                items,
-                self.checkbox_renderer,
-                self.layout.column_width,
-            )
-            current_y -= (
-                category_height + self.layout.category_spacing
-            )  # Add spacing between categories
-
-        # Draw right column categories
-        current_y = self.page_height - title_y
-        for category, items in right_categories:
-            category_height = self.category_renderer.draw(
-                margin_x + self.layout.column_width + self.layout.column_spacing,
-                current_y,
-                category,
-                items,
-                self.checkbox_renderer,
-                self.layout.column_width,
-            )
-            current_y -= (
-                category_height + self.layout.category_spacing
-            )  # Add spacing between categories
+        # Single-page hunts carry the footer on the first page
+        if total_pages == 1:
+            self._draw_footer(sheet_code)
 
         # Add page break
         self.canvas.showPage()
 
-    def _draw_continuation_page(self, categories, page_num, total_pages):
+    def _draw_continuation_page(self, categories, page_num, total_pages, sheet_code=None):
         """Draw a continuation page with remaining categories."""
         # Draw background
         self.background_renderer.draw(0, 0, self.page_width, self.page_height)
 
         # Draw decorative corners
-        self.corner_renderer.draw(40, 40, 30, self.page_width, self.page_height)
+        if self.profile["corners"]:
+            self.corner_renderer.draw(40, 40, 30, self.page_width, self.page_height)
 
         # Draw simplified header
         header_y = self.header_renderer.draw_page_header(
-            "The Insect Asylum Collection",
+            self.title,
             page_num,
             total_pages,
             self.page_width,
             self.page_height,
         )
 
+        self._draw_columns(categories, self.page_height - header_y)
+
+        if page_num == total_pages:
+            self._draw_footer(sheet_code)
+
+        # Add page break
+        self.canvas.showPage()
+
+    def _draw_columns(self, categories, top_y):
+        """Draw a page's categories in two columns starting at top_y."""
         # Calculate margins
         margin_x, margin_y = self.layout.calculate_margins(
             self.page_width, self.page_height
         )
 
-        # Draw categories in two columns
-        left_categories = categories["left_column"]
-        right_categories = categories["right_column"]
-
-        # Draw left column categories
-        current_y = self.page_height - header_y
-        for category, items in left_categories:
-            category_height = self.category_renderer.draw(
-                margin_x,
-                current_y,
-                category,
-                items,
-                self.checkbox_renderer,
-                self.layout.column_width,
-            )
-            current_y -= (
-                category_height + self.layout.category_spacing
-            )  # Add spacing between categories
-
-        # Draw right column categories
-        current_y = self.page_height - header_y
-        for category, items in right_categories:
-            category_height = self.category_renderer.draw(
+        columns = [
+            (margin_x, categories["left_column"]),
+            (
                 margin_x + self.layout.column_width + self.layout.column_spacing,
-                current_y,
-                category,
-                items,
-                self.checkbox_renderer,
-                self.layout.column_width,
-            )
-            current_y -= (
-                category_height + self.layout.category_spacing
-            )  # Add spacing between categories
-
-        # Draw footer with total count
-        total_items = sum(
-            len(items)
-            for _, items in left_categories
-            + right_categories
-            + categories["left_column"]
-            + categories["right_column"]
-        )
+                categories["right_column"],
+            ),
+        ]
+
+        for column_x, column_categories in columns:
+            current_y = top_y
+            for category, items in column_categories:
+                category_height = self.category_renderer.draw(
+                    column_x,
+                    current_y,
+                    category,
+                    items,
+                    self.checkbox_renderer,
+                    self.layout.column_width,
+                )
+                current_y -= (
+                    category_height + self.layout.category_spacing
+                )  # Add spacing between categories
+
+    def _draw_footer(self, sheet_code=None):
+        """Draw the footer with the total count for the whole hunt."""
+        # Matches the catalog size that visitor submissions are recorded against
+        total_items = len(self.items)
 
         self.footer_renderer.draw(
             self.page_width / 2, self.layout.footer_y, total_items
         )
 
-        # Add page break
-        self.canvas.showPage()
-
-    def _organize_categories(self):
-        """Organize categories into multiple pages with balanced columns."""
-        # Group items by category
-        categorized_items = {}
-        for category, item in ITEMS:
-            if category not in categorized_items:
-                categorized_items[category] = []
-            categorized_items[category].append(item)
-
-        # Define which categories go on which page
-        # This is a simplified approach that manually assigns categories to pages
-        # Page 1: Minerals & Fossils, Shells & Marine, Plant Materials, Preserved Specimens
-        # Page 2: Animal Parts, Bones & Skulls, Resin Replicas, Miscellaneous
-
-        page1_categories = [
-            "Minerals & Fossils",
-            "Shells & Marine",
-            "Plant Materials",
-            "Preserved Specimens",
-        ]
-        page2_categories = [
-            "Animal Parts",
-            "Bones & Skulls",
-            "Resin Replicas",
-            "Miscellaneous",
-        ]
-
-        # Sort categories by their order in the lists above
-        page1_data = [
-            (cat, categorized_items[cat])
-            for cat in page1_categories
-            if cat in categorized_items
-        ]
-
-        page2_data = [
-            (cat, categorized_items[cat])
-            for cat in page2_categories
-            if cat in categorized_items
-        ]
-
-        # Create custom balanced columns
-        page1_left = [
-            (page1_categories[0], categorized_items[page1_categories[0]]),
-            (page1_categories[1], categorized_items[page1_categories[1]]),
-        ]
-
-        page1_right = [
-            (page1_categories[2], categorized_items[page1_categories[2]]),
-            (page1_categories[3], categorized_items[page1_categories[3]]),
-        ]
-
-        # Page 2 has Animal Parts (largest) on the left, and the rest on the right
-        page2_left = [(page2_categories[0], categorized_items[page2_categories[0]])]
-
-        page2_right = [
-            (page2_categories[1], categorized_items[page2_categories[1]]),
-            (page2_categories[2], categorized_items[page2_categories[2]]),
-            (page2_categories[3], categorized_items[page2_categories[3]]),
-        ]
-
-        return {
-            "page1": {"left_column": page1_left, "right_column": page1_right},
-            "page2": {"left_column": page2_left, "right_column": page2_right},
-        }
+        if sheet_code is not None:
+            serial, matrix = sheet_code
+            self.footer_renderer.draw_sheet_code(
+                self.page_width, self.layout, serial, matrix
+            )
@@ -2,15 +2,28 @@
 src/hunt_layout.py
 Layout settings for specimen scavenger hunt
 """
+import math
+
+from reportlab.lib.pagesizes import A4, TABLOID, letter
 from reportlab.lib.units import inch
 
+# Page formats that can be emitted in one run, with their side margins
+PAGE_FORMATS = {
+    "letter": {"pagesize": letter, "margin_x": 0.9 * inch},
+    "a4": {"pagesize": A4, "margin_x": 0.8 * inch},
+    "tabloid": {"pagesize": TABLOID, "margin_x": 1.2 * inch},
+}
+
 class HuntLayout:
     """
     Manages layout settings for the scavenger hunt checklist including dimensions,
     spacing, and page arrangement.
     """
     
-    def __init__(self):
+    def __init__(self, margin_x=0.9 * inch):
+        # Default side margins - slightly reduced to give more room
+        self.margin_x = margin_x
+        
         # Two-column layout
         self.columns = 2
         self.column_spacing = 0.4 * inch  # Reduced slightly to give more width to columns
@@ -24,29 +37,52 @@ class HuntLayout:
         
         # Category settings
         self.category_header_height = 28
+        self.category_font_size = 15  # Increased from 14 to make category headers bigger
+        self.item_font_size = 14  # Increased font size from 12 to 14
         self.item_height = 17  # Slightly reduced space between items
         self.item_indent = 15  # Space from column edge to checkbox
         self.checkbox_size = 12
         self.checkbox_text_offset = 20  # Space from checkbox to text
         
+        # Specimen thumbnails (only drawn when an image directory is given)
+        self.thumbnail_size = 16
+        self.thumbnail_gap = 4  # Space from thumbnail to text
+        self.thumbnail_dpi = 300
+        
         # Spacing between categories
         self.category_spacing = 15  # Slightly reduced spacing between categories
         
         # Spacing after headers before first item
         self.header_item_spacing = 12  # Reduced spacing after header
+        self.category_items_spacing = 8  # Space between header bar and first item
+        self.large_category_size = 12  # Categories above this get tighter rows
+        self.item_spacing = 4  # Extra space between item rows
+        self.large_item_spacing = 2  # Extra row space in large categories
+        self.sub_columns = 1  # Side-by-side item columns within large categories
         
         # Footer
         self.footer_y = 0.8 * inch  # Moved footer up slightly to make more room
+        self.content_bottom = self.footer_y + 30  # Columns stop above the footer
         self.social_footer_y = 0.6 * inch
         
+        # Sheet QR code, in the bottom-right corner beside the footer
+        self.qr_size = 0.7 * inch
+        self.qr_margin = 44
+        self.qr_quiet_zone = 4  # Blank modules around the code, per the QR spec
+        
+        # Bingo cards
+        self.bingo_size = 5  # Cells per row and column, with a free centre when odd
+        self.bingo_cell_padding = 4
+        self.bingo_font_sizes = (12, 11, 10, 9, 8, 7)  # The largest that fits is used
+        self.bingo_mark_size = 8  # Checkbox in each cell's corner
+        
         # Corner decorations
         self.corner_margin = 40
         self.corner_size = 30
     
     def calculate_margins(self, page_width, page_height):
         """Calculate page margins to center the content."""
-        # Default side margins - slightly reduced to give more room
-        margin_x = 0.9 * inch
+        margin_x = self.margin_x
         
         # Calculate column width based on page width and margins
         self.column_width = (page_width - (2 * margin_x) - self.column_spacing) / 2
@@ -59,4 +95,50 @@ class HuntLayout:
     
     def get_category_item_y(self, header_y, index):
         """Calculate the y position for a category item."""
-        return header_y - self.header_item_spacing - ((index) * self.item_height)
\ No newline at end of file
+        return header_y - self.header_item_spacing - ((index) * self.item_height)
+    
+    def get_item_height(self, item_count):
+        """Get the row height for items in a category with item_count items."""
+        # Create compact layout for categories with many items
+        if self.is_large_category(item_count):
+            return self.item_height + self.large_item_spacing
+        return self.item_height + self.item_spacing
+    
+    def is_large_category(self, item_count):
+        """Check whether a category is drawn with the compact large-category layout."""
+        return item_count > self.large_category_size
+    
+    def get_sub_columns(self, item_count):
+        """Get how many side-by-side item columns a category is drawn in."""
+        return self.sub_columns if self.is_large_category(item_count) else 1
+    
+    def get_row_count(self, item_count):
+        """Get the number of item rows in a category, after splitting into sub-columns."""
+        return math.ceil(item_count / self.get_sub_columns(item_count))
+    
+    def get_category_height(self, item_count):
+        """Get the total height of a category section, as drawn by CategoryRenderer."""
+        return (
+            self.category_header_height
+            + self.category_items_spacing
+            + self.get_row_count(item_count) * self.get_item_height(item_count)
+        )
+    
+    def get_item_text_width(self, column_width, with_thumbnails=False, sub_columns=1):
+        """Get the width available for an item name within a column."""
+        width = column_width / sub_columns - self.item_indent - self.checkbox_text_offset
+        if with_thumbnails:
+            width -= self.thumbnail_size + self.thumbnail_gap
+        return width
+    
+    def get_block_key(self):
+        """Get the settings that determine category heights, for measurement caches."""
+        return (
+            self.category_header_height,
+            self.category_items_spacing,
+            self.item_height,
+            self.large_category_size,
+            self.item_spacing,
+            self.large_item_spacing,
+            self.sub_columns,
+        )
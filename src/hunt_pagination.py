@@ -0,0 +1,100 @@
+"""
+src/hunt_pagination.py
+Splits grouped categories into pages of balanced columns
+"""
+
+from categories import CATEGORIES
+
+
+def group_items(items):
+    """
+    Group (category, item) pairs by category.
+    Categories follow the palette order, with unknown categories last.
+    """
+    categorized_items = {}
+    for category, item in items:
+        if category not in categorized_items:
+            categorized_items[category] = []
+        categorized_items[category].append(item)
+
+    order = {category: i for i, category in enumerate(CATEGORIES)}
+    return sorted(
+        categorized_items.items(), key=lambda entry: order.get(entry[0], len(order))
+    )
+
+
+class HuntPaginator:
+    """
+    Fills columns top to bottom with category blocks, moving to the next
+    column (and then the next page) when a block does not fit. Categories
+    taller than a whole column are split and continued in the next column.
+    """
+
+    def __init__(self, layout, measurer):
+        self.layout = layout
+        self.measurer = measurer
+
+    def paginate(self, groups, page_height, first_page_top, page_top):
+        """
+        Lay out grouped categories into pages.
+        first_page_top and page_top are the distances from the top of the page
+        to where content starts on the first and continuation pages.
+        Returns a list of {"left_column": [...], "right_column": [...]} pages.
+        """
+        layout = self.layout
+        pages = []
+
+        def new_column():
+            """Start the next column and return its usable height."""
+            if not pages or len(pages[-1]) == layout.columns:
+                pages.append([])
+            pages[-1].append([])
+            top = first_page_top if len(pages) == 1 else page_top
+            return page_height - top - layout.content_bottom
+
+        remaining = new_column()
+        for category, items in groups:
+            items = list(items)
+            while items:
+                column = pages[-1][-1]
+                spacing = layout.category_spacing if column else 0
+                height = self.measurer.category_height(layout, len(items))
+                if spacing + height <= remaining:
+                    column.append((category, items))
+                    remaining -= spacing + height
+                    break
+
+                # Move the whole category on if it fits a fresh column
+                if column and height <= page_height - page_top - layout.content_bottom:
+                    remaining = new_column()
+                    continue
+
+                # Otherwise split it, continuing in the next column
+                count = self._items_that_fit(remaining - spacing, len(items))
+                if count >= 2 or (count >= 1 and not column):
+                    column.append((category, items[:count]))
+                    items = items[count:]
+                elif not column:
+                    raise ValueError(
+                        f"Column is too short for any item of category {category!r}"
+                    )
+                remaining = new_column()
+
+        return [
+            {
+                "left_column": page[0],
+                "right_column": page[1] if len(page) > 1 else [],
+            }
+            for page in pages
+        ]
+
+    def _items_that_fit(self, available, item_count):
+        """Find how many of a category's items fit in the available height."""
+        low, high = 0, item_count
+        while low < high:
+            mid = (low + high + 1) // 2
+            if self.measurer.category_height(self.layout, mid) <= available:
+                low = mid
+            else:
+                high = mid - 1
+        return low
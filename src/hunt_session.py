@@ -0,0 +1,110 @@
+"""
+src/hunt_session.py
+Reusable in-memory rendering session for applications embedding the generator
+"""
+
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from font_manager import FontManager
+from hunt_generator import ScavengerHuntGenerator
+from hunt_layout import HuntLayout
+from image_cache import ImageCache
+from items import ITEMS
+from text_metrics import TextMeasurer
+
+# Keys a render spec may contain; anything missing takes the generator default
+SPEC_KEYS = (
+    "items",
+    "title",
+    "subtitle",
+    "instructions",
+    "language",
+    "page_format",
+    "profile",
+    "seed",
+)
+
+
+class HuntSession:
+    """
+    Long-lived rendering session for apps that produce many hunts.
+
+    Fonts are registered when the session starts. Text measurements, page
+    plans, background patterns and thumbnails are kept between renders, so
+    each document only pays for drawing. Nothing is printed to stdout.
+
+    A session is safe to share between threads: every render has its own
+    canvas, renderers and random generator, and the shared caches lock their
+    writes. render_many() renders a batch on a thread pool in one process.
+
+        session = HuntSession(image_dir="photos")
+        pdf = session.render({"language": "es", "profile": "web"})
+        session.render({"items": items}, output=response_stream)
+    """
+
+    def __init__(self, image_dir=None):
+        FontManager.register_fonts(verbose=False)
+
+        self.measurer = TextMeasurer()
+        self.pattern_cache = {}
+        self.image_cache = (
+            ImageCache(image_dir, dpi=HuntLayout().thumbnail_dpi, verbose=False)
+            if image_dir
+            else None
+        )
+        self._plans = {}  # (items, page format, instructions, fonts) -> page plan
+        self._plans_lock = threading.Lock()
+
+    def render(self, spec=None, output=None):
+        """
+        Render the hunt described by spec, a dict with any of SPEC_KEYS.
+        Returns the PDF as bytes, or writes it to the file-like object output
+        and returns output.
+        """
+        spec = dict(spec or {})
+        unknown = sorted(set(spec) - set(SPEC_KEYS))
+        if unknown:
+            raise ValueError(
+                f"Unknown spec key(s) {', '.join(unknown)}; "
+                f"choose from {', '.join(SPEC_KEYS)}"
+            )
+        spec["items"] = [
+            tuple(entry) for entry in (ITEMS if spec.get("items") is None else spec["items"])
+        ]
+
+        target = io.BytesIO() if output is None else output
+        generator = ScavengerHuntGenerator(
+            target,
+            measurer=self.measurer,
+            pattern_cache=self.pattern_cache,
+            image_cache=self.image_cache,
+            **spec,
+        )
+        generator.draw_sheet(self._plan(generator))
+        generator.canvas.save()
+
+        if output is None:
+            return target.getvalue()
+        return output
+
+    def _plan(self, generator):
+        """Get the page plan for a generator, reusing one from an earlier render."""
+        key = (
+            tuple(generator.items),
+            generator.page_format,
+            generator.instructions,
+            generator.profile["fonts"],
+        )
+        pages = self._plans.get(key)
+        if pages is None:
+            pages = generator.plan_pages()
+            with self._plans_lock:
+                pages = self._plans.setdefault(key, pages)
+        return pages
+
+    def render_many(self, specs, max_workers=4):
+        """Render several specs concurrently on threads; returns their PDF bytes in order."""
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.render, specs))
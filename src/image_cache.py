@@ -0,0 +1,127 @@
+"""
+src/image_cache.py
+Downscaling, deduplicating image cache for specimen thumbnails
+"""
+
+import hashlib
+import os
+import re
+import threading
+
+from reportlab.lib.units import inch
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Thumbnails are optional; the checklist renders without them
+    Image = None
+    ImageOps = None
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+
+class ImageCache:
+    """
+    Finds specimen photos, downsamples each one once to its printed size and
+    keeps the results on disk keyed by source hash and pixel size.
+
+    Thumbnails are content-addressed, so items sharing a photo (or two copies
+    of the same photo) resolve to the same cached file. ReportLab registers
+    file images under a digest of their path, which means each distinct
+    thumbnail is embedded only once per document.
+    """
+
+    def __init__(self, image_dir, cache_dir=".image_cache", dpi=300, verbose=True):
+        self.image_dir = image_dir
+        self.cache_dir = cache_dir
+        self.dpi = dpi
+        self.verbose = verbose
+
+        self._sources = None  # slug -> source photo path
+        self._hashes = {}  # (path, mtime, size) -> content digest
+        self._thumbnails = {}  # (digest, width px, height px) -> cached path
+        self._warned = False
+        # Renders on several threads may share one cache
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def slugify(name):
+        """Convert an item name to the file name used for its photo."""
+        return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+
+    def find_source(self, item):
+        """Return the source photo for an item, or None if there is none."""
+        if self._sources is None:
+            with self._lock:
+                if self._sources is None:
+                    sources = {}
+                    if os.path.isdir(self.image_dir):
+                        for entry in os.scandir(self.image_dir):
+                            stem, ext = os.path.splitext(entry.name)
+                            if entry.is_file() and ext.lower() in IMAGE_EXTENSIONS:
+                                sources.setdefault(self.slugify(stem), entry.path)
+                    self._sources = sources
+
+        return self._sources.get(self.slugify(item))
+
+    def get_thumbnail(self, item, width, height):
+        """
+        Get the path of a thumbnail for an item sized to width x height points.
+        Returns None when the item has no photo or Pillow is unavailable.
+        """
+        source = self.find_source(item)
+        if source is None:
+            return None
+
+        if Image is None:
+            if self.verbose and not self._warned:
+                print("⚠️ Warning: Pillow is not installed, skipping thumbnails.")
+                self._warned = True
+            return None
+
+        pixel_size = (
+            max(1, round(width / inch * self.dpi)),
+            max(1, round(height / inch * self.dpi)),
+        )
+        key = (self._source_hash(source),) + pixel_size
+        cache_path = self._thumbnails.get(key)
+        if cache_path is not None:
+            return cache_path
+
+        # Downscale under the lock so threads never write the same file twice
+        with self._lock:
+            cache_path = os.path.join(
+                self.cache_dir, f"{key[0]}_{pixel_size[0]}x{pixel_size[1]}.jpg"
+            )
+            if not os.path.exists(cache_path):
+                self._downscale(source, cache_path, pixel_size)
+            self._thumbnails[key] = cache_path
+        return cache_path
+
+    def _source_hash(self, path):
+        """Hash a source photo, re-reading it only when it changes on disk."""
+        stat = os.stat(path)
+        stamp = (path, stat.st_mtime_ns, stat.st_size)
+        if stamp not in self._hashes:
+            digest = hashlib.sha1()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+            with self._lock:
+                self._hashes[stamp] = digest.hexdigest()[:20]
+        return self._hashes[stamp]
+
+    def _downscale(self, source, cache_path, pixel_size):
+        """Downsample a photo to pixel_size and write it to the cache."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        with Image.open(source) as img:
+            # Let the JPEG decoder scale by powers of two before resampling,
+            # which avoids decoding all 12 megapixels of large photos
+            img.draft("RGB", (pixel_size[0] * 2, pixel_size[1] * 2))
+            img = ImageOps.exif_transpose(img).convert("RGB")
+            thumb = ImageOps.fit(img, pixel_size, Image.LANCZOS)
+
+        # Write to a temporary file first so a crash never leaves half an image
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        thumb.save(tmp_path, "JPEG", quality=85, optimize=True)
+        os.replace(tmp_path, cache_path)
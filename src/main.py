@@ -3,13 +3,551 @@ src/generate_scavenger_hunt.py
 Main entry point for the specimen scavenger hunt generator
 """
 
+import argparse
+import datetime
+import os
+
+from background_patterns import PATTERN_STYLES
 from hunt_generator import ScavengerHuntGenerator
+from output_profiles import get_output_profile
+
+
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Specimen Scavenger Hunt Generator")
+    parser.add_argument(
+        "--output",
+        help="PDF file to write (default specimen_scavenger_hunt.pdf, "
+        "or specimen_bingo.pdf with --bingo)",
+    )
+    parser.add_argument(
+        "--images",
+        metavar="DIR",
+        help="directory of specimen photos named after each item (e.g. beaver_paw.jpg)",
+    )
+    parser.add_argument(
+        "--profile",
+        default="print",
+        help="output profile: print (default) or web for small downloads",
+    )
+    parser.add_argument(
+        "--pattern",
+        choices=[*PATTERN_STYLES, "none"],
+        help="background texture, overriding the profile's",
+    )
+    parser.add_argument(
+        "--budget",
+        metavar="SIZE",
+        help="simplify the output until the PDF fits this size (e.g. 150KB)",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=int,
+        metavar="MS",
+        help="pick the richest quality tier expected to render within this many milliseconds",
+    )
+    parser.add_argument(
+        "--size-report",
+        action="store_true",
+        help="report how many bytes each page element contributes and exit",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="stay resident and regenerate the PDF when items, categories or layout change",
+    )
+    parser.add_argument(
+        "--formats",
+        metavar="FORMATS",
+        help="comma-separated page formats to emit in one run (letter, a4, tabloid)",
+    )
+    parser.add_argument(
+        "--languages",
+        metavar="LANGS",
+        help="comma-separated languages to emit in one run (en, es, fr, zh)",
+    )
+    parser.add_argument(
+        "--lint",
+        nargs="?",
+        const="",
+        metavar="CATALOG",
+        help="check a catalog CSV (default: built-in items) for duplicates, typos and overflow",
+    )
+    parser.add_argument(
+        "--stats",
+        nargs="?",
+        const="hunt_progress.sqlite3",
+        metavar="DB",
+        help="print find-rate statistics from a progress database and exit",
+    )
+    parser.add_argument(
+        "--record-progress",
+        metavar="CSV",
+        help="record completed hunts from a CSV (submission, variant, date, category, "
+        "item) in the --stats database (default hunt_progress.sqlite3) and exit",
+    )
+    parser.add_argument(
+        "--schedule",
+        metavar="CALENDAR",
+        help="pre-render upcoming event hunts from a JSON event calendar",
+    )
+    parser.add_argument(
+        "--days", type=int, default=7, help="days ahead to pre-render (default 7)"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=2, help="maximum concurrent renders (default 2)"
+    )
+    parser.add_argument(
+        "--cache", default=".hunt_cache", help="event hunt cache directory"
+    )
+    parser.add_argument(
+        "--off-peak",
+        metavar="HH:MM",
+        help="with --schedule, stay resident and pre-render daily at this time",
+    )
+    parser.add_argument(
+        "--date",
+        metavar="YYYY-MM-DD",
+        help="with --schedule, print the cached event hunts for this date "
+        "(or 'today'), rendering any not yet cached, instead of pre-rendering",
+    )
+    parser.add_argument(
+        "--event",
+        metavar="NAME",
+        help="with --schedule --date, only the named event's hunt",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="choose font size, spacing and sub-columns that print on the fewest pages",
+    )
+    parser.add_argument(
+        "--index",
+        metavar="DB",
+        help="record what each written PDF depends on in this index database "
+        "(with queued jobs, pass it to --drain)",
+    )
+    parser.add_argument(
+        "--rebuild-affected",
+        nargs="?",
+        const="",
+        metavar="CATALOG",
+        help="re-render indexed PDFs affected by changes in a catalog CSV "
+        "(default: built-in items) and exit",
+    )
+    parser.add_argument(
+        "--compile-catalog",
+        nargs="+",
+        metavar=("FILE", "CSV"),
+        help="compile a catalog CSV (default: built-in items) to a binary file "
+        "for --catalog-file and exit",
+    )
+    parser.add_argument(
+        "--catalog-file",
+        metavar="FILE",
+        help="with --formats or --sheets, read the catalog from a compiled file",
+    )
+    parser.add_argument(
+        "--bingo",
+        type=int,
+        metavar="N",
+        help="render N unique bingo cards and a staff call sheet",
+    )
+    parser.add_argument(
+        "--seed", type=int, help="with --bingo, random seed for reproducible cards"
+    )
+    parser.add_argument(
+        "--sheets",
+        type=int,
+        metavar="N",
+        help="print N serialized sheets, each with a redemption QR code",
+    )
+    parser.add_argument(
+        "--queue",
+        metavar="DB",
+        help="add this hunt (or the --sheets run) to a durable job queue instead of rendering",
+    )
+    parser.add_argument(
+        "--priority",
+        type=int,
+        help="with --queue, job priority; higher runs first "
+        "(default 10 for single hunts, 0 for --sheets runs)",
+    )
+    parser.add_argument(
+        "--drain",
+        nargs="?",
+        const="hunt_queue.sqlite3",
+        metavar="DB",
+        help="run queued jobs with --jobs workers until the queue is empty",
+    )
+    parser.add_argument(
+        "--variant",
+        default="standard",
+        help="with --sheets, the variant name encoded in each QR code",
+    )
+    args = parser.parse_args()
+
+    if args.compile_catalog and len(args.compile_catalog) > 2:
+        parser.error("--compile-catalog takes an output file and at most one CSV")
+    if args.catalog_file and not (args.formats or args.sheets):
+        parser.error("--catalog-file only works with --formats or --sheets")
+
+    # Bingo keeps its own default file, so cards never replace the checklist
+    args.bingo_output = args.output
+    if args.output is None:
+        args.output = "specimen_scavenger_hunt.pdf"
+
+    # The chosen texture is folded into the profile, so every mode renders it
+    if args.pattern:
+        args.profile = {
+            **get_output_profile(args.profile),
+            "background_pattern": False if args.pattern == "none" else args.pattern,
+        }
+
+    # These modes write PDFs the index cannot rebuild: event hunts are kept
+    # current by the scheduler's cache, bingo cards are dealt at random, and
+    # watched, budgeted or queued files are rewritten by their own runs
+    if args.index:
+        unindexed = [
+            flag
+            for flag, value in [
+                ("--schedule", args.schedule),
+                ("--bingo", args.bingo),
+                ("--watch", args.watch),
+                ("--budget", args.budget),
+                ("--queue", args.queue),
+            ]
+            if value
+        ]
+        if unindexed:
+            parser.error(f"--index cannot be used with {', '.join(unindexed)}")
+    return args
+
+
+def record_progress(csv_path, db_path):
+    """Record the completed hunts in a submissions CSV."""
+    from progress_store import ProgressStore, read_submissions
+
+    submissions = read_submissions(csv_path)
+    store = ProgressStore(db_path)
+    store.record_many(submissions)
+    store.close()
+    print(f"📝 Recorded {len(submissions)} completed hunt(s) in {db_path}")
+
+
+def print_stats(db_path):
+    """Print a find-rate summary of recorded hunts."""
+    from progress_store import ProgressStore
+
+    if not os.path.exists(db_path):
+        raise SystemExit(f"⚠️ No progress database at {db_path}")
+    store = ProgressStore(db_path)
+    stats = store.load()
+    store.close()
+
+    print(f"📊 {stats.submission_count} completed hunts")
+    if stats.skipped:
+        print(f"  ({stats.skipped} recorded without a catalog listing were skipped)")
+    if not stats.submission_count:
+        return
+    for category, rate in stats.find_rates_by_category().items():
+        print(f"  {category}: {rate:.0%}")
+
+    print("🔍 Hardest specimens:")
+    for category, item, rate in stats.hardest_items():
+        print(f"  {item} ({category}): {rate:.0%}")
+
+    print("⭐ Easiest specimens:")
+    for category, item, rate in stats.easiest_items():
+        print(f"  {item} ({category}): {rate:.0%}")
+
+
+def serve_event_hunts(scheduler, date, event_name):
+    """Print the paths of a date's event hunts, rendering any the cache lacks."""
+    day = datetime.date.today() if date == "today" else datetime.date.fromisoformat(date)
+    hunts = scheduler.serve(day, event_name)
+    if not hunts:
+        event = f" named {event_name}" if event_name else ""
+        raise SystemExit(f"⚠️ No event{event} on {day.isoformat()}")
+    for slug, path in sorted(hunts.items()):
+        print(f"📄 {slug}: {path}")
+
+
+def print_lint(catalog_file):
+    """Print catalog lint findings."""
+    from catalog import load_catalog
+    from catalog_lint import lint_catalog
+
+    findings = lint_catalog(load_catalog(catalog_file, with_location=True))
+
+    print(f"🔁 {len(findings['exact_duplicates'])} duplicate names")
+    for name, rows in findings["exact_duplicates"]:
+        print(f"  {name}: {', '.join(category for category, _, _ in rows)}")
+
+    print(f"👯 {len(findings['near_duplicates'])} near-duplicate pairs")
+    for score, name_a, name_b in findings["near_duplicates"]:
+        print(f"  {name_a} ~ {name_b} ({score:.0%})")
+
+    print(f"✏️ {len(findings['suspicious_words'])} possible misspellings")
+    for word, suggestion, name in findings["suspicious_words"]:
+        print(f"  {name}: '{word}' -> '{suggestion}'?")
+
+    print(f"📏 {len(findings['too_wide'])} names wider than their column")
+    for name, language, width, available in findings["too_wide"]:
+        print(f"  {name} ({language}): {width:.0f} pt > {available:.0f} pt")
+
+
+def print_size_report(profile, image_dir):
+    """Print the file size contribution of each page element."""
+    from size_budget import element_sizes
+
+    total, contributions = element_sizes(profile, image_dir=image_dir)
+    name = profile if isinstance(profile, str) else "custom"
+    print(f"📦 {name} profile: {total / 1024:.1f} KB")
+    for element, size in contributions:
+        print(f"  {element}: {size / 1024:.1f} KB ({size / total:.0%})")
+
+
+def rebuild_affected(db_path, catalog_file, jobs):
+    """Re-render the indexed PDFs that a catalog or layout change touched."""
+    from catalog import load_catalog
+    from dependency_index import DependencyIndex
+
+    index = DependencyIndex(db_path, load_catalog(catalog_file or None))
+    rebuilt = index.rebuild_affected(jobs)
+    print(f"🔁 Rebuilt {len(rebuilt)} affected PDF(s)")
+
+
+def enqueue(args):
+    """Add the requested hunt or --sheets run to the job queue."""
+    from print_queue import BULK_PRIORITY, WALK_IN_PRIORITY, PrintQueue
+
+    queue = PrintQueue(args.queue)
+    options = {"image_dir": args.images, "profile": args.profile}
+    if args.sheets:
+        if args.catalog_file:
+            options["catalog_file"] = args.catalog_file
+        priority = BULK_PRIORITY if args.priority is None else args.priority
+        added = queue.enqueue_sheets(
+            args.sheets, args.output, args.variant, priority, **options
+        )
+        print(f"📥 Queued {added} file(s) of sheets at priority {priority}")
+    else:
+        priority = WALK_IN_PRIORITY if args.priority is None else args.priority
+        if queue.enqueue_hunt(args.output, priority, **options):
+            print(f"📥 Queued {args.output} at priority {priority}")
+        else:
+            print(f"📥 {args.output} is already queued")
+
+
+def drain_queue(db_path, jobs, dependency_index=None):
+    """Run queued jobs until none are left, then summarize the queue."""
+    from print_queue import PrintQueue
+
+    queue = PrintQueue(db_path)
+    completed = queue.drain(jobs, dependency_index)
+    counts = queue.counts()
+    print(f"🖨️ Completed {completed} job(s)")
+    for status, count in sorted(counts.items()):
+        print(f"  {status}: {count}")
+
+
+def write_within_budget(output_file, budget, profile, image_dir):
+    """Write the hunt, simplifying it until it fits the byte budget."""
+    from size_budget import fit_budget, parse_size
+
+    limit = parse_size(budget)
+    data, settings, applied = fit_budget(limit, profile, image_dir=image_dir)
+    with open(output_file, "wb") as f:
+        f.write(data)
+
+    status = "✨" if len(data) <= limit else "⚠️ Over budget:"
+    print(f"{status} {output_file} is {len(data) / 1024:.1f} KB (budget {limit / 1024:.1f} KB)")
+    for step in applied:
+        print(f"  applied: {step}")
+
+
+def write_within_deadline(output_file, deadline_ms, profile, image_dir, dependency_index):
+    """Write the hunt at the richest quality tier expected to meet the deadline."""
+    from render_deadline import render_within_deadline
+
+    tier, estimate, elapsed = render_within_deadline(
+        output_file,
+        deadline_ms / 1000,
+        profile,
+        image_dir,
+        dependency_index=dependency_index,
+    )
+    status = "⏱️" if elapsed * 1000 <= deadline_ms else "⚠️ Over deadline:"
+    print(
+        f"{status} Rendered at {tier} quality in {elapsed * 1000:.0f} ms "
+        f"(estimated {estimate * 1000:.0f} ms, deadline {deadline_ms} ms)"
+    )
 
 
 def main():
     """Run the scavenger hunt generator."""
+    args = parse_args()
+    if args.lint is not None:
+        print_lint(args.lint or None)
+        return
+
+    if args.record_progress:
+        record_progress(args.record_progress, args.stats or "hunt_progress.sqlite3")
+        return
+
+    if args.stats:
+        print_stats(args.stats)
+        return
+
+    if args.schedule:
+        from event_scheduler import EventScheduler
+
+        scheduler = EventScheduler(args.schedule, cache_dir=args.cache)
+        if args.date:
+            serve_event_hunts(scheduler, args.date, args.event)
+        elif args.off_peak:
+            scheduler.run_off_peak(args.off_peak, args.days, args.jobs)
+        else:
+            scheduler.prerender(args.days, args.jobs)
+        return
+
+    if args.compile_catalog:
+        from catalog import load_catalog
+        from compiled_catalog import compile_catalog
+
+        path, *csv_file = args.compile_catalog
+        items = load_catalog(csv_file[0]) if csv_file else None
+        compile_catalog(path, items)
+        print(f"📦 Compiled catalog written to {path}")
+        return
+
+    if args.rebuild_affected is not None:
+        rebuild_affected(args.index or "hunt_outputs.sqlite3", args.rebuild_affected, args.jobs)
+        return
+
+    if args.size_report:
+        print_size_report(args.profile, args.images)
+        return
+
     print("📝 Starting Specimen Scavenger Hunt Generator")
-    generator = ScavengerHuntGenerator()
+    dependency_index = None
+    if args.index:
+        from dependency_index import DependencyIndex
+
+        dependency_index = DependencyIndex(args.index)
+
+    if args.watch:
+        from hunt_watcher import HuntWatcher
+
+        HuntWatcher(args.output, image_dir=args.images, profile=args.profile).run()
+        return
+
+    if args.budget:
+        write_within_budget(args.output, args.budget, args.profile, args.images)
+        print("✅ Done!")
+        return
+
+    if args.deadline is not None:
+        write_within_deadline(
+            args.output, args.deadline, args.profile, args.images, dependency_index
+        )
+        print("✅ Done!")
+        return
+
+    if args.bingo:
+        from bingo import render_bingo
+
+        options = {} if args.bingo_output is None else {"output_file": args.bingo_output}
+        cards_file, call_sheet_file = render_bingo(
+            args.bingo, seed=args.seed, profile=args.profile, **options
+        )
+        print(f"🎱 {args.bingo} bingo cards saved to {cards_file}")
+        print("✅ Done!")
+        return
+
+    if args.drain:
+        drain_queue(args.drain, args.jobs, dependency_index)
+        return
+
+    if args.queue:
+        enqueue(args)
+        return
+
+    if args.sheets:
+        from sheet_batch import render_sheet_batch
+
+        for path, first, last in render_sheet_batch(
+            args.sheets,
+            args.output,
+            variant=args.variant,
+            image_dir=args.images,
+            profile=args.profile,
+            max_workers=args.jobs,
+            catalog_file=args.catalog_file,
+            dependency_index=dependency_index,
+        ):
+            print(f"🎟️ {path}: {first} to {last}")
+        print("✅ Done!")
+        return
+
+    if args.languages:
+        from multilingual import render_languages
+
+        render_languages(
+            args.languages.split(","),
+            args.output,
+            image_dir=args.images,
+            profile=args.profile,
+            dependency_index=dependency_index,
+        )
+        print("✅ Done!")
+        return
+
+    if args.formats:
+        from multi_format import render_formats
+
+        render_formats(
+            args.formats.split(","),
+            args.output,
+            image_dir=args.images,
+            profile=args.profile,
+            catalog_file=args.catalog_file,
+            dependency_index=dependency_index,
+        )
+        print("✅ Done!")
+        return
+
+    if args.compact:
+        from density_optimizer import DensityOptimizer
+        from items import ITEMS
+
+        optimizer = DensityOptimizer(
+            profile=args.profile, with_thumbnails=bool(args.images)
+        )
+        layout, pages = optimizer.optimize(ITEMS)
+        print(
+            f"📐 {len(pages)} page(s) at {layout.item_font_size} pt, "
+            f"spacing {layout.item_spacing}/{layout.large_item_spacing}, "
+            f"{layout.sub_columns} sub-column(s)"
+        )
+        generator = ScavengerHuntGenerator(
+            args.output,
+            image_dir=args.images,
+            profile=args.profile,
+            layout=layout,
+            dependency_index=dependency_index,
+        )
+        generator.generate_hunt_pdf(pages)
+        print("✅ Done!")
+        return
+
+    generator = ScavengerHuntGenerator(
+        args.output,
+        image_dir=args.images,
+        profile=args.profile,
+        dependency_index=dependency_index,
+    )
     generator.generate_hunt_pdf()
     print("✅ Done!")
 
@@ -0,0 +1,103 @@
+"""
+src/multi_format.py
+Renders several page formats of one hunt in a single run
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from compiled_catalog import catalog_options, open_catalog
+from hunt_generator import (
+    DEFAULT_INSTRUCTIONS,
+    DEFAULT_SUBTITLE,
+    DEFAULT_TITLE,
+    ScavengerHuntGenerator,
+    plan_pages,
+)
+from hunt_layout import PAGE_FORMATS
+from hunt_pagination import group_items
+from items import ITEMS
+from text_metrics import TextMeasurer
+
+
+def format_output_file(output_file, page_format):
+    """Insert the format name before the extension, e.g. hunt_a4.pdf."""
+    root, ext = os.path.splitext(output_file)
+    return f"{root}_{page_format}{ext or '.pdf'}"
+
+
+def _render_format(options, page_format, pages):
+    """Render one format from a precomputed page plan (runs in a worker)."""
+    generator = ScavengerHuntGenerator(
+        page_format=page_format, **catalog_options(options)
+    )
+    generator.generate_hunt_pdf(pages)
+    return generator.output_file
+
+
+def render_formats(
+    formats,
+    output_file="specimen_scavenger_hunt.pdf",
+    items=None,
+    image_dir=None,
+    title=DEFAULT_TITLE,
+    subtitle=DEFAULT_SUBTITLE,
+    instructions=DEFAULT_INSTRUCTIONS,
+    max_workers=None,
+    profile=None,
+    catalog_file=None,
+    dependency_index=None,
+):
+    """
+    Render the same hunt in every requested format.
+
+    The catalog is grouped once and every format is paginated against one
+    shared TextMeasurer, so block heights and text widths measured for one
+    format are reused by the rest. Drawing then runs in parallel, one worker
+    process per format. Returns the written file paths.
+    With catalog_file, a compile_catalog() file, workers map the catalog
+    instead of receiving a pickled copy of the items.
+    dependency_index is an optional DependencyIndex recording every file.
+    """
+    unknown = [page_format for page_format in formats if page_format not in PAGE_FORMATS]
+    if unknown:
+        raise ValueError(
+            f"Unknown page format(s) {', '.join(unknown)}; "
+            f"choose from {', '.join(PAGE_FORMATS)}"
+        )
+
+    if catalog_file is not None:
+        groups = open_catalog(catalog_file).groups()
+        worker_items = {"catalog_file": catalog_file}
+    else:
+        items = ITEMS if items is None else items
+        groups = group_items(items)
+        worker_items = {"items": items}
+    measurer = TextMeasurer()
+    plans = {
+        page_format: plan_pages(
+            groups, page_format, instructions, measurer, profile=profile
+        )
+        for page_format in formats
+    }
+
+    with ProcessPoolExecutor(max_workers=max_workers or len(formats)) as executor:
+        futures = [
+            executor.submit(
+                _render_format,
+                {
+                    "output_file": format_output_file(output_file, page_format),
+                    "image_dir": image_dir,
+                    **worker_items,
+                    "title": title,
+                    "subtitle": subtitle,
+                    "instructions": instructions,
+                    "profile": profile,
+                    "dependency_index": dependency_index,
+                },
+                page_format,
+                pages,
+            )
+            for page_format, pages in plans.items()
+        ]
+        return [future.result() for future in futures]
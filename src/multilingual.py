@@ -0,0 +1,80 @@
+"""
+src/multilingual.py
+Renders one hunt in several languages in a single run
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+from hunt_generator import ScavengerHuntGenerator, plan_pages
+from hunt_pagination import group_items
+from items import ITEMS
+from multi_format import format_output_file
+from text_metrics import TextMeasurer
+from translations import TRANSLATIONS, get_text
+
+
+def _render_language(options, language, pages):
+    """Render one language from a precomputed page plan (runs in a worker)."""
+    generator = ScavengerHuntGenerator(language=language, **options)
+    generator.generate_hunt_pdf(pages)
+    return generator.output_file
+
+
+def render_languages(
+    languages,
+    output_file="specimen_scavenger_hunt.pdf",
+    items=None,
+    image_dir=None,
+    page_format="letter",
+    profile=None,
+    max_workers=None,
+    dependency_index=None,
+):
+    """
+    Render the same hunt in every requested language.
+
+    Categories and items are grouped once by their English catalog names and
+    paginated against one shared TextMeasurer; only the drawn text differs
+    per language, so every language reuses the same grouping. Each language
+    is then drawn in its own worker process. Returns the written file paths.
+    dependency_index is an optional DependencyIndex recording every file.
+    """
+    unknown = [language for language in languages if language not in TRANSLATIONS]
+    if unknown:
+        raise ValueError(
+            f"Unknown language(s) {', '.join(unknown)}; "
+            f"choose from {', '.join(TRANSLATIONS)}"
+        )
+
+    items = ITEMS if items is None else items
+    groups = group_items(items)
+    measurer = TextMeasurer()
+    plans = {
+        language: plan_pages(
+            groups,
+            page_format,
+            get_text("instructions", language),
+            measurer,
+            profile=profile,
+        )
+        for language in languages
+    }
+
+    with ProcessPoolExecutor(max_workers=max_workers or len(languages)) as executor:
+        futures = [
+            executor.submit(
+                _render_language,
+                {
+                    "output_file": format_output_file(output_file, language),
+                    "image_dir": image_dir,
+                    "items": items,
+                    "page_format": page_format,
+                    "profile": profile,
+                    "dependency_index": dependency_index,
+                },
+                language,
+                pages,
+            )
+            for language, pages in plans.items()
+        ]
+        return [future.result() for future in futures]
@@ -0,0 +1,40 @@
+"""
+src/output_profiles.py
+Output profiles trading decoration detail for file size
+"""
+
+# Define output profiles with their rendering settings
+OUTPUT_PROFILES = {
+    "print": {
+        "page_compression": 1,
+        "fonts": "dejavu",  # Full DejaVu family, subset-embedded
+        "background_gradient_steps": 20,
+        "background_pattern": "dots",  # "dots", "hatch", "stipple", or False
+        "header_gradient_steps": 10,
+        "title_shadow": True,
+        "corners": True,
+    },
+    "web": {
+        "page_compression": 1,  # Same Flate stream compression as print
+        "fonts": "dejavu-minimal",  # Regular and bold faces only
+        "background_gradient_steps": 6,
+        "background_pattern": False,
+        "header_gradient_steps": 3,
+        "title_shadow": False,
+        "corners": True,
+    },
+}
+
+
+def get_output_profile(profile=None):
+    """Get an output profile by name, passing dicts through, with print as default."""
+    if profile is None:
+        return OUTPUT_PROFILES["print"]
+    if isinstance(profile, dict):
+        return {**OUTPUT_PROFILES["print"], **profile}
+    if profile not in OUTPUT_PROFILES:
+        raise ValueError(
+            f"Unknown output profile {profile!r}; choose from {', '.join(OUTPUT_PROFILES)}"
+        )
+    return OUTPUT_PROFILES[profile]
+
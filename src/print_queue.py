@@ -0,0 +1,366 @@
+"""
+src/print_queue.py
+Durable SQLite job queue for print runs and walk-in requests
+"""
+
+import json
+import math
+import os
+import socket
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from hunt_generator import ScavengerHuntGenerator
+from items import ITEMS
+from multi_format import format_output_file
+from sheet_batch import render_chunk
+from sheet_codes import DEFAULT_REDEEM_URL, SerialAllocator
+
+# Priorities: higher runs first
+BULK_PRIORITY = 0
+WALK_IN_PRIORITY = 10
+
+RETRY_DELAY = 5  # Seconds before the first retry, doubled on each further one
+
+
+class PrintQueue:
+    """
+    Local job queue that survives crashes and restarts.
+
+    A print run is stored as one job per output file, so an interrupted run
+    resumes from the first unfinished file. Workers claim the most urgent
+    runnable job in a write-locked transaction and hold it on a lease. A
+    claim records the worker's host and process id, so a job whose worker
+    died on this host is claimed again straight away; jobs of workers on
+    other hosts are claimed again once the lease runs out. Failed jobs
+    are retried with exponential backoff. Jobs are keyed by output path, so
+    enqueuing the same run twice does not duplicate work, and every job
+    writes its PDF atomically, so a rerun replaces rather than appends.
+    """
+
+    def __init__(self, db_path="hunt_queue.sqlite3", lease=1800, max_attempts=3):
+        self.db_path = db_path
+        self.lease = lease
+        self.max_attempts = max_attempts
+
+        connection = self._connect()
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "id INTEGER PRIMARY KEY, "
+                "output TEXT UNIQUE NOT NULL, "
+                "kind TEXT NOT NULL, "
+                "payload TEXT NOT NULL, "
+                "priority INTEGER NOT NULL, "
+                "status TEXT NOT NULL DEFAULT 'queued', "
+                "attempts INTEGER NOT NULL DEFAULT 0, "
+                "run_after REAL NOT NULL DEFAULT 0, "
+                "error TEXT, "
+                "worker_host TEXT, "
+                "worker_pid INTEGER)"
+            )
+            # Queues created before workers were recorded
+            columns = {row[1] for row in connection.execute("PRAGMA table_info(jobs)")}
+            for column, kind in [("worker_host", "TEXT"), ("worker_pid", "INTEGER")]:
+                if column not in columns:
+                    connection.execute(f"ALTER TABLE jobs ADD COLUMN {column} {kind}")
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS jobs_runnable "
+                "ON jobs (status, priority DESC, id)"
+            )
+        connection.close()
+
+    def enqueue_hunt(self, output_file, priority=WALK_IN_PRIORITY, **options):
+        """
+        Queue a single hunt PDF; options are ScavengerHuntGenerator arguments.
+        A finished job for the same file is queued again with the new options.
+        Returns False if a job for output_file is already waiting or running.
+        """
+        return bool(
+            self._execute(
+                "INSERT INTO jobs (output, kind, payload, priority) VALUES (?, 'hunt', ?, ?) "
+                "ON CONFLICT (output) DO UPDATE SET payload = excluded.payload, "
+                "priority = excluded.priority, status = 'queued', attempts = 0, "
+                "run_after = 0, error = NULL WHERE status IN ('done', 'failed')",
+                (os.path.abspath(output_file), json.dumps(options), priority),
+            )
+        )
+
+    def enqueue_sheets(
+        self,
+        count,
+        output_file="specimen_scavenger_hunt.pdf",
+        variant="standard",
+        priority=BULK_PRIORITY,
+        sheets_per_file=500,
+        serial_db="hunt_serials.sqlite3",
+        base_url=DEFAULT_REDEEM_URL,
+        **options,
+    ):
+        """
+        Queue a serialized print run as one job per file of sheets_per_file.
+        Each new job's serials are reserved now, so a retried job prints the
+        same serials again. Returns the number of jobs added.
+        """
+        # The queue stays write-locked from the existence check to the insert,
+        # so concurrent enqueues of the same run never reserve serials twice
+        added = 0
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            for index in range(math.ceil(count / sheets_per_file)):
+                chunk_file = os.path.abspath(
+                    format_output_file(output_file, f"{variant}_{index + 1:03d}")
+                )
+                if connection.execute(
+                    "SELECT 1 FROM jobs WHERE output = ?", (chunk_file,)
+                ).fetchone():
+                    continue
+                chunk_count = min(sheets_per_file, count - index * sheets_per_file)
+                payload = {
+                    "count": chunk_count,
+                    "first_serial": SerialAllocator(serial_db).reserve(chunk_count).start,
+                    "variant": variant,
+                    "serial_db": serial_db,
+                    "base_url": base_url,
+                    "options": options,
+                }
+                connection.execute(
+                    "INSERT INTO jobs (output, kind, payload, priority) "
+                    "VALUES (?, 'sheets', ?, ?)",
+                    (chunk_file, json.dumps(payload), priority),
+                )
+                added += 1
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        finally:
+            connection.close()
+        return added
+
+    def claim(self):
+        """
+        Claim the most urgent runnable job, or return None if there is none.
+        Returns (id, kind, output file, payload).
+        """
+        now = time.time()
+        host = socket.gethostname()
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            # Jobs left running by a dead worker on this host need not wait out the lease
+            for job_id, pid in connection.execute(
+                "SELECT id, worker_pid FROM jobs "
+                "WHERE status = 'running' AND run_after > ? AND worker_host = ?",
+                (now, host),
+            ).fetchall():
+                if not _process_alive(pid):
+                    connection.execute(
+                        "UPDATE jobs SET run_after = ? WHERE id = ?", (now, job_id)
+                    )
+            while True:
+                row = connection.execute(
+                    "SELECT id, kind, output, payload, status, attempts FROM jobs "
+                    "WHERE status IN ('queued', 'running') AND run_after <= ? "
+                    "ORDER BY priority DESC, id LIMIT 1",
+                    (now,),
+                ).fetchone()
+                if row is None or row[4] == "queued":
+                    break
+                # A running job here was abandoned by its worker, which counts
+                # as a failed attempt, so a job that kills workers gives up
+                attempts = row[5] + 1
+                if attempts < self.max_attempts:
+                    connection.execute(
+                        "UPDATE jobs SET attempts = ? WHERE id = ?", (attempts, row[0])
+                    )
+                    break
+                connection.execute(
+                    "UPDATE jobs SET status = 'failed', attempts = ?, run_after = 0, "
+                    "error = 'worker died or ran past its lease' WHERE id = ?",
+                    (attempts, row[0]),
+                )
+            if row is not None:
+                # A running job is only runnable once its lease has expired
+                connection.execute(
+                    "UPDATE jobs SET status = 'running', run_after = ?, "
+                    "worker_host = ?, worker_pid = ? WHERE id = ?",
+                    (now + self.lease, host, os.getpid(), row[0]),
+                )
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        finally:
+            connection.close()
+
+        if row is None:
+            return None
+        job_id, kind, output_file, payload = row[:4]
+        return job_id, kind, output_file, json.loads(payload)
+
+    def complete(self, job_id):
+        """Mark a job done."""
+        self._execute(
+            "UPDATE jobs SET status = 'done', error = NULL WHERE id = ?", (job_id,)
+        )
+
+    def fail(self, job_id, error):
+        """Record a failed attempt, scheduling a retry with backoff until attempts run out."""
+        connection = self._connect()
+        with connection:
+            (attempts,) = connection.execute(
+                "SELECT attempts FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            attempts += 1
+            if attempts < self.max_attempts:
+                status = "queued"
+                run_after = time.time() + RETRY_DELAY * 2 ** (attempts - 1)
+            else:
+                status = "failed"
+                run_after = 0
+            connection.execute(
+                "UPDATE jobs SET status = ?, attempts = ?, run_after = ?, error = ? "
+                "WHERE id = ?",
+                (status, attempts, run_after, str(error), job_id),
+            )
+        connection.close()
+
+    def release(self, job_id):
+        """Put a claimed job back without counting an attempt (e.g. on Ctrl-C)."""
+        self._execute(
+            "UPDATE jobs SET status = 'queued', run_after = 0 WHERE id = ?", (job_id,)
+        )
+
+    def retry_failed(self):
+        """Queue every failed job again with a fresh set of attempts."""
+        return self._execute(
+            "UPDATE jobs SET status = 'queued', attempts = 0, run_after = 0 "
+            "WHERE status = 'failed'"
+        )
+
+    def counts(self):
+        """Get the number of jobs in each status."""
+        connection = self._connect()
+        counts = dict(
+            connection.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status")
+        )
+        connection.close()
+        return counts
+
+    def next_run_after(self):
+        """Get when the next waiting job becomes runnable, or None if none is waiting."""
+        connection = self._connect()
+        (run_after,) = connection.execute(
+            "SELECT MIN(run_after) FROM jobs WHERE status IN ('queued', 'running')"
+        ).fetchone()
+        connection.close()
+        return run_after
+
+    def drain(self, workers=2, dependency_index=None):
+        """
+        Run jobs with a pool of worker processes until none are left to run,
+        recording every written PDF in an optional DependencyIndex.
+        """
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _drain_worker,
+                    self.db_path,
+                    self.lease,
+                    self.max_attempts,
+                    dependency_index,
+                )
+                for _ in range(workers)
+            ]
+            return sum(future.result() for future in futures)
+
+    def _execute(self, sql, params=()):
+        """Run one write statement in its own transaction. Returns the row count."""
+        connection = self._connect()
+        with connection:
+            count = connection.execute(sql, params).rowcount
+        connection.close()
+        return count
+
+    def _connect(self):
+        """Open a connection that waits for, rather than fails on, other writers."""
+        connection = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        return connection
+
+
+def _process_alive(pid):
+    """Check whether a process with this id is running on this host."""
+    if pid is None or os.name == "nt":  # Windows has no signal 0; rely on the lease
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:  # Alive, but owned by another user
+        return True
+    return True
+
+
+def run_job(kind, output_file, payload, dependency_index=None):
+    """Render one job's PDF, recording it in an optional DependencyIndex."""
+    if kind == "hunt":
+        tmp_file = f"{output_file}.{os.getpid()}.tmp"
+        generator = ScavengerHuntGenerator(tmp_file, **payload)
+        generator.draw_sheet()
+        generator.canvas.save()
+        os.replace(tmp_file, output_file)
+        if dependency_index is not None:
+            dependency_index.record(generator, output_file)
+    elif kind == "sheets":
+        options = dict(payload["options"])
+        if "catalog_file" not in options:
+            options["items"] = options.get("items") or ITEMS
+        render_chunk(
+            output_file,
+            payload["count"],
+            None,
+            payload["variant"],
+            payload["serial_db"],
+            payload["base_url"],
+            options,
+            payload["first_serial"],
+            dependency_index,
+        )
+    else:
+        raise ValueError(f"Unknown job kind {kind!r}")
+
+
+def _drain_worker(db_path, lease, max_attempts, dependency_index=None):
+    """
+    Claim and run jobs until the queue is empty (runs in a worker). Jobs
+    waiting out a retry delay are waited for. Returns the number completed.
+    """
+    queue = PrintQueue(db_path, lease, max_attempts)
+    completed = 0
+    while True:
+        job = queue.claim()
+        if job is None:
+            run_after = queue.next_run_after()
+            if run_after is None:
+                return completed
+            # Sleep briefly even for a distant lease, so new urgent jobs are seen
+            time.sleep(min(max(run_after - time.time(), 0.1), 5))
+            continue
+
+        job_id, kind, output_file, payload = job
+        try:
+            run_job(kind, output_file, payload, dependency_index)
+        except KeyboardInterrupt:
+            queue.release(job_id)
+            raise
+        except Exception as e:
+            queue.fail(job_id, e)
+            print(f"⚠️ {os.path.basename(output_file)} failed ({e})")
+        else:
+            queue.complete(job_id)
+            completed += 1
+            print(f"✨ {os.path.basename(output_file)} done")
@@ -0,0 +1,324 @@
+"""
+src/progress_store.py
+Visitor progress tracking for completed scavenger hunts
+"""
+
+import csv
+import datetime
+import hashlib
+import json
+import sqlite3
+
+import numpy as np
+
+from items import ITEMS
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS submissions (
+    id INTEGER PRIMARY KEY,
+    variant TEXT NOT NULL,
+    hunt_date TEXT NOT NULL,
+    catalog_size INTEGER NOT NULL,
+    found_count INTEGER NOT NULL,
+    found BLOB NOT NULL,
+    catalog_id INTEGER REFERENCES catalogs (id)
+);
+CREATE TABLE IF NOT EXISTS catalogs (
+    id INTEGER PRIMARY KEY,
+    fingerprint TEXT UNIQUE NOT NULL,
+    listings TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS submissions_variant_date
+    ON submissions (variant, hunt_date);
+CREATE INDEX IF NOT EXISTS submissions_date ON submissions (hunt_date);
+"""
+
+
+class ProgressStore:
+    """
+    Stores each completed hunt as a bitset over the catalog's item ids in a
+    local SQLite file, keyed by hunt variant and date.
+
+    Item ids are positions in the catalog list. Every catalog a submission
+    was recorded against is stored once with its listings, and each row
+    refers to it, so rows recorded before a catalog edit are remapped to
+    the current listings when loaded.
+    """
+
+    def __init__(self, db_path="hunt_progress.sqlite3", items=ITEMS):
+        self.db_path = db_path
+        self.items = list(items)
+        self.bitset_bytes = (len(self.items) + 7) // 8
+
+        # Listings are keyed by (category, item), since a specimen can be
+        # listed in two categories; bare names only resolve when listed once
+        self._ids = {}
+        name_ids = {}
+        for item_id, (category, item) in enumerate(self.items):
+            self._ids[(category, item)] = item_id
+            name_ids.setdefault(item, []).append(item_id)
+        for item, item_ids in name_ids.items():
+            self._ids[item] = item_ids[0] if len(item_ids) == 1 else None
+
+        self.connection = sqlite3.connect(db_path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        # Stores created before catalogs were tracked lack the column
+        columns = {
+            row[1] for row in self.connection.execute("PRAGMA table_info(submissions)")
+        }
+        if columns and "catalog_id" not in columns:
+            self.connection.execute(
+                "ALTER TABLE submissions ADD COLUMN catalog_id INTEGER"
+            )
+        self.connection.executescript(SCHEMA)
+        self.catalog_id = self._catalog_id()
+
+    def _catalog_id(self):
+        """Get the id of the current catalog's listings, storing them if new."""
+        listings = json.dumps([list(entry) for entry in self.items], ensure_ascii=False)
+        fingerprint = hashlib.sha1(listings.encode("utf-8")).hexdigest()
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR IGNORE INTO catalogs (fingerprint, listings) VALUES (?, ?)",
+                (fingerprint, listings),
+            )
+        (catalog_id,) = self.connection.execute(
+            "SELECT id FROM catalogs WHERE fingerprint = ?", (fingerprint,)
+        ).fetchone()
+        return catalog_id
+
+    def close(self):
+        """Close the underlying database connection."""
+        self.connection.close()
+
+    def encode(self, found):
+        """
+        Encode found listings as a bitset. Entries are (category, item) pairs,
+        item ids, or names of items listed in only one category.
+        """
+        bits = np.zeros(len(self.items), dtype=bool)
+        for entry in found:
+            bits[self._item_id(entry)] = True
+        return np.packbits(bits, bitorder="little").tobytes(), int(bits.sum())
+
+    def _item_id(self, entry):
+        """Resolve a found entry to its item id."""
+        if isinstance(entry, (int, np.integer)):
+            return int(entry)
+        if isinstance(entry, list):
+            entry = tuple(entry)
+        item_id = self._ids[entry]
+        if item_id is None:
+            raise ValueError(
+                f"{entry!r} is listed in several categories; give (category, item)"
+            )
+        return item_id
+
+    def record(self, variant, found, hunt_date=None):
+        """Record one completed hunt."""
+        self.record_many([(variant, found, hunt_date)])
+
+    def record_many(self, submissions):
+        """Record many (variant, found, hunt_date) submissions in one transaction."""
+        today = datetime.date.today().isoformat()
+        rows = []
+        for variant, found, hunt_date in submissions:
+            bitset, found_count = self.encode(found)
+            rows.append(
+                (
+                    variant,
+                    str(hunt_date or today),
+                    len(self.items),
+                    found_count,
+                    bitset,
+                    self.catalog_id,
+                )
+            )
+
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO submissions "
+                "(variant, hunt_date, catalog_size, found_count, found, catalog_id) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def load(self, variant=None, start=None, end=None):
+        """
+        Load matching submissions in bulk.
+        Returns a ProgressStats over a (submissions x items) boolean matrix.
+
+        Rows recorded against another catalog are remapped by listing:
+        listings since removed are dropped, and listings added since count
+        as not offered to those submissions. Rows that predate catalog
+        tracking cannot be mapped and are skipped, counted in
+        ProgressStats.skipped.
+        """
+        query = "SELECT catalog_id, found FROM submissions WHERE 1=1"
+        params = []
+        if variant is not None:
+            query += " AND variant = ?"
+            params.append(variant)
+        if start is not None:
+            query += " AND hunt_date >= ?"
+            params.append(str(start))
+        if end is not None:
+            query += " AND hunt_date <= ?"
+            params.append(str(end))
+
+        by_catalog = {}
+        for catalog_id, blob in self.connection.execute(query, params):
+            by_catalog.setdefault(catalog_id, []).append(blob)
+        skipped = len(by_catalog.pop(None, []))
+
+        found = [np.zeros((0, len(self.items)), dtype=bool)]
+        offered = np.zeros(len(self.items), dtype=np.int64)
+        for catalog_id, blobs in by_catalog.items():
+            if catalog_id == self.catalog_id:
+                listings = self.items
+            else:
+                (listings,) = self.connection.execute(
+                    "SELECT listings FROM catalogs WHERE id = ?", (catalog_id,)
+                ).fetchone()
+                listings = [tuple(entry) for entry in json.loads(listings)]
+
+            size = (len(listings) + 7) // 8
+            packed = np.frombuffer(b"".join(blobs), dtype=np.uint8).reshape(-1, size)
+            bits = np.unpackbits(packed, axis=1, bitorder="little")[:, : len(listings)]
+            if catalog_id == self.catalog_id:
+                found.append(bits.astype(bool))
+                offered += len(blobs)
+                continue
+
+            # Columns of the recorded catalog that are still listed, and where
+            old_ids, new_ids = [], []
+            for old_id, listing in enumerate(listings):
+                new_id = self._ids.get(listing)
+                if new_id is not None:
+                    old_ids.append(old_id)
+                    new_ids.append(new_id)
+            remapped = np.zeros((len(blobs), len(self.items)), dtype=bool)
+            remapped[:, new_ids] = bits[:, old_ids]
+            found.append(remapped)
+            offered[new_ids] += len(blobs)
+
+        stats = ProgressStats(np.concatenate(found), self.items, offered)
+        stats.skipped = skipped
+        return stats
+
+
+def read_submissions(path):
+    """
+    Read completed hunts from a CSV file as (variant, found, hunt_date)
+    submissions for ProgressStore.record_many().
+
+    The file has one row per found specimen, with submission, variant, date,
+    category and item columns; rows sharing a submission value form one
+    hunt. category may be empty for items listed in only one category, and
+    a hunt with nothing found is a single row with an empty item.
+    """
+    submissions = {}
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            key = row["submission"].strip()
+            if key not in submissions:
+                submissions[key] = (
+                    row["variant"].strip(),
+                    [],
+                    (row.get("date") or "").strip() or None,
+                )
+            item = (row.get("item") or "").strip()
+            if item:
+                category = (row.get("category") or "").strip()
+                submissions[key][1].append((category, item) if category else item)
+    return list(submissions.values())
+
+
+class ProgressStats:
+    """Vectorized aggregates over a batch of loaded submissions."""
+
+    def __init__(self, found, items, offered=None):
+        self.found = found
+        self.items = items
+        self.submission_count = found.shape[0]
+        # Submissions each item was listed for, when not every submission had it
+        self.offered = offered
+        self.skipped = 0
+
+        self._categories = np.array([category for category, _ in items])
+
+    def find_rates(self):
+        """Fraction of submissions that found each item, indexed by item id."""
+        if self.submission_count == 0:
+            return np.zeros(len(self.items))
+        if self.offered is None:
+            return self.found.mean(axis=0)
+        return self.found.sum(axis=0) / np.maximum(self.offered, 1)
+
+    def find_rates_by_category(self):
+        """Average find rate of the items in each category."""
+        return self._rates_by_group(self._categories)
+
+    def find_rates_by_zone(self, zones):
+        """
+        Average find rate of the items in each zone.
+        zones maps a category or item name to the museum zone it is displayed in.
+        """
+        groups = np.array(
+            [zones.get(item, zones.get(category)) for category, item in self.items],
+            dtype=object,
+        )
+        return self._rates_by_group(groups)
+
+    def hardest_items(self, count=5):
+        """The least found items as (category, item, rate) tuples."""
+        order = np.argsort(self.find_rates(), kind="stable")
+        return self._describe(self._with_data(order)[:count])
+
+    def easiest_items(self, count=5):
+        """The most found items as (category, item, rate) tuples."""
+        order = np.argsort(-self.find_rates(), kind="stable")
+        return self._describe(self._with_data(order)[:count])
+
+    def selection_weights(self, target_rate=0.6, floor=0.1):
+        """
+        Weight items for future variant selection, favoring specimens whose
+        find rate is close to target_rate. Items without data get weight 1.
+        Returns {(category, item): weight}.
+        """
+        listings = [tuple(entry) for entry in self.items]
+        if self.submission_count == 0:
+            return {listing: 1.0 for listing in listings}
+
+        distance = np.abs(self.find_rates() - target_rate)
+        weights = np.maximum(1.0 - distance / max(target_rate, 1 - target_rate), floor)
+        if self.offered is not None:
+            weights[self.offered == 0] = 1.0
+        return dict(zip(listings, weights.tolist()))
+
+    def _with_data(self, item_ids):
+        """Keep the item ids that were listed for at least one submission."""
+        if self.offered is None:
+            return item_ids
+        return item_ids[self.offered[item_ids] > 0]
+
+    def _rates_by_group(self, groups):
+        """Average per-item find rates over arbitrary item groups."""
+        rates = self.find_rates()
+        # Items never listed for a loaded submission have no rate to average
+        listed = np.ones(len(rates)) if self.offered is None else (self.offered > 0) * 1.0
+        labels, inverse = np.unique(groups.astype(str), return_inverse=True)
+        totals = np.bincount(inverse, weights=rates * listed)
+        counts = np.bincount(inverse, weights=listed)
+        return {
+            label: float(total / count)
+            for label, total, count in zip(labels, totals, counts)
+            if label != "None" and count
+        }
+
+    def _describe(self, item_ids):
+        """Describe item ids as (category, item, rate) tuples."""
+        rates = self.find_rates()
+        return [
+            (self.items[i][0], self.items[i][1], float(rates[i])) for i in item_ids
+        ]
@@ -0,0 +1,259 @@
+"""
+src/render_deadline.py
+Quality tiers chosen from measured render costs to meet a deadline
+"""
+
+import hashlib
+import json
+import os
+import time
+
+from hunt_generator import ScavengerHuntGenerator
+from output_profiles import get_output_profile
+from text_metrics import TextMeasurer
+
+# Quality tiers, richest first: (name, profile overrides, with thumbnails)
+QUALITY_TIERS = [
+    ("full", {}, True),
+    (
+        "simplified",
+        {
+            "background_pattern": False,
+            "background_gradient_steps": 4,
+            "header_gradient_steps": 2,
+            "title_shadow": False,
+        },
+        True,
+    ),
+    (
+        "plain",
+        {
+            "background_pattern": False,
+            "background_gradient_steps": 0,
+            "header_gradient_steps": 1,
+            "title_shadow": False,
+            "corners": False,
+        },
+        False,
+    ),
+]
+
+# Costs assumed for a tier until it has been measured here, in seconds on an
+# unloaded machine: a cold run's setup (mostly font registration) and each
+# renderer's cost per page, as measured on one core with the built-in catalog
+SEED_COSTS = {
+    "full": {
+        "setup": 0.085,
+        "per_page": {
+            "background": 0.056,
+            "category": 0.004,
+            "corner": 0.0001,
+            "footer": 0.0005,
+            "header": 0.0006,
+            "save": 0.038,
+        },
+    },
+    "simplified": {
+        "setup": 0.09,
+        "per_page": {
+            "background": 0.0001,
+            "category": 0.003,
+            "corner": 0.0001,
+            "footer": 0.0005,
+            "header": 0.0006,
+            "save": 0.0042,
+        },
+    },
+    "plain": {
+        "setup": 0.09,
+        "per_page": {
+            "category": 0.003,
+            "footer": 0.0005,
+            "header": 0.0006,
+            "save": 0.0043,
+        },
+    },
+}
+
+# Generator renderers whose draw calls are timed; the checkbox renderer is
+# only called from inside the category renderer, so it is counted there
+TIMED_RENDERERS = ["background", "corner", "header", "category", "footer"]
+
+
+def cost_signature(settings, page_format, with_images):
+    """
+    Get the key of the render settings costs are measured under: the output
+    profile's settings, the page format and whether photos were given.
+    """
+    digest = hashlib.sha1(json.dumps(settings, sort_keys=True).encode("utf-8"))
+    images = "images" if with_images else "no images"
+    return f"{page_format}, {images}, profile {digest.hexdigest()[:8]}"
+
+
+def load_factor():
+    """Get how oversubscribed the CPUs are right now (1.0 when not)."""
+    try:
+        load = os.getloadavg()[0]
+    except (AttributeError, OSError):  # Not available on Windows
+        return 1.0
+    return max(1.0, load / (os.cpu_count() or 1))
+
+
+class _TimedRenderer:
+    """Wraps a renderer, adding the time spent in its public methods to a total."""
+
+    def __init__(self, renderer, name, timings):
+        self._renderer = renderer
+        self._name = name
+        self._timings = timings
+
+    def __getattr__(self, attr):
+        value = getattr(self._renderer, attr)
+        if attr.startswith("_") or not callable(value):
+            return value
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return value(*args, **kwargs)
+            finally:
+                self._timings[self._name] = (
+                    self._timings.get(self._name, 0.0) + time.perf_counter() - start
+                )
+
+        return timed
+
+
+class RenderCosts:
+    """
+    Measured render costs for each quality tier, kept in a JSON file between
+    runs. For every tier it stores a fixed setup cost and each renderer's
+    cost per page, as moving averages scaled to an unloaded machine, so an
+    estimate follows recent runs and the current CPU load. Costs are kept
+    per cost_signature(), so runs with another profile, page format or
+    photos do not overwrite each other's; tiers not yet measured under a
+    signature are estimated from SEED_COSTS.
+    """
+
+    def __init__(self, path="hunt_render_costs.json", smoothing=0.3):
+        self.path = path
+        self.smoothing = smoothing
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.costs = json.load(f)
+        except (OSError, ValueError):
+            self.costs = {}
+
+    def estimate(self, tier, pages, signature):
+        """Estimate seconds to render pages at a tier now, including setup."""
+        costs = self.costs.get(f"{tier}: {signature}", SEED_COSTS[tier])
+        per_page = sum(costs["per_page"].values())
+        return (costs["setup"] + pages * per_page) * load_factor()
+
+    def record(self, tier, signature, setup, timings, pages):
+        """Fold one render's setup time and per-renderer totals into the averages."""
+        factor = load_factor()
+        measured = {
+            "setup": setup / factor,
+            "per_page": {
+                name: seconds / pages / factor for name, seconds in timings.items()
+            },
+        }
+        key = f"{tier}: {signature}"
+        previous = self.costs.get(key)
+        if previous is not None:
+            measured["setup"] = self._blend(previous["setup"], measured["setup"])
+            measured["per_page"] = {
+                name: self._blend(previous["per_page"].get(name, seconds), seconds)
+                for name, seconds in measured["per_page"].items()
+            }
+        self.costs[key] = measured
+
+    def save(self):
+        """Write the costs to the JSON file atomically."""
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.costs, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def _blend(self, previous, current):
+        """Exponential moving average step."""
+        return previous + self.smoothing * (current - previous)
+
+
+def choose_tier(costs, pages, deadline, signature):
+    """
+    Get the richest tier whose estimate fits in deadline seconds, with its
+    estimate. Estimates include setup, so they are compared against the
+    whole deadline. The plainest tier is the fallback when nothing fits.
+    """
+    for name, _, _ in QUALITY_TIERS:
+        estimate = costs.estimate(name, pages, signature)
+        if estimate <= deadline:
+            return name, estimate
+    name = QUALITY_TIERS[-1][0]
+    return name, costs.estimate(name, pages, signature)
+
+
+def render_within_deadline(
+    output_file,
+    deadline,
+    profile=None,
+    image_dir=None,
+    costs_file="hunt_render_costs.json",
+    **options,
+):
+    """
+    Render a hunt at the richest quality tier expected to finish within
+    deadline seconds, then update the measured costs with how long it took.
+    options are further ScavengerHuntGenerator arguments.
+    Returns (tier, estimated seconds, elapsed seconds).
+    """
+    start = time.perf_counter()
+    costs = RenderCosts(costs_file)
+    settings = get_output_profile(profile)
+    options.setdefault("measurer", TextMeasurer())
+
+    # Page counts come from the full plan; plainer tiers never need more pages.
+    # Planning is part of the measured setup, so the estimate already covers it
+    planner = ScavengerHuntGenerator(
+        output_file, image_dir=image_dir, profile=settings, **options
+    )
+    pages = planner.plan_pages()
+    signature = cost_signature(
+        settings, options.get("page_format", "letter"), bool(image_dir)
+    )
+    tier, estimate = choose_tier(costs, len(pages), deadline, signature)
+
+    overrides, thumbnails = next(
+        (overrides, thumbnails)
+        for name, overrides, thumbnails in QUALITY_TIERS
+        if name == tier
+    )
+    if tier == QUALITY_TIERS[0][0]:
+        generator = planner
+    else:
+        generator = ScavengerHuntGenerator(
+            output_file,
+            image_dir=image_dir if thumbnails else None,
+            profile={**settings, **overrides},
+            **options,
+        )
+        if not thumbnails and image_dir:
+            pages = generator.plan_pages()
+
+    timings = {}
+    for name in TIMED_RENDERERS:
+        attr = f"{name}_renderer"
+        setattr(generator, attr, _TimedRenderer(getattr(generator, attr), name, timings))
+
+    setup = time.perf_counter() - start
+    generator.draw_sheet(pages)
+    save_start = time.perf_counter()
+    generator.save()
+    timings["save"] = time.perf_counter() - save_start
+    elapsed = time.perf_counter() - start
+
+    costs.record(tier, signature, setup, timings, len(pages))
+    costs.save()
+    return tier, estimate, elapsed
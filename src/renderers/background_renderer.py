@@ -2,22 +2,37 @@
 src/scavenger_hunt/renderers/background_renderer.py
 Background renderer for scavenger hunt
 """
-import random
+import threading
 from reportlab.lib import colors
+from background_patterns import make_texture
+from output_profiles import get_output_profile
+
+# Guards pattern caches, which may be shared by renders on several threads
+_pattern_lock = threading.Lock()
 
 class BackgroundRenderer:
     """Renders the background for the scavenger hunt page."""
     
-    def __init__(self, canvas):
+    def __init__(self, canvas, profile=None, pattern_cache=None, seed=None):
         self.canvas = canvas
+        self.profile = get_output_profile(profile)
+        # Optional dict shared between documents so resident processes
+        # compute each page size's texture only once
+        self.pattern_cache = pattern_cache
+        # Textures are seeded per renderer, so concurrent renders never share RNG state
+        self.seed = seed
+        self._forms = {}  # texture key -> form name, for this renderer's canvas
     
     def draw(self, x, y, width, height):
         """Draw the full background with subtle pattern."""
         # Draw base gradient
-        self._draw_gradient_background(x, y, width, height)
+        steps = self.profile["background_gradient_steps"]
+        if steps:
+            self._draw_gradient_background(x, y, width, height, steps)
         
         # Draw subtle pattern
-        self._draw_subtle_pattern(x, y, width, height)
+        if self.profile["background_pattern"]:
+            self._draw_subtle_pattern(x, y, width, height)
     
     def _draw_gradient_background(self, x, y, width, height, steps=20):
         """Draw a gradient background for the entire page."""
@@ -25,7 +40,7 @@ class BackgroundRenderer:
         end_color = colors.Color(1.0, 1.0, 1.0)      # White
         
         for i in range(steps):
-            ratio = i / float(steps - 1)
+            ratio = i / float(max(steps - 1, 1))
             r = start_color.red + (end_color.red - start_color.red) * ratio
             g = start_color.green + (end_color.green - start_color.green) * ratio
             b = start_color.blue + (end_color.blue - start_color.blue) * ratio
@@ -40,22 +55,67 @@ class BackgroundRenderer:
             )
     
     def _draw_subtle_pattern(self, x, y, width, height):
-        """Draw a subtle dot pattern on the background."""
-        pattern_color = colors.Color(0.5, 0.5, 0.8, 0.05)
-        self.canvas.setFillColor(pattern_color)
-        
-        # Draw a grid of small dots
-        spacing = 15
-        dot_size = 0.8
-        
-        for i in range(int(width / spacing) + 1):
-            for j in range(int(height / spacing) + 1):
-                # Add some random offset for a more natural look
-                offset_x = random.uniform(-1.5, 1.5)
-                offset_y = random.uniform(-1.5, 1.5)
-                
-                dot_x = x + (i * spacing) + offset_x
-                dot_y = y + (j * spacing) + offset_y
-                
-                if dot_x >= x and dot_x <= x + width and dot_y >= y and dot_y <= y + height:
-                    self.canvas.circle(dot_x, dot_y, dot_size, fill=1, stroke=0)
+        """Draw the profile's background texture as a form reused on every page."""
+        style = self.profile["background_pattern"]
+        if style is True:
+            style = "dots"
+        key = (style, x, y, width, height, self.seed)
+
+        # The texture is written into the PDF once as a form XObject and
+        # every page refers to it, rather than repeating thousands of dots
+        form = self._forms.get(key)
+        if form is None:
+            form = self._forms[key] = f"BackgroundPattern{len(self._forms)}"
+            self.canvas.beginForm(form)
+            self._draw_texture(self._texture(key))
+            self.canvas.endForm()
+
+        # A form has no transparency resources of its own, so the texture is
+        # drawn opaque inside it and faded where the form is placed
+        self.canvas.saveState()
+        self.canvas.setFillAlpha(0.05)
+        self.canvas.setStrokeAlpha(0.05)
+        self.canvas.doForm(form)
+        self.canvas.restoreState()
+
+    def _texture(self, key):
+        """
+        Get the texture for a cache key with its path operators, computing
+        both at most once per cache.
+        """
+        if self.pattern_cache is None:
+            return self._make_texture(key)
+        with _pattern_lock:
+            texture = self.pattern_cache.get(key)
+            if texture is None:
+                texture = self.pattern_cache[key] = self._make_texture(key)
+        return texture
+
+    def _make_texture(self, key):
+        """Compute a texture and serialize it as one path, filled or stroked."""
+        style, x, y, width, height, seed = key
+        texture = make_texture(style, x, y, width, height, seed)
+        path = self.canvas.beginPath()
+        if "lines" in texture:
+            for x0, y0, x1, y1 in texture["lines"]:
+                path.moveTo(x0, y0)
+                path.lineTo(x1, y1)
+            texture["path"] = f"{path.getCode()} S"
+        else:
+            radius = texture["radius"]
+            for dot_x, dot_y in texture["circles"]:
+                path.circle(dot_x, dot_y, radius)
+            texture["path"] = f"{path.getCode()} f"
+        return texture
+
+    def _draw_texture(self, texture):
+        """Draw a texture's cached path operators in the pattern color."""
+        pattern_color = colors.Color(0.5, 0.5, 0.8)
+        if "lines" in texture:
+            self.canvas.setStrokeColor(pattern_color)
+            self.canvas.setLineWidth(texture["line_width"])
+        else:
+            self.canvas.setFillColor(pattern_color)
+        # Formatting thousands of curve coordinates is the slow part of
+        # drawing, so the operators are reused as a literal
+        self.canvas.addLiteral(texture["path"])
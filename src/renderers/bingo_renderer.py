@@ -0,0 +1,119 @@
+"""
+src/renderers/bingo_renderer.py
+Bingo card renderer for scavenger hunt
+"""
+
+from reportlab.lib import colors
+from categories import get_category_colors
+from font_manager import FontManager
+from output_profiles import get_output_profile
+from translations import get_text, translate_item
+
+
+class BingoRenderer:
+    """Renders a bingo card grid with category-tinted cells and fitted names."""
+
+    def __init__(self, canvas, layout, measurer, profile=None, language="en"):
+        self.canvas = canvas
+        self.layout = layout
+        self.measurer = measurer
+        self.profile = get_output_profile(profile)
+        self.language = language
+        # (text, font, box width, box height) -> (font size, lines); cards
+        # repeat the same names thousands of times, so each is fitted once
+        self._fits = {}
+
+    def draw(self, x, y, cell_size, grid, checkbox_renderer):
+        """Draw a card grid with its top-left corner at x, y."""
+        item_font = FontManager.get_item_font(style=self.profile["fonts"])
+        free_font = FontManager.get_category_font(style=self.profile["fonts"])
+        padding = self.layout.bingo_cell_padding
+        mark_size = self.layout.bingo_mark_size
+
+        self.canvas.saveState()
+        for row_index, row in enumerate(grid):
+            for col_index, cell in enumerate(row):
+                cell_x = x + col_index * cell_size
+                cell_y = y - (row_index + 1) * cell_size
+
+                # Tint the cell with its category's light gradient color
+                if cell is None:
+                    self.canvas.setFillColor(colors.Color(0.95, 0.95, 0.8))
+                else:
+                    tint = get_category_colors(cell[0])["gradient_end"]
+                    self.canvas.setFillColor(tint)
+                self.canvas.rect(cell_x, cell_y, cell_size, cell_size, fill=1, stroke=0)
+
+                if cell is None:
+                    label, font = get_text("bingo_free", self.language), free_font
+                else:
+                    label, font = translate_item(cell[1], self.language), item_font
+                    checkbox_renderer.draw(
+                        cell_x + padding,
+                        cell_y + cell_size - padding - mark_size,
+                        mark_size,
+                    )
+
+                # Names sit below the mark, centered in the rest of the cell
+                box_height = cell_size - 2 * padding - mark_size
+                font_size, lines = self.fit(
+                    label, font, cell_size - 2 * padding, box_height
+                )
+                line_height = font_size * 1.15
+                center_y = cell_y + padding + box_height / 2
+                first_y = center_y + (len(lines) - 1) * line_height / 2 - font_size / 3
+
+                self.canvas.setFillColor(colors.black)
+                for i, line in enumerate(lines):
+                    line_width = self.measurer.string_width(line, font, font_size)
+                    FontManager.draw_string(
+                        self.canvas,
+                        cell_x + (cell_size - line_width) / 2,
+                        first_y - i * line_height,
+                        line,
+                        font,
+                        font_size,
+                    )
+
+        # Draw all cell borders at once
+        size = len(grid)
+        self.canvas.setStrokeColor(colors.Color(0.3, 0.3, 0.5))
+        self.canvas.setLineWidth(1)
+        self.canvas.grid(
+            [x + i * cell_size for i in range(size + 1)],
+            [y - i * cell_size for i in range(size + 1)],
+        )
+        self.canvas.restoreState()
+
+    def fit(self, text, font, width, height):
+        """
+        Get the largest font size from the layout's bingo sizes at which text,
+        word-wrapped, fits width x height. Returns (font size, lines); text
+        too long even at the smallest size is wrapped at that size.
+        """
+        key = (text, font, width, height)
+        if key in self._fits:
+            return self._fits[key]
+
+        for font_size in self.layout.bingo_font_sizes:
+            lines = self._wrap(text, font, font_size, width)
+            fits = len(lines) * font_size * 1.15 <= height and all(
+                self.measurer.string_width(line, font, font_size) <= width
+                for line in lines
+            )
+            if fits:
+                break
+
+        self._fits[key] = (font_size, lines)
+        return self._fits[key]
+
+    def _wrap(self, text, font, font_size, width):
+        """Greedily wrap text on spaces into lines no wider than width."""
+        lines = []
+        for word in text.split():
+            candidate = f"{lines[-1]} {word}" if lines else word
+            if lines and self.measurer.string_width(candidate, font, font_size) <= width:
+                lines[-1] = candidate
+            else:
+                lines.append(word)
+        return lines
@@ -6,14 +6,21 @@ Category renderer for scavenger hunt
 from reportlab.lib import colors
 from categories import get_category_colors
 from font_manager import FontManager
+from output_profiles import get_output_profile
+from translations import translate_category, translate_item
 
 
 class CategoryRenderer:
     """Renders category sections with headers and items for the scavenger hunt."""
 
-    def __init__(self, canvas, layout):
+    def __init__(self, canvas, layout, image_cache=None, profile=None, language="en"):
         self.canvas = canvas
         self.layout = layout
+        self.image_cache = image_cache
+        self.profile = get_output_profile(profile)
+        # Categories and items stay keyed by their English catalog names;
+        # only the drawn text is translated
+        self.language = language
 
     def draw(self, x, y, category, items, checkbox_renderer, width):
         """Draw a complete category section with header and items."""
@@ -21,9 +28,9 @@ class CategoryRenderer:
         header_height = self._draw_header(x, y, category, color_scheme, width)
 
         # Add extra spacing after header
-        items_spacing = 8  # Reduced spacing after header to fit more content
+        items_spacing = self.layout.category_items_spacing
         items_height = self._draw_items(
-            x, y - header_height - items_spacing, items, checkbox_renderer
+            x, y - header_height - items_spacing, items, checkbox_renderer, width
         )
 
         return (
@@ -45,12 +52,13 @@ class CategoryRenderer:
 
         header_height = self.layout.category_header_height
         self._draw_rounded_gradient_background(
-            x, y - header_height, width, header_height, start_color, end_color, radius=6
+            x, y - header_height, width, header_height, start_color, end_color, radius=6,
+            steps=self.profile["header_gradient_steps"],
         )
 
         self.canvas.setFillColor(colors.black)
-        category_font = FontManager.get_category_font(category)
-        font_size = 15  # Increased from 14 to make category headers bigger
+        category_font = FontManager.get_category_font(category, self.profile["fonts"])
+        font_size = self.layout.category_font_size
         self.canvas.setFont(category_font, font_size)
 
         text_height = font_size * 0.75
@@ -58,10 +66,13 @@ class CategoryRenderer:
             y - (header_height / 2) - (text_height / 3) - 2
         )  # Adjusted to move text down slightly
 
-        text_width = self.canvas.stringWidth(category, category_font, font_size)
+        label = translate_category(category, self.language)
+        text_width = FontManager.string_width(label, category_font, font_size)
         text_x = x + (width - text_width) / 2
 
-        self.canvas.drawString(text_x, text_y, category)
+        FontManager.draw_string(
+            self.canvas, text_x, text_y, label, category_font, font_size
+        )
 
         self.canvas.setStrokeColor(colors.black)
         self.canvas.setLineWidth(1)
@@ -92,23 +103,33 @@ class CategoryRenderer:
 
         return header_height
 
-    def _draw_items(self, x, y, items, checkbox_renderer):
+    def _draw_items(self, x, y, items, checkbox_renderer, width):
         """Draw all items for a category with checkboxes."""
-        total_height = 0
-        item_font = FontManager.get_item_font()
-        font_size = 14  # Increased font size from 12 to 14
+        item_font = FontManager.get_item_font(style=self.profile["fonts"])
+        font_size = self.layout.item_font_size
         
         # Create compact layout for categories with many items
-        is_large_category = len(items) > 12
-        item_height = self.layout.item_height + (4 if not is_large_category else 2)  # Increased spacing
+        item_height = self.layout.get_item_height(len(items))
+
+        # Large categories may be split into side-by-side sub-columns
+        rows = self.layout.get_row_count(len(items))
+        sub_column_width = width / self.layout.get_sub_columns(len(items))
+
+        text_offset = self.layout.item_indent + self.layout.checkbox_text_offset
+        thumbnail_offset = text_offset
+        if self.image_cache is not None:
+            # Leave room for a thumbnail on every row so the names stay aligned
+            text_offset += self.layout.thumbnail_size + self.layout.thumbnail_gap
 
         for i, item in enumerate(items):
-            item_y = y - (i * item_height)
+            sub_column, row = divmod(i, rows)
+            item_x = x + sub_column * sub_column_width
+            item_y = y - (row * item_height)
 
             # Draw checkbox - improved vertical alignment
             checkbox_y = item_y - self.layout.checkbox_size + 2
             checkbox_renderer.draw(
-                x + self.layout.item_indent, checkbox_y, self.layout.checkbox_size
+                item_x + self.layout.item_indent, checkbox_y, self.layout.checkbox_size
             )
 
             # Draw item text - improved vertical alignment
@@ -117,17 +138,33 @@ class CategoryRenderer:
                 checkbox_y + (self.layout.checkbox_size / 2) - (font_size / 3)
             )
 
-            self.canvas.setFont(item_font, font_size)
+            if self.image_cache is not None:
+                self._draw_thumbnail(
+                    item_x + thumbnail_offset,
+                    checkbox_y + self.layout.checkbox_size / 2,
+                    item,
+                )
+
             self.canvas.setFillColor(colors.black)
-            self.canvas.drawString(
-                x + self.layout.item_indent + self.layout.checkbox_text_offset,
+            FontManager.draw_string(
+                self.canvas,
+                item_x + text_offset,
                 text_baseline,
-                item,
+                translate_item(item, self.language),
+                item_font,
+                font_size,
             )
 
-            total_height += item_height
+        return rows * item_height
+
+    def _draw_thumbnail(self, x, center_y, item):
+        """Draw an item's thumbnail vertically centered on center_y."""
+        size = self.layout.thumbnail_size
+        thumbnail = self.image_cache.get_thumbnail(item, size, size)
+        if thumbnail is None:
+            return
 
-        return total_height
+        self.canvas.drawImage(thumbnail, x, center_y - size / 2, size, size)
 
     def _draw_rounded_gradient_background(
         self, x, y, width, height, start_color, end_color, radius=6, steps=10
@@ -139,7 +176,7 @@ class CategoryRenderer:
         # First draw the gradient in standard rectangles
         segment_height = height / steps
         for i in range(steps):
-            ratio = i / float(steps - 1)
+            ratio = i / float(max(steps - 1, 1))
             r = start_color.red + (end_color.red - start_color.red) * ratio
             g = start_color.green + (end_color.green - start_color.green) * ratio
             b = start_color.blue + (end_color.blue - start_color.blue) * ratio
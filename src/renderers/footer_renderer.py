@@ -4,39 +4,88 @@ Footer renderer for scavenger hunt
 """
 from reportlab.lib import colors
 from font_manager import FontManager
+from output_profiles import get_output_profile
+from translations import get_text
 
 class FooterRenderer:
     """Renders the footer section for the scavenger hunt page."""
     
-    def __init__(self, canvas):
+    def __init__(self, canvas, profile=None, language="en"):
         self.canvas = canvas
+        self.profile = get_output_profile(profile)
+        self.language = language
     
     def draw(self, x, y, total_items):
         """Draw footer with total count and social media info."""
         self.canvas.saveState()
         
         # Draw total count text
-        footer_font = FontManager.get_footer_font()
+        footer_font = FontManager.get_footer_font(self.profile["fonts"])
         self.canvas.setFont(footer_font, 11)
         self.canvas.setFillColor(colors.Color(0.3, 0.3, 0.5))
         
-        footer_text = f"How many specimens can you find? Record your total here: ____ / {total_items}"
-        footer_width = self.canvas.stringWidth(footer_text, footer_font, 11)
+        footer_text = get_text("footer_total", self.language).format(total=total_items)
+        footer_width = FontManager.string_width(footer_text, footer_font, 11)
         
-        self.canvas.drawString(
+        FontManager.draw_string(
+            self.canvas,
             x - (footer_width / 2), 
             y, 
-            footer_text
+            footer_text, footer_font, 11
         )
         
         # Draw social media text
-        social_text = "Share your discovery journey with us on social media @TheInsectAsylum"
-        social_width = self.canvas.stringWidth(social_text, footer_font, 11)
+        social_text = get_text("footer_social", self.language)
+        social_width = FontManager.string_width(social_text, footer_font, 11)
         
-        self.canvas.drawString(
+        FontManager.draw_string(
+            self.canvas,
             x - (social_width / 2), 
             y - 20, 
-            social_text
+            social_text, footer_font, 11
         )
         
-        self.canvas.restoreState()
\ No newline at end of file
+        self.canvas.restoreState()
+    
+    def draw_sheet_code(self, page_width, layout, serial, matrix):
+        """Draw a sheet's QR code in the bottom-right corner and its serial below the footer."""
+        self.canvas.saveState()
+        
+        # White backing keeps the quiet zone clear of the background pattern
+        size = layout.qr_size
+        x = page_width - layout.qr_margin - size
+        y = layout.qr_margin
+        self.canvas.setFillColor(colors.white)
+        self.canvas.rect(x, y, size, size, fill=1, stroke=0)
+        
+        # Draw all dark modules as one path, merging horizontal runs. Rects
+        # are written in whole-module units under a scaling transform, which
+        # is much cheaper than formatting every corner as a float
+        count = len(matrix)
+        module = size / (count + 2 * layout.qr_quiet_zone)
+        left = x + layout.qr_quiet_zone * module
+        top = y + size - layout.qr_quiet_zone * module
+        rects = []
+        for row_index, row in enumerate(matrix):
+            col = 0
+            while col < count:
+                if not row[col]:
+                    col += 1
+                    continue
+                start = col
+                while col < count and row[col]:
+                    col += 1
+                rects.append(f"{start} {-row_index - 1} {col - start} 1 re")
+        self.canvas.saveState()
+        self.canvas.transform(module, 0, 0, module, left, top)
+        self.canvas.setFillColor(colors.black)
+        self.canvas.addLiteral("\n".join(rects) + "\nf")
+        self.canvas.restoreState()
+        
+        # Draw the serial centered under the footer text
+        serial_font = FontManager.get_body_font(self.profile["fonts"])
+        self.canvas.setFont(serial_font, 8)
+        self.canvas.setFillColor(colors.Color(0.3, 0.3, 0.5))
+        self.canvas.drawCentredString(page_width / 2, layout.footer_y - 34, serial)
+        
+        self.canvas.restoreState()
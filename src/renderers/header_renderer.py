@@ -6,40 +6,63 @@ Header renderer for scavenger hunt
 from reportlab.lib import colors
 from reportlab.lib.units import inch
 from font_manager import FontManager
+from output_profiles import get_output_profile
 
 
 class HeaderRenderer:
     """Renders the title and instructions for the scavenger hunt page."""
 
-    def __init__(self, canvas):
+    def __init__(self, canvas, profile=None):
         self.canvas = canvas
+        self.profile = get_output_profile(profile)
+
+    @staticmethod
+    def measure(instructions, page_width, measurer=None, profile=None):
+        """Get the height of the first-page header without drawing it."""
+        body_font = FontManager.get_body_font(get_output_profile(profile)["fonts"])
+        if measurer is not None:
+            instructions_width = measurer.string_width(instructions, body_font, 11)
+        else:
+            instructions_width = FontManager.string_width(instructions, body_font, 11)
+
+        # Long instructions wrap onto a second line
+        if instructions_width > page_width - 2 * inch:
+            return 2.7 * inch
+        return 2.5 * inch
 
     def draw(self, title, subtitle, instructions, page_width, page_height):
         """Draw title, subtitle, and instructions."""
         # Draw title
-        title_font = FontManager.get_title_font()
+        title_font = FontManager.get_title_font(self.profile["fonts"])
         self.canvas.setFont(title_font, 24)
         self.canvas.setFillColor(colors.Color(0.3, 0.3, 0.5))
-        title_width = self.canvas.stringWidth(title, title_font, 24)
+        title_width = FontManager.string_width(title, title_font, 24)
 
         # Add title with shadow effect
-        self.canvas.setFillColor(colors.Color(0.3, 0.3, 0.5, 0.3))
-        self.canvas.drawString(
-            (page_width - title_width) / 2 + 2, page_height - 1.3 * inch - 2, title
-        )
+        if self.profile["title_shadow"]:
+            self.canvas.setFillColor(colors.Color(0.3, 0.3, 0.5, 0.3))
+            FontManager.draw_string(
+                self.canvas,
+                (page_width - title_width) / 2 + 2, page_height - 1.3 * inch - 2,
+                title, title_font, 24,
+            )
 
         self.canvas.setFillColor(colors.Color(0.3, 0.3, 0.5))
-        self.canvas.drawString(
-            (page_width - title_width) / 2, page_height - 1.3 * inch, title
+        FontManager.draw_string(
+            self.canvas,
+            (page_width - title_width) / 2, page_height - 1.3 * inch,
+            title, title_font, 24,
         )
 
         # Draw subtitle
-        subtitle_font = FontManager.get_subtitle_font()
+        subtitle_font = FontManager.get_subtitle_font(self.profile["fonts"])
         self.canvas.setFont(subtitle_font, 18)
         self.canvas.setFillColor(colors.Color(0.4, 0.4, 0.6))
-        subtitle_width = self.canvas.stringWidth(subtitle, subtitle_font, 18)
-        self.canvas.drawString(
-            (page_width - subtitle_width) / 2, page_height - 1.7 * inch, subtitle
+        subtitle_width = FontManager.string_width(subtitle, subtitle_font, 18)
+        FontManager.draw_string(
+            self.canvas,
+            (page_width - subtitle_width) / 2, page_height - 1.7 * inch,
+            subtitle, subtitle_font, 18,
         )
 
         # Draw decorative line under subtitle
@@ -54,10 +77,10 @@ class HeaderRenderer:
         )
 
         # Draw instructions (with handling for long text)
-        body_font = FontManager.get_body_font()
+        body_font = FontManager.get_body_font(self.profile["fonts"])
         self.canvas.setFont(body_font, 11)
         self.canvas.setFillColor(colors.black)
-        instructions_width = self.canvas.stringWidth(instructions, body_font, 11)
+        instructions_width = FontManager.string_width(instructions, body_font, 11)
 
         # Calculate instruction position and handle wrapping
         if instructions_width > page_width - 2 * inch:
@@ -67,7 +90,7 @@ class HeaderRenderer:
             current_width = 0
 
             for word in words:
-                word_width = self.canvas.stringWidth(word + " ", body_font, 11)
+                word_width = FontManager.string_width(word + " ", body_font, 11)
                 if current_width + word_width < page_width - 2 * inch:
                     line1.append(word)
                     current_width += word_width
@@ -77,22 +100,27 @@ class HeaderRenderer:
             line1_text = " ".join(line1)
             line2_text = " ".join(line2)
 
-            line1_width = self.canvas.stringWidth(line1_text, body_font, 11)
-            line2_width = self.canvas.stringWidth(line2_text, body_font, 11)
+            line1_width = FontManager.string_width(line1_text, body_font, 11)
+            line2_width = FontManager.string_width(line2_text, body_font, 11)
 
-            self.canvas.drawString(
-                (page_width - line1_width) / 2, page_height - 2.2 * inch, line1_text
+            FontManager.draw_string(
+                self.canvas,
+                (page_width - line1_width) / 2, page_height - 2.2 * inch,
+                line1_text, body_font, 11,
             )
-            self.canvas.drawString(
-                (page_width - line2_width) / 2, page_height - 2.4 * inch, line2_text
+            FontManager.draw_string(
+                self.canvas,
+                (page_width - line2_width) / 2, page_height - 2.4 * inch,
+                line2_text, body_font, 11,
             )
 
             return 2.7 * inch  # Return the position where content should start
         else:
-            self.canvas.drawString(
+            FontManager.draw_string(
+                self.canvas,
                 (page_width - instructions_width) / 2,
                 page_height - 2.2 * inch,
-                instructions,
+                instructions, body_font, 11,
             )
             return 2.5 * inch  # Return the position where content should start
 
@@ -104,4 +132,9 @@ class HeaderRenderer:
         
         self.canvas.restoreState()
 
+        return self.measure_page_header()
+
+    @staticmethod
+    def measure_page_header():
+        """Get the height of the continuation-page header."""
         return 0.75 * inch  # Return a smaller position where content should start
\ No newline at end of file
@@ -0,0 +1,141 @@
+"""
+src/sheet_batch.py
+Renders large print runs of serialized sheets with QR codes
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from compiled_catalog import catalog_options, open_catalog
+from hunt_generator import DEFAULT_INSTRUCTIONS, ScavengerHuntGenerator, plan_pages
+from hunt_pagination import group_items
+from items import ITEMS
+from multi_format import format_output_file
+from sheet_codes import (
+    DEFAULT_REDEEM_URL,
+    SerialAllocator,
+    format_serial,
+    item_set_id,
+    qr_matrices,
+    sheet_payload,
+)
+from text_metrics import TextMeasurer
+
+
+def render_chunk(
+    output_file,
+    count,
+    pages,
+    variant,
+    db_path,
+    base_url,
+    options,
+    first_serial=None,
+    dependency_index=None,
+):
+    """
+    Render count sheets into one PDF (runs in a worker).
+
+    Unless first_serial is given, the worker reserves its own block of
+    serials, so chunks never need to coordinate beyond the allocator's lock.
+    All sheets share one canvas and one background pattern cache, so repeated
+    decorations are drawn from memory. The PDF is written to a temporary file
+    and moved into place, so a rerun of an interrupted chunk replaces it whole.
+    With a DependencyIndex, the finished file is recorded with its serials.
+    """
+    options = catalog_options(options)
+    items = options["items"]
+    if first_serial is None:
+        numbers = SerialAllocator(db_path).reserve(count)
+    else:
+        numbers = range(first_serial, first_serial + count)
+    serials = [format_serial(n) for n in numbers]
+    item_set = item_set_id(items)
+    matrices = qr_matrices(
+        sheet_payload(serial, variant, item_set, base_url) for serial in serials
+    )
+
+    tmp_file = f"{output_file}.{os.getpid()}.tmp"
+    generator = ScavengerHuntGenerator(tmp_file, pattern_cache={}, **options)
+    if pages is None:
+        pages = generator.plan_pages()
+    for serial, matrix in zip(serials, matrices):
+        generator.draw_sheet(pages, (serial, matrix))
+    generator.canvas.save()
+    os.replace(tmp_file, output_file)
+    if dependency_index is not None:
+        dependency_index.record(
+            generator,
+            output_file,
+            sheets={
+                "count": count,
+                "first_serial": numbers[0],
+                "variant": variant,
+                "serial_db": os.path.abspath(db_path),
+                "base_url": base_url,
+            },
+        )
+    return output_file, serials[0], serials[-1]
+
+
+def render_sheet_batch(
+    count,
+    output_file="specimen_scavenger_hunt.pdf",
+    variant="standard",
+    items=None,
+    image_dir=None,
+    page_format="letter",
+    profile=None,
+    sheets_per_file=500,
+    max_workers=None,
+    db_path="hunt_serials.sqlite3",
+    base_url=DEFAULT_REDEEM_URL,
+    catalog_file=None,
+    dependency_index=None,
+):
+    """
+    Render count serialized copies of the hunt, split into files of at most
+    sheets_per_file sheets that are rendered in parallel. The page plan is
+    computed once and shared. Returns (path, first serial, last serial) per file.
+    With catalog_file, a compile_catalog() file, workers map the catalog
+    instead of receiving a pickled copy of the items.
+    dependency_index is an optional DependencyIndex recording every file.
+    """
+    if catalog_file is not None:
+        groups = open_catalog(catalog_file).groups()
+        worker_items = {"catalog_file": catalog_file}
+    else:
+        items = ITEMS if items is None else items
+        groups = group_items(items)
+        worker_items = {"items": items}
+    measurer = TextMeasurer()
+
+    pages = plan_pages(
+        groups, page_format, DEFAULT_INSTRUCTIONS, measurer, profile=profile
+    )
+    options = {
+        **worker_items,
+        "image_dir": image_dir,
+        "page_format": page_format,
+        "profile": profile,
+    }
+
+    chunks = math.ceil(count / sheets_per_file)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                render_chunk,
+                format_output_file(output_file, f"{variant}_{index + 1:03d}"),
+                min(sheets_per_file, count - index * sheets_per_file),
+                pages,
+                variant,
+                db_path,
+                base_url,
+                options,
+                None,
+                dependency_index,
+            )
+            for index in range(chunks)
+        ]
+        return [future.result() for future in futures]
@@ -0,0 +1,223 @@
+"""
+src/sheet_codes.py
+Per-sheet serial numbers and QR code matrices for prize redemption
+"""
+
+import hashlib
+import sqlite3
+from urllib.parse import urlencode
+
+from reportlab.graphics.barcode import qrencoder
+
+# Crockford base32: no I, L, O or U, so serials are easy to read back
+SERIAL_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+SERIAL_PREFIX = "TIA"
+SERIAL_DIGITS = 6
+SERIAL_LIMIT = 32**SERIAL_DIGITS  # Serials are numbered below this
+
+DEFAULT_REDEEM_URL = "https://theinsectasylum.com/hunt"
+
+
+def format_serial(number):
+    """Format a serial number as e.g. TIA-0004ZK-7, ending in a check character."""
+    if not 0 <= number < SERIAL_LIMIT:
+        # Wrapping around would print a serial already given out
+        raise ValueError(
+            f"Serial number {number} does not fit in {SERIAL_DIGITS} characters"
+        )
+    digits = []
+    for _ in range(SERIAL_DIGITS):
+        number, remainder = divmod(number, len(SERIAL_ALPHABET))
+        digits.append(SERIAL_ALPHABET[remainder])
+    body = "".join(reversed(digits))
+
+    # Luhn mod 32 check character catches single typos and swapped neighbors
+    total = 0
+    for i, char in enumerate(reversed(body)):
+        value = SERIAL_ALPHABET.index(char) * (2 if i % 2 == 0 else 1)
+        total += value // 32 + value % 32
+    check = SERIAL_ALPHABET[(32 - total % 32) % 32]
+
+    return f"{SERIAL_PREFIX}-{body}-{check}"
+
+
+def item_set_id(items):
+    """Get a short stable id for a sheet's (category, item) selection."""
+    digest = hashlib.sha1()
+    for category, item in items:
+        digest.update(f"{category}\0{item}\n".encode("utf-8"))
+    return digest.hexdigest()[:10]
+
+
+def sheet_payload(serial, variant, item_set, base_url=DEFAULT_REDEEM_URL):
+    """Get the URL encoded in a sheet's QR code; item_set is from item_set_id()."""
+    query = urlencode({"s": serial, "v": variant, "i": item_set})
+    return f"{base_url}?{query}"
+
+
+class SerialAllocator:
+    """
+    Hands out serial numbers from a counter in a local SQLite file.
+
+    Each reservation runs in an immediate (write-locked) transaction, so
+    concurrent batch workers, even in separate processes, always receive
+    disjoint blocks. Workers reserve whole blocks to keep lock traffic low.
+    """
+
+    def __init__(self, db_path="hunt_serials.sqlite3", counter="sheets"):
+        self.db_path = db_path
+        self.counter = counter
+
+        connection = self._connect()
+        with connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS counters "
+                "(name TEXT PRIMARY KEY, next INTEGER NOT NULL)"
+            )
+            connection.execute(
+                "INSERT OR IGNORE INTO counters (name, next) VALUES (?, 1)",
+                (counter,),
+            )
+        connection.close()
+
+    def reserve(self, count):
+        """Reserve count consecutive serial numbers and return them as a range."""
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            (start,) = connection.execute(
+                "SELECT next FROM counters WHERE name = ?", (self.counter,)
+            ).fetchone()
+            if start + count > SERIAL_LIMIT:
+                raise ValueError(
+                    f"Cannot reserve {count} serials: only "
+                    f"{SERIAL_LIMIT - start} are left in the {self.counter!r} counter"
+                )
+            connection.execute(
+                "UPDATE counters SET next = ? WHERE name = ?",
+                (start + count, self.counter),
+            )
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        finally:
+            connection.close()
+        return range(start, start + count)
+
+    def _connect(self):
+        """Open a connection that waits for, rather than fails on, other writers."""
+        connection = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        return connection
+
+
+def qr_matrices(payloads, error_level="M"):
+    """
+    Encode many payloads as QR module matrices (lists of rows of booleans).
+
+    Sheet URLs in a batch all have the same length, so the QR version and
+    mask pattern are chosen once, from the longest payload, instead of being
+    searched for every code (the mask search alone encodes each code 8 times).
+    Everything else that does not depend on the payload is also built once:
+    the finder, timing and format modules, the order data bits are placed in
+    and the mask. Each code then only needs its codewords, with error
+    correction computed from lookup tables.
+    """
+    payloads = list(payloads)
+    if not payloads:
+        return []
+
+    level = getattr(qrencoder.QRErrorCorrectLevel, error_level)
+    probe = qrencoder.QRCode(None, level)
+    probe.addData(max(payloads, key=len))
+    probe.make()
+    version = probe.version
+    mask = probe.getBestMaskPattern()
+
+    template = qrencoder.QRCode(version, level)
+    template.addData(payloads[0])
+    template.makeImpl(False, mask)
+    base = [[bool(module) for module in row] for row in template.modules]
+    positions = template.dataPosIterator()
+    mask_function = qrencoder.QRUtil.getMask(mask)
+    flips = [bool(mask_function(row, col)) for col, row in positions]
+    blocks = qrencoder.QRRSBlock.getRSBlocks(version, level)
+
+    matrices = []
+    for payload in payloads:
+        codewords = _codewords(payload.encode("utf-8"), version, blocks)
+        bits = [
+            bool(codeword & bit)
+            for codeword in codewords
+            for bit in (0x80, 0x40, 0x20, 0x10, 0x08, 0x04, 0x02, 0x01)
+        ]
+        bits.extend([False] * (len(positions) - len(bits)))
+        matrix = [row[:] for row in base]
+        for (col, row), flip, bit in zip(positions, flips, bits):
+            matrix[row][col] = bit != flip
+        matrices.append(matrix)
+    return matrices
+
+
+def _codewords(data, version, blocks):
+    """
+    Get the interleaved data and error correction codewords for a byte-mode
+    payload, in the order they are placed in the symbol.
+    """
+    capacity = sum(block.dataCount for block in blocks)
+    length_bits = 8 if version < 10 else 16
+    value = (0b0100 << length_bits) | len(data)
+    bit_count = 4 + length_bits + 8 * len(data)
+    if bit_count > capacity * 8:
+        raise ValueError(f"Payload too long for a version {version} QR code")
+    value = (value << 8 * len(data)) | int.from_bytes(data, "big")
+
+    # Terminator, then zero bits to a byte boundary, then alternating pad bytes
+    padding = min(4, capacity * 8 - bit_count)
+    padding += -(bit_count + padding) % 8
+    bit_count += padding
+    value <<= padding
+    codewords = list(value.to_bytes(bit_count // 8, "big"))
+    pads = (0xEC, 0x11)
+    codewords.extend(pads[i % 2] for i in range(capacity - len(codewords)))
+
+    data_blocks = []
+    ec_blocks = []
+    offset = 0
+    for block in blocks:
+        block_data = codewords[offset : offset + block.dataCount]
+        offset += block.dataCount
+        data_blocks.append(block_data)
+        ec_blocks.append(_error_correction(block_data, block.totalCount - block.dataCount))
+
+    interleaved = []
+    for group in (data_blocks, ec_blocks):
+        for i in range(max(len(block) for block in group)):
+            interleaved.extend(block[i] for block in group if i < len(block))
+    return interleaved
+
+
+_generator_logs = {}  # error correction length -> generator polynomial as logs
+
+
+def _error_correction(data, length):
+    """Get the Reed-Solomon error correction codewords for one block."""
+    exp, log = qrencoder.EXP_TABLE, qrencoder.LOG_TABLE
+    generator = _generator_logs.get(length)
+    if generator is None:
+        polynomial = qrencoder.QRUtil.getErrorCorrectPolynomial(length)
+        generator = _generator_logs[length] = [
+            log[polynomial.get(i)] for i in range(1, polynomial.getLength())
+        ]
+
+    # Polynomial division by the generator, one data codeword at a time
+    remainder = [0] * length
+    for codeword in data:
+        factor = codeword ^ remainder.pop(0)
+        remainder.append(0)
+        if factor:
+            factor_log = log[factor]
+            for i, generator_log in enumerate(generator):
+                remainder[i] ^= exp[(factor_log + generator_log) % 255]
+    return remainder
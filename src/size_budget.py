@@ -0,0 +1,95 @@
+"""
+src/size_budget.py
+Measured file sizes and byte budgets for output profiles
+"""
+
+import io
+import re
+
+from hunt_generator import ScavengerHuntGenerator
+from output_profiles import get_output_profile
+
+# Page elements that can be switched off, with the settings that remove them
+PAGE_ELEMENTS = {
+    "background pattern": {"background_pattern": False},
+    "background gradient": {"background_gradient_steps": 0},
+    "category header gradients": {"header_gradient_steps": 1},
+    "title shadow": {"title_shadow": False},
+    "decorative corners": {"corners": False},
+    "embedded fonts": {"fonts": "standard"},
+}
+
+# Simplifications applied in order, least visible first, to meet a budget
+BUDGET_STEPS = [
+    ("no background pattern", {"background_pattern": False}),
+    ("no title shadow", {"title_shadow": False}),
+    ("coarser gradients", {"background_gradient_steps": 4, "header_gradient_steps": 2}),
+    ("regular and bold faces only", {"fonts": "dejavu-minimal"}),
+    ("flat backgrounds", {"background_gradient_steps": 1, "header_gradient_steps": 1}),
+    ("built-in PDF fonts", {"fonts": "standard"}),
+]
+
+# Background jitter changes the file size from render to render, so every
+# measured render uses the same pattern seed
+MEASUREMENT_SEED = 1
+
+SIZE_UNITS = {"": 1, "B": 1, "KB": 1024, "MB": 1024 * 1024}
+
+
+def parse_size(text):
+    """Parse a byte size such as 150000, 150KB or 1.5MB."""
+    match = re.fullmatch(r"\s*([\d.]+)\s*([KM]?B?)\s*", text.upper())
+    if not match:
+        raise ValueError(f"Invalid size {text!r}")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2)])
+
+
+def render_bytes(profile=None, **options):
+    """Render a hunt in memory with a fixed pattern seed and return the PDF bytes."""
+    options.setdefault("seed", MEASUREMENT_SEED)
+    buffer = io.BytesIO()
+    generator = ScavengerHuntGenerator(buffer, profile=profile, **options)
+    generator.generate_hunt_pdf()
+    return buffer.getvalue()
+
+
+def element_sizes(profile=None, **options):
+    """
+    Measure how many bytes each page element adds to the file by rendering
+    once with every element and once without each one.
+    Returns (total size, [(element, bytes), ...]) sorted largest first.
+    """
+    settings = get_output_profile(profile)
+    total = len(render_bytes(settings, **options))
+
+    contributions = []
+    for element, overrides in PAGE_ELEMENTS.items():
+        if all(settings[key] == value for key, value in overrides.items()):
+            continue  # Already absent from this profile
+        without = len(render_bytes({**settings, **overrides}, **options))
+        contributions.append((element, total - without))
+
+    contributions.sort(key=lambda entry: entry[1], reverse=True)
+    return total, contributions
+
+
+def fit_budget(budget, profile="web", **options):
+    """
+    Render with the profile, simplifying step by step until the PDF fits in
+    budget bytes. Returns (pdf bytes, settings used, steps applied); the
+    result can still exceed the budget once every step is applied.
+    """
+    settings = dict(get_output_profile(profile))
+    data = render_bytes(settings, **options)
+    applied = []
+
+    for step, overrides in BUDGET_STEPS:
+        if len(data) <= budget:
+            break
+        if all(settings[key] == value for key, value in overrides.items()):
+            continue
+        settings.update(overrides)
+        applied.append(step)
+        data = render_bytes(settings, **options)
+
+    return data, settings, applied
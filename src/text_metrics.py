@@ -0,0 +1,42 @@
+"""
+src/text_metrics.py
+Cached text and category block measurements shared across renders
+"""
+
+import threading
+
+from font_manager import FontManager
+
+
+class TextMeasurer:
+    """
+    Memoizes string widths and category block heights so repeated layouts
+    (several page formats, optimizer passes) measure each string only once.
+    Lookups are lock-free; misses are measured and stored under a lock, so
+    one measurer can be shared by renders running on several threads.
+    """
+
+    def __init__(self):
+        self._widths = {}
+        self._heights = {}
+        self._lock = threading.Lock()
+
+    def string_width(self, text, font_name, font_size):
+        """Get the width of text in points, measuring it at most once."""
+        key = (text, font_name, font_size)
+        width = self._widths.get(key)
+        if width is None:
+            width = FontManager.string_width(text, font_name, font_size)
+            with self._lock:
+                self._widths[key] = width
+        return width
+
+    def category_height(self, layout, item_count):
+        """Get the height of a category block with item_count items."""
+        key = (layout.get_block_key(), item_count)
+        height = self._heights.get(key)
+        if height is None:
+            height = layout.get_category_height(item_count)
+            with self._lock:
+                self._heights[key] = height
+        return height
@@ -0,0 +1,350 @@
+"""
+src/translations.py
+Translation tables for hunt text, categories and items
+"""
+
+# Catalog names (categories and items) are the English keys from items.py.
+# Missing entries fall back to English.
+TRANSLATIONS = {
+    "en": {
+        "title": "The Insect Asylum Collection",
+        "subtitle": "Specimen Scavenger Hunt",
+        "instructions": (
+            "Explore our collection and check off each fascinating specimen as you find it!\n"
+            "Items are color-coded by category to help guide your search."
+        ),
+        "footer_total": (
+            "How many specimens can you find? Record your total here: ____ / {total}"
+        ),
+        "footer_social": (
+            "Share your discovery journey with us on social media @TheInsectAsylum"
+        ),
+        "bingo_subtitle": "Specimen Bingo",
+        "bingo_instructions": (
+            "Find a specimen, then tick its square. {size} in a row wins!"
+        ),
+        "bingo_free": "FREE",
+        "bingo_card": "Card {number}",
+        "call_sheet_subtitle": "Bingo Call Sheet",
+        "call_sheet_instructions": "Tick each specimen as it is called.",
+        "categories": {},
+        "items": {},
+    },
+    "es": {
+        "title": "The Insect Asylum Collection",
+        "subtitle": "Búsqueda de Especímenes",
+        "instructions": (
+            "¡Explora nuestra colección y marca cada espécimen fascinante cuando lo encuentres!\n"
+            "Los objetos tienen colores según su categoría para guiar tu búsqueda."
+        ),
+        "footer_total": (
+            "¿Cuántos especímenes puedes encontrar? Anota tu total aquí: ____ / {total}"
+        ),
+        "footer_social": (
+            "Comparte tu aventura con nosotros en redes sociales @TheInsectAsylum"
+        ),
+        "bingo_subtitle": "Bingo de Especímenes",
+        "bingo_instructions": (
+            "Encuentra un espécimen y marca su casilla. ¡{size} en línea gana!"
+        ),
+        "bingo_free": "LIBRE",
+        "bingo_card": "Cartón {number}",
+        "call_sheet_subtitle": "Hoja de Cantos del Bingo",
+        "call_sheet_instructions": "Marca cada espécimen cuando se cante.",
+        "categories": {
+            "Minerals & Fossils": "Minerales y Fósiles",
+            "Shells & Marine": "Conchas y Vida Marina",
+            "Plant Materials": "Materiales Vegetales",
+            "Preserved Specimens": "Especímenes Preservados",
+            "Animal Parts": "Partes de Animales",
+            "Bones & Skulls": "Huesos y Cráneos",
+            "Resin Replicas": "Réplicas de Resina",
+            "Miscellaneous": "Varios",
+        },
+        "items": {
+            "Dinosaur Fossil": "Fósil de dinosaurio",
+            "Blue Calcite": "Calcita azul",
+            "Honey Calcite": "Calcita miel",
+            "Labradorite": "Labradorita",
+            "Spectralite": "Espectrolita",
+            "Red Ammonite": "Amonita roja",
+            "Purple Agate": "Ágata morada",
+            "Hourglass Selenite": "Selenita de reloj de arena",
+            "Desert Rose Crystal": "Cristal rosa del desierto",
+            "Wulfenite Crystal": "Cristal de wulfenita",
+            "Yellow Dog Conch Shell": "Caracola perro amarilla",
+            "Butter Clam Shell": "Concha de almeja mantequilla",
+            "Brooch Clamshell": "Concha de almeja broche",
+            "Conch Shell Eggs": "Huevos de caracola",
+            "Horseshoe Crab": "Cangrejo herradura",
+            "Shark Jaw": "Mandíbula de tiburón",
+            "Sugar Pinecones": "Piñas de pino azucarero",
+            "Pine Cones": "Piñas de pino",
+            "Bottle Tree Seed Pods": "Vainas de árbol botella",
+            "Moss": "Musgo",
+            "Okra Seed Pods": "Vainas de okra",
+            "Driftwood": "Madera de deriva",
+            "Duckling": "Patito",
+            "Mummified Duckling": "Patito momificado",
+            "Chipmunk": "Ardilla listada",
+            "Opossum": "Zarigüeya",
+            "Chameleon": "Camaleón",
+            "Snakeskin": "Piel de serpiente",
+            "Chick": "Pollito",
+            "Weasel": "Comadreja",
+            "Fox Head": "Cabeza de zorro",
+            "Chinese Water Dragon": "Dragón de agua chino",
+            "Fox Tails": "Colas de zorro",
+            "Macaw Feathers": "Plumas de guacamayo",
+            "Goose Feathers": "Plumas de ganso",
+            "Turtle Shell": "Caparazón de tortuga",
+            "Bird's Nest": "Nido de pájaro",
+            "Wasp Nest": "Avispero",
+            "Cobra Skin": "Piel de cobra",
+            "Butterfly And Moth Wings": "Alas de mariposa y polilla",
+            "Snake Shed": "Muda de serpiente",
+            "Beaver Paw": "Pata de castor",
+            "Rabbit Pelt": "Piel de conejo",
+            "Coyote Tail": "Cola de coyote",
+            "Raccoon Pelt": "Piel de mapache",
+            "Bobcat Hyde": "Piel de lince rojo",
+            "Raccoon Tail": "Cola de mapache",
+            "Silver Fox Hide": "Piel de zorro plateado",
+            "Faun Hide": "Piel de cervatillo",
+            "Woodboring Jewel Beatles": "Escarabajos joya barrenadores",
+            "Giraffe Vertebrae": "Vértebras de jirafa",
+            "Beaver Skull": "Cráneo de castor",
+            "Beaver Jaw": "Mandíbula de castor",
+            "Fox Skull": "Cráneo de zorro",
+            "Hip Bone": "Hueso de cadera",
+            "Raccoon Skull": "Cráneo de mapache",
+            "Deer Jaw": "Mandíbula de ciervo",
+            "Deer Bones": "Huesos de ciervo",
+            "Deer Antler": "Asta de ciervo",
+            "Fishbone Tail": "Cola de espina de pez",
+            "Burmese Python Vertebrae": "Vértebras de pitón birmana",
+            "Moose Tooth": "Diente de alce",
+            "Madagascar Hissing Cockroach": "Cucaracha silbadora de Madagascar",
+            "Beaver Teeth": "Dientes de castor",
+            "Iguana Head": "Cabeza de iguana",
+            "Iguana Foot": "Pata de iguana",
+            "Arrowheads": "Puntas de flecha",
+            "Clay Bowl": "Cuenco de barro",
+        },
+    },
+    "fr": {
+        "title": "The Insect Asylum Collection",
+        "subtitle": "Chasse aux Spécimens",
+        "instructions": (
+            "Explorez notre collection et cochez chaque spécimen fascinant que vous trouvez !\n"
+            "Les objets sont colorés par catégorie pour guider votre recherche."
+        ),
+        "footer_total": (
+            "Combien de spécimens trouverez-vous ? Notez votre total ici : ____ / {total}"
+        ),
+        "footer_social": (
+            "Partagez votre exploration avec nous sur les réseaux sociaux @TheInsectAsylum"
+        ),
+        "bingo_subtitle": "Bingo des Spécimens",
+        "bingo_instructions": (
+            "Trouvez un spécimen, puis cochez sa case. {size} alignées et c'est gagné !"
+        ),
+        "bingo_free": "LIBRE",
+        "bingo_card": "Carte {number}",
+        "call_sheet_subtitle": "Feuille d'Appel du Bingo",
+        "call_sheet_instructions": "Cochez chaque spécimen dès qu'il est appelé.",
+        "categories": {
+            "Minerals & Fossils": "Minéraux et Fossiles",
+            "Shells & Marine": "Coquillages et Vie Marine",
+            "Plant Materials": "Matières Végétales",
+            "Preserved Specimens": "Spécimens Naturalisés",
+            "Animal Parts": "Parties d'Animaux",
+            "Bones & Skulls": "Os et Crânes",
+            "Resin Replicas": "Répliques en Résine",
+            "Miscellaneous": "Divers",
+        },
+        "items": {
+            "Dinosaur Fossil": "Fossile de dinosaure",
+            "Blue Calcite": "Calcite bleue",
+            "Honey Calcite": "Calcite miel",
+            "Labradorite": "Labradorite",
+            "Spectralite": "Spectrolite",
+            "Red Ammonite": "Ammonite rouge",
+            "Purple Agate": "Agate violette",
+            "Hourglass Selenite": "Sélénite en sablier",
+            "Desert Rose Crystal": "Rose des sables",
+            "Wulfenite Crystal": "Cristal de wulfénite",
+            "Yellow Dog Conch Shell": "Conque chien jaune",
+            "Butter Clam Shell": "Coquille de palourde beurre",
+            "Brooch Clamshell": "Coquille de palourde broche",
+            "Conch Shell Eggs": "Œufs de conque",
+            "Horseshoe Crab": "Limule",
+            "Shark Jaw": "Mâchoire de requin",
+            "Sugar Pinecones": "Pommes de pin à sucre",
+            "Pine Cones": "Pommes de pin",
+            "Bottle Tree Seed Pods": "Gousses d'arbre bouteille",
+            "Moss": "Mousse",
+            "Okra Seed Pods": "Gousses de gombo",
+            "Driftwood": "Bois flotté",
+            "Duckling": "Caneton",
+            "Mummified Duckling": "Caneton momifié",
+            "Chipmunk": "Tamia",
+            "Opossum": "Opossum",
+            "Chameleon": "Caméléon",
+            "Snakeskin": "Peau de serpent",
+            "Chick": "Poussin",
+            "Weasel": "Belette",
+            "Fox Head": "Tête de renard",
+            "Chinese Water Dragon": "Dragon d'eau chinois",
+            "Fox Tails": "Queues de renard",
+            "Macaw Feathers": "Plumes d'ara",
+            "Goose Feathers": "Plumes d'oie",
+            "Turtle Shell": "Carapace de tortue",
+            "Bird's Nest": "Nid d'oiseau",
+            "Wasp Nest": "Nid de guêpes",
+            "Cobra Skin": "Peau de cobra",
+            "Butterfly And Moth Wings": "Ailes de papillons et de mites",
+            "Snake Shed": "Mue de serpent",
+            "Beaver Paw": "Patte de castor",
+            "Rabbit Pelt": "Peau de lapin",
+            "Coyote Tail": "Queue de coyote",
+            "Raccoon Pelt": "Peau de raton laveur",
+            "Bobcat Hyde": "Peau de lynx roux",
+            "Raccoon Tail": "Queue de raton laveur",
+            "Silver Fox Hide": "Peau de renard argenté",
+            "Faun Hide": "Peau de faon",
+            "Woodboring Jewel Beatles": "Buprestes xylophages",
+            "Giraffe Vertebrae": "Vertèbres de girafe",
+            "Beaver Skull": "Crâne de castor",
+            "Beaver Jaw": "Mâchoire de castor",
+            "Fox Skull": "Crâne de renard",
+            "Hip Bone": "Os de la hanche",
+            "Raccoon Skull": "Crâne de raton laveur",
+            "Deer Jaw": "Mâchoire de cerf",
+            "Deer Bones": "Os de cerf",
+            "Deer Antler": "Bois de cerf",
+            "Fishbone Tail": "Queue en arête de poisson",
+            "Burmese Python Vertebrae": "Vertèbres de python birman",
+            "Moose Tooth": "Dent d'élan",
+            "Madagascar Hissing Cockroach": "Blatte siffleuse de Madagascar",
+            "Beaver Teeth": "Dents de castor",
+            "Iguana Head": "Tête d'iguane",
+            "Iguana Foot": "Patte d'iguane",
+            "Arrowheads": "Pointes de flèche",
+            "Clay Bowl": "Bol en argile",
+        },
+    },
+    "zh": {
+        "title": "The Insect Asylum Collection",
+        "subtitle": "标本寻宝游戏",
+        # Sentences are split on whitespace when wrapping, so keep them separate
+        "instructions": (
+            "探索我们的收藏，找到每件奇妙的标本后请打勾！\n"
+            "物品按类别用颜色区分，帮助您寻找。"
+        ),
+        "footer_total": "你能找到多少件标本？在此记录总数：____ / {total}",
+        "footer_social": "在社交媒体上与我们分享你的探索之旅 @TheInsectAsylum",
+        "bingo_subtitle": "标本宾果",
+        "bingo_instructions": "找到标本后在格子里打勾，连成{size}格即获胜！",
+        "bingo_free": "免费",
+        "bingo_card": "卡片 {number}",
+        "call_sheet_subtitle": "宾果叫号单",
+        "call_sheet_instructions": "每叫到一个标本就打勾。",
+        "categories": {
+            "Minerals & Fossils": "矿物与化石",
+            "Shells & Marine": "贝壳与海洋生物",
+            "Plant Materials": "植物材料",
+            "Preserved Specimens": "保存标本",
+            "Animal Parts": "动物部件",
+            "Bones & Skulls": "骨骼与头骨",
+            "Resin Replicas": "树脂复制品",
+            "Miscellaneous": "其他",
+        },
+        "items": {
+            "Dinosaur Fossil": "恐龙化石",
+            "Blue Calcite": "蓝方解石",
+            "Honey Calcite": "蜜色方解石",
+            "Labradorite": "拉长石",
+            "Spectralite": "光谱石",
+            "Red Ammonite": "红色菊石",
+            "Purple Agate": "紫玛瑙",
+            "Hourglass Selenite": "沙漏透石膏",
+            "Desert Rose Crystal": "沙漠玫瑰石",
+            "Wulfenite Crystal": "钼铅矿晶体",
+            "Yellow Dog Conch Shell": "黄犬凤螺壳",
+            "Butter Clam Shell": "奶油蛤壳",
+            "Brooch Clamshell": "胸针蛤壳",
+            "Conch Shell Eggs": "海螺卵",
+            "Horseshoe Crab": "鲎",
+            "Shark Jaw": "鲨鱼颌骨",
+            "Sugar Pinecones": "糖松松果",
+            "Pine Cones": "松果",
+            "Bottle Tree Seed Pods": "瓶子树种荚",
+            "Moss": "苔藓",
+            "Okra Seed Pods": "秋葵种荚",
+            "Driftwood": "浮木",
+            "Duckling": "小鸭",
+            "Mummified Duckling": "木乃伊小鸭",
+            "Chipmunk": "花栗鼠",
+            "Opossum": "负鼠",
+            "Chameleon": "变色龙",
+            "Snakeskin": "蛇皮",
+            "Chick": "小鸡",
+            "Weasel": "黄鼠狼",
+            "Fox Head": "狐狸头",
+            "Chinese Water Dragon": "中国水龙",
+            "Fox Tails": "狐狸尾巴",
+            "Macaw Feathers": "金刚鹦鹉羽毛",
+            "Goose Feathers": "鹅毛",
+            "Turtle Shell": "龟壳",
+            "Bird's Nest": "鸟巢",
+            "Wasp Nest": "马蜂窝",
+            "Cobra Skin": "眼镜蛇皮",
+            "Butterfly And Moth Wings": "蝴蝶和飞蛾翅膀",
+            "Snake Shed": "蛇蜕",
+            "Beaver Paw": "河狸爪",
+            "Rabbit Pelt": "兔皮",
+            "Coyote Tail": "郊狼尾巴",
+            "Raccoon Pelt": "浣熊皮",
+            "Bobcat Hyde": "短尾猫皮",
+            "Raccoon Tail": "浣熊尾巴",
+            "Silver Fox Hide": "银狐皮",
+            "Faun Hide": "小鹿皮",
+            "Woodboring Jewel Beatles": "蛀木吉丁虫",
+            "Giraffe Vertebrae": "长颈鹿椎骨",
+            "Beaver Skull": "河狸头骨",
+            "Beaver Jaw": "河狸颌骨",
+            "Fox Skull": "狐狸头骨",
+            "Hip Bone": "髋骨",
+            "Raccoon Skull": "浣熊头骨",
+            "Deer Jaw": "鹿颌骨",
+            "Deer Bones": "鹿骨",
+            "Deer Antler": "鹿角",
+            "Fishbone Tail": "鱼骨尾",
+            "Burmese Python Vertebrae": "缅甸蟒椎骨",
+            "Moose Tooth": "驼鹿牙齿",
+            "Madagascar Hissing Cockroach": "马达加斯加发声蟑螂",
+            "Beaver Teeth": "河狸牙齿",
+            "Iguana Head": "鬣蜥头",
+            "Iguana Foot": "鬣蜥脚",
+            "Arrowheads": "箭头",
+            "Clay Bowl": "陶碗",
+        },
+    },
+}
+
+
+def get_text(key, language="en"):
+    """Get a translated header or footer string, with English as fallback."""
+    table = TRANSLATIONS.get(language, TRANSLATIONS["en"])
+    return table.get(key, TRANSLATIONS["en"][key])
+
+
+def translate_category(category, language="en"):
+    """Get the display name of a category in a language."""
+    return TRANSLATIONS.get(language, {}).get("categories", {}).get(category, category)
+
+
+def translate_item(item, language="en"):
+    """Get the display name of an item in a language."""
+    return TRANSLATIONS.get(language, {}).get("items", {}).get(item, item)